@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Benchmark of columnar detection readers against the CSV detection reader
+
+Writes detections, in time order with a number of detections at each time, to CSV, Parquet and
+Arrow IPC files in a temporary directory, and times reading all detections with each reader.
+Requires the optional dependency `pyarrow`.
+
+Usage: ``python benchmarks/columnar_readers.py [--rows N] [--per-time N] [--metadata N]``
+"""
+import argparse
+import datetime
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from stonesoup.reader.columnar import (
+    ColumnarCSVDetectionReader, ParquetDetectionReader, ArrowDetectionReader)
+from stonesoup.reader.generic import CSVDetectionReader
+
+
+def generate_table(num_rows, per_time, num_metadata, seed=1):
+    random_state = np.random.RandomState(seed)
+    start = datetime.datetime(2020, 1, 1)
+    columns = {
+        't': pa.array(
+            [(start + datetime.timedelta(seconds=int(seconds))).isoformat()
+             for seconds in np.arange(num_rows) // per_time]),
+        'x': random_state.randn(num_rows),
+        'y': random_state.randn(num_rows),
+    }
+    for index in range(num_metadata):
+        columns[f'meta{index}'] = pa.array(random_state.randint(0, 1000, num_rows).astype(str))
+    return pa.table(columns)
+
+
+def main(num_rows, per_time, num_metadata):
+    table = generate_table(num_rows, per_time, num_metadata)
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        pacsv.write_csv(table, directory / 'detections.csv')
+        pq.write_table(table, directory / 'detections.parquet')
+        with pa.ipc.new_file(directory / 'detections.arrow', table.schema) as writer:
+            writer.write_table(table, max_chunksize=2**16)
+
+        readers = [
+            (CSVDetectionReader, 'detections.csv'),
+            (ColumnarCSVDetectionReader, 'detections.csv'),
+            (ParquetDetectionReader, 'detections.parquet'),
+            (ArrowDetectionReader, 'detections.arrow'),
+        ]
+        print(f"{num_rows:,} detections, {per_time} per time, {num_metadata} metadata fields")
+        print(f"{'Reader':<30}{'Time (s)':>10}{'Rows/s':>12}")
+        for reader_class, filename in readers:
+            reader = reader_class(directory / filename, ['x', 'y'], 't')
+            start = time.perf_counter()
+            count = sum(len(detections) for _, detections in reader)
+            duration = time.perf_counter() - start
+            assert count == num_rows
+            print(f"{reader_class.__name__:<30}{duration:>10.2f}{num_rows/duration:>12,.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000,
+                        help="Number of detections. Default 200000.")
+    parser.add_argument('--per-time', type=int, default=50,
+                        help="Number of detections at each time. Default 50.")
+    parser.add_argument('--metadata', type=int, default=2,
+                        help="Number of metadata fields. Default 2.")
+    args = parser.parse_args()
+    main(args.rows, args.per_time, args.metadata)
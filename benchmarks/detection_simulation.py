@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Benchmark of sequential against vectorised detection simulation
+
+Simulates ground truth of a number of targets once, and times simulating detections (with
+clutter) of the recorded ground truth with :class:`~.SimpleDetectionSimulator`, with and without
+`vectorised` enabled.
+
+Usage: ``python benchmarks/detection_simulation.py [--targets N] [--steps N] [--clutter N]``
+"""
+import argparse
+import datetime
+import time
+
+import numpy as np
+
+from stonesoup.base import Property
+from stonesoup.buffered_generator import BufferedGenerator
+from stonesoup.models.measurement.linear import LinearGaussian
+from stonesoup.models.transition.linear import (
+    CombinedLinearGaussianTransitionModel, ConstantVelocity)
+from stonesoup.reader import GroundTruthReader
+from stonesoup.simulator.simple import SimpleDetectionSimulator
+from stonesoup.types.groundtruth import GroundTruthPath, GroundTruthState
+
+
+class RecordedGroundTruth(GroundTruthReader):
+    """Replay of recorded ground truth time steps"""
+    time_steps: list = Property(doc="List of time and set of ground truth paths")
+
+    @BufferedGenerator.generator_method
+    def groundtruth_paths_gen(self):
+        yield from self.time_steps
+
+
+def generate_groundtruth(num_targets, num_steps, seed=1):
+    random_state = np.random.RandomState(seed)
+    transition_model = CombinedLinearGaussianTransitionModel(
+        [ConstantVelocity(0.05), ConstantVelocity(0.05)])
+    start = datetime.datetime(2020, 1, 1)
+    timestep = datetime.timedelta(seconds=1)
+    paths = set()
+    for _ in range(num_targets):
+        state_vector = random_state.randn(4, 1) * [[1000], [10], [1000], [10]]
+        path = GroundTruthPath([GroundTruthState(state_vector, timestamp=start)])
+        paths.add(path)
+    time_steps = [(start, set(paths))]
+    for step in range(1, num_steps):
+        for path in paths:
+            path.append(GroundTruthState(
+                transition_model.function(path[-1], noise=True, time_interval=timestep),
+                timestamp=start + step * timestep))
+        time_steps.append((start + step * timestep, set(paths)))
+    return time_steps
+
+
+def main(num_targets, num_steps, clutter_rate):
+    time_steps = generate_groundtruth(num_targets, num_steps)
+    measurement_model = LinearGaussian(4, [0, 2], np.diag([25, 25]))
+    meas_range = np.array([[-1, 1], [-1, 1]]) * 5000
+
+    print(f"{num_targets} targets, {num_steps} steps, clutter rate {clutter_rate}")
+    print(f"{'Simulation':<15}{'Time (s)':>10}{'Detections':>12}")
+    for vectorised in (False, True):
+        simulator = SimpleDetectionSimulator(
+            RecordedGroundTruth(time_steps), measurement_model, meas_range,
+            clutter_rate=clutter_rate, seed=1, vectorised=vectorised)
+        start = time.perf_counter()
+        count = sum(len(detections) for _, detections in simulator)
+        duration = time.perf_counter() - start
+        name = 'Vectorised' if vectorised else 'Sequential'
+        print(f"{name:<15}{duration:>10.2f}{count:>12,}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--targets', type=int, default=200,
+                        help="Number of targets. Default 200.")
+    parser.add_argument('--steps', type=int, default=50,
+                        help="Number of time steps. Default 50.")
+    parser.add_argument('--clutter', type=float, default=100,
+                        help="Clutter rate per time step. Default 100.")
+    args = parser.parse_args()
+    main(args.targets, args.steps, args.clutter)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""Benchmark of creation rate of common Stone Soup types
+
+Measures how many objects per second can be created for types commonly created within the
+tracking loop, e.g. states, predictions, updates, detections and hypotheses.
+
+Usage: ``python benchmarks/object_creation.py [--number N]``
+"""
+import argparse
+import datetime
+import timeit
+
+import numpy as np
+
+from stonesoup.types.array import StateVector, CovarianceMatrix
+from stonesoup.types.detection import Detection
+from stonesoup.types.hypothesis import SingleHypothesis
+from stonesoup.types.prediction import GaussianStatePrediction, GaussianMeasurementPrediction
+from stonesoup.types.state import State, GaussianState
+from stonesoup.types.update import GaussianStateUpdate
+
+
+def main(number):
+    timestamp = datetime.datetime.now()
+    state_vector = StateVector(np.zeros((4, 1)))
+    covar = CovarianceMatrix(np.eye(4))
+    prediction = GaussianStatePrediction(state_vector, covar, timestamp)
+    detection = Detection(StateVector(np.zeros((2, 1))), timestamp)
+    measurement_prediction = GaussianMeasurementPrediction(
+        StateVector(np.zeros((2, 1))), CovarianceMatrix(np.eye(2)), timestamp)
+    hypothesis = SingleHypothesis(prediction, detection, measurement_prediction)
+
+    statements = {
+        'State': lambda: State(state_vector, timestamp),
+        'GaussianState': lambda: GaussianState(state_vector, covar, timestamp),
+        'GaussianStatePrediction': lambda: GaussianStatePrediction(
+            state_vector, covar, timestamp),
+        'GaussianStateUpdate': lambda: GaussianStateUpdate(
+            state_vector, covar, hypothesis, timestamp=timestamp),
+        'Detection': lambda: Detection(state_vector, timestamp),
+        'SingleHypothesis': lambda: SingleHypothesis(
+            prediction, detection, measurement_prediction),
+    }
+
+    print(f"{'Type':<28}{'Objects per second':>20}")
+    for name, statement in statements.items():
+        duration = min(timeit.repeat(statement, number=number, repeat=5))
+        print(f"{name:<28}{number/duration:>20,.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000,
+                        help="Number of objects created per timing. Default 20000.")
+    main(parser.parse_args().number)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Benchmark of radar sensor measurement with many radars
+
+Times measuring a number of targets with a number of stationary :class:`~.RadarBearingRange`
+sensors over a number of time steps, against an equivalent of measuring each truth in turn with
+a new measurement model created for each call (as per previous implementation).
+
+Usage: ``python benchmarks/radar_measurement.py [--radars N] [--targets N] [--steps N]``
+"""
+import argparse
+import datetime
+import time
+
+import numpy as np
+
+from stonesoup.models.measurement.nonlinear import CartesianToBearingRange
+from stonesoup.sensor.radar import RadarBearingRange
+from stonesoup.types.array import StateVector
+from stonesoup.types.detection import TrueDetection
+from stonesoup.types.groundtruth import GroundTruthState
+
+
+def measure_each(radar, ground_truths):
+    measurement_model = CartesianToBearingRange(
+        ndim_state=radar.ndim_state,
+        mapping=radar.position_mapping,
+        noise_covar=radar.noise_covar,
+        translation_offset=radar.position,
+        rotation_offset=radar.orientation)
+    return {TrueDetection(measurement_model.function(truth, noise=True),
+                          measurement_model=measurement_model,
+                          timestamp=truth.timestamp,
+                          groundtruth_path=truth)
+            for truth in ground_truths}
+
+
+def main(num_radars, num_targets, num_steps, seed=1):
+    random_state = np.random.RandomState(seed)
+    radars = [
+        RadarBearingRange(
+            ndim_state=4, position_mapping=(0, 2), noise_covar=np.diag([0.001, 25]),
+            position=StateVector([*random_state.uniform(-5000, 5000, 2), 0]))
+        for _ in range(num_radars)]
+    start = datetime.datetime(2020, 1, 1)
+    time_steps = [
+        {GroundTruthState(random_state.uniform(-5000, 5000, (4, 1)),
+                          timestamp=start + datetime.timedelta(seconds=step))
+         for _ in range(num_targets)}
+        for step in range(num_steps)]
+
+    print(f"{num_radars} radars, {num_targets} targets, {num_steps} steps")
+    print(f"{'Measurement':<15}{'Time (s)':>10}{'Detections':>12}")
+    for name, measure in (('Per truth', measure_each),
+                          ('Vectorised', RadarBearingRange.measure)):
+        start_time = time.perf_counter()
+        count = sum(len(measure(radar, truths)) for truths in time_steps for radar in radars)
+        duration = time.perf_counter() - start_time
+        print(f"{name:<15}{duration:>10.2f}{count:>12,}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--radars', type=int, default=200,
+                        help="Number of radars. Default 200.")
+    parser.add_argument('--targets', type=int, default=50,
+                        help="Number of targets. Default 50.")
+    parser.add_argument('--steps', type=int, default=10,
+                        help="Number of time steps. Default 10.")
+    args = parser.parse_args()
+    main(args.radars, args.targets, args.steps)
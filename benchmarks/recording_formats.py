@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark of writing and replaying tracks in YAML and binary recording formats
+
+Generates tracks of Gaussian states, each updated at every time step, and times writing with
+:class:`~.YAMLWriter` (in full and delta mode, and with compact arrays) and
+:class:`~.BinaryWriter`, reading back all time steps, and reading records for a time range from
+the middle of the binary recording. File sizes are also reported.
+
+Usage: ``python benchmarks/recording_formats.py [--tracks N] [--timestamps N] [--no-yaml]``
+"""
+import argparse
+import datetime
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from stonesoup.base import Property
+from stonesoup.reader.binary import BinaryReader, BinaryTrackReader
+from stonesoup.reader.yaml import YAMLTrackReader
+from stonesoup.tracker import Tracker
+from stonesoup.types.state import GaussianState
+from stonesoup.types.track import Track
+from stonesoup.writer.binary import BinaryWriter
+from stonesoup.writer.yaml import YAMLWriter
+
+
+class GeneratedTracker(Tracker):
+    num_tracks: int = Property()
+    num_timestamps: int = Property()
+    seed: int = Property(default=1)
+
+    @property
+    def tracks(self):
+        return self._tracks
+
+    def __iter__(self):
+        self._random_state = np.random.RandomState(self.seed)
+        self._tracks = {Track(id=str(n)) for n in range(self.num_tracks)}
+        self._times = iter(
+            datetime.datetime(2020, 1, 1) + datetime.timedelta(seconds=n)
+            for n in range(self.num_timestamps))
+        return self
+
+    def __next__(self):
+        timestamp = next(self._times)
+        for track in self._tracks:
+            track.append(GaussianState(
+                self._random_state.randn(4, 1), np.diag(self._random_state.rand(4)), timestamp))
+        return timestamp, self._tracks
+
+
+def size(path):
+    if path.is_dir():
+        return sum(file.stat().st_size for file in path.iterdir())
+    return path.stat().st_size
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(num_tracks, num_timestamps, yaml):
+    print(f"{num_tracks} tracks, {num_timestamps} timestamps")
+    print(f"{'Format':<14}{'Write (s)':>12}{'Read (s)':>12}{'Size (MB)':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        formats = [('Binary', BinaryWriter, BinaryTrackReader, directory / 'tracks')]
+        if yaml:
+            formats.append(('YAML', YAMLWriter, YAMLTrackReader, directory / 'tracks.yaml'))
+            formats.append(('YAML delta', partial(YAMLWriter, delta=True),
+                            partial(YAMLTrackReader, delta=True), directory / 'delta.yaml'))
+            formats.append(('YAML compact', partial(YAMLWriter, delta=True, compact_arrays=True),
+                            partial(YAMLTrackReader, delta=True), directory / 'compact.yaml'))
+        for name, writer_class, reader_class, path in formats:
+            tracker = GeneratedTracker(num_tracks, num_timestamps)
+
+            def write():
+                with writer_class(path, tracks_source=tracker) as writer:
+                    writer.write()
+            write_duration, _ = timed(write)
+            read_duration, _ = timed(lambda: sum(1 for _ in reader_class(path)))
+            print(f"{name:<14}{write_duration:>12.2f}{read_duration:>12.2f}"
+                  f"{size(path) / 1E6:>12.2f}")
+
+        recording = BinaryReader(directory / 'tracks')
+        index = recording.index('tracks')
+        middle = index['time'][len(index)//2].astype(datetime.datetime)
+        duration, records = timed(lambda: np.array(recording.records(
+            'tracks', middle, middle + datetime.timedelta(seconds=9))))
+        print(f"Binary time range of {len(records)} records: {duration*1E3:.2f}ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tracks', type=int, default=20,
+                        help="Number of tracks. Default 20.")
+    parser.add_argument('--timestamps', type=int, default=30,
+                        help="Number of timestamps. Default 30.")
+    parser.add_argument('--no-yaml', action='store_false', dest='yaml',
+                        help="Don't time YAML, which is slow for many tracks or timestamps.")
+    args = parser.parse_args()
+    main(args.tracks, args.timestamps, args.yaml)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Benchmark of particle resamplers
+
+Times each particle resampler on the same set of particles, with weights drawn such that they are
+degenerate (as after an update with an informative measurement), both storing and not storing
+parent particles. Also reports the number of unique particles selected, and the mean squared error
+between the number of times each particle is selected and its expected number, as a measure of
+the variance introduced by the resampler.
+
+Usage: ``python benchmarks/resamplers.py [--particles N] [--ndim N] [--repeat N]``
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from stonesoup.resampler.particle import (
+    SystematicResampler, StratifiedResampler, MultinomialResampler, ResidualResampler,
+    MetropolisResampler)
+from stonesoup.types.particle import Particles
+
+
+def main(num_particles, ndim, repeat):
+    random_state = np.random.RandomState(1)
+    log_weight = -0.5 * random_state.chisquare(ndim, num_particles) * 4
+    # First dimension is particle index, so selected particles can be identified
+    state_vector = random_state.randn(ndim, num_particles)
+    state_vector[0] = np.arange(num_particles)
+    particles = Particles(state_vector=state_vector, log_weight=log_weight)
+    expected_counts = num_particles * np.exp(log_weight - np.logaddexp.reduce(log_weight))
+    print(f"{num_particles:,} particles of {ndim} dimensions, "
+          f"ESS {np.sum(expected_counts)**2 / np.sum(expected_counts**2):,.0f}")
+
+    resampler_classes = [SystematicResampler, StratifiedResampler, MultinomialResampler,
+                         ResidualResampler, MetropolisResampler]
+    print(f"{'Resampler':<24}{'Parent (s)':>12}{'No parent (s)':>15}{'Unique':>10}{'MSE':>8}")
+    for resampler_class in resampler_classes:
+        durations = []
+        for store_parent in (True, False):
+            resampler = resampler_class(store_parent=store_parent, seed=1)
+            durations.append(min(timeit.repeat(
+                lambda: resampler.resample(particles), number=1, repeat=repeat)))
+
+        new_particles = resampler_class(store_parent=False, seed=1).resample(particles)
+        counts = np.bincount(np.asarray(new_particles.state_vector[0], dtype=int).ravel(),
+                             minlength=num_particles)
+        mse = np.mean((counts - expected_counts)**2)
+        print(f"{resampler_class.__name__:<24}{durations[0]:>12.3f}{durations[1]:>15.3f}"
+              f"{np.count_nonzero(counts):>10,}{mse:>8.3f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--particles', type=int, default=1000000,
+                        help="Number of particles. Default 1000000.")
+    parser.add_argument('--ndim', type=int, default=4,
+                        help="Number of state dimensions. Default 4.")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timings, of which the minimum is reported. Default 3.")
+    args = parser.parse_args()
+    main(args.particles, args.ndim, args.repeat)
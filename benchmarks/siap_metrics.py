@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Benchmark of SIAP metric computation over many truths and timestamps
+
+Generates truths which each exist for a portion of the timestamps, with a track associated to
+each truth, and times computation of SIAP and ID-SIAP metrics in single pass mode. Computation
+searching data at each timestamp is far slower for this number of timestamps, so is only timed
+(on the same data) when requested.
+
+Usage: ``python benchmarks/siap_metrics.py [--truths N] [--timestamps N] [--lifetime N]
+[--per-timestamp]``
+"""
+import argparse
+import datetime
+import time
+
+import numpy as np
+
+from stonesoup.measures import Euclidean
+from stonesoup.metricgenerator.manager import SimpleManager
+from stonesoup.metricgenerator.tracktotruthmetrics import IDSIAPMetrics
+from stonesoup.types.association import AssociationSet, TimeRangeAssociation
+from stonesoup.types.groundtruth import GroundTruthPath, GroundTruthState
+from stonesoup.types.state import State
+from stonesoup.types.time import TimeRange
+from stonesoup.types.track import Track
+
+
+def generate_manager(num_truths, num_timestamps, lifetime, seed=1):
+    random_state = np.random.RandomState(seed)
+    start = datetime.datetime(2020, 1, 1)
+    timestamps = [start + datetime.timedelta(seconds=i) for i in range(num_timestamps)]
+
+    truths, tracks, associations = set(), set(), set()
+    for start_index in random_state.randint(0, num_timestamps - lifetime, num_truths):
+        truth_timestamps = timestamps[start_index:start_index + lifetime]
+        state_vectors = np.cumsum(random_state.randn(lifetime, 4), axis=0)
+        truth = GroundTruthPath(
+            [GroundTruthState(state_vector, timestamp, metadata={'id': start_index})
+             for state_vector, timestamp in zip(state_vectors, truth_timestamps)])
+        track = Track(
+            [State(state_vector + random_state.randn(4), timestamp)
+             for state_vector, timestamp in zip(state_vectors, truth_timestamps)])
+        truths.add(truth)
+        tracks.add(track)
+        # Associated for middle half of lifetime
+        associations.add(TimeRangeAssociation(
+            {truth, track},
+            TimeRange(truth_timestamps[lifetime//4], truth_timestamps[3*lifetime//4])))
+
+    manager = SimpleManager()
+    manager.add_data(truths, tracks)
+    manager.association_set = AssociationSet(associations)
+    return manager
+
+
+def main(num_truths, num_timestamps, lifetime, per_timestamp):
+    manager = generate_manager(num_truths, num_timestamps, lifetime)
+    print(f"{num_truths} truths and tracks, {num_timestamps} timestamps, "
+          f"{num_truths*lifetime} truth states")
+
+    modes = [True, False] if per_timestamp else [True]
+    for single_pass in modes:
+        generator = IDSIAPMetrics(
+            position_measure=Euclidean((0, 2)), velocity_measure=Euclidean((1, 3)),
+            truth_id='id', track_id='id', single_pass=single_pass)
+        start = time.perf_counter()
+        generator.compute_metric(manager)
+        duration = time.perf_counter() - start
+        print(f"{'Single pass' if single_pass else 'Per timestamp':<16}{duration:>10.2f}s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--truths', type=int, default=1000,
+                        help="Number of truths. Default 1000.")
+    parser.add_argument('--timestamps', type=int, default=10000,
+                        help="Number of timestamps. Default 10000.")
+    parser.add_argument('--lifetime', type=int, default=100,
+                        help="Number of timestamps each truth exists for. Default 100.")
+    parser.add_argument('--per-timestamp', action='store_true',
+                        help="Also time computation searching data at each timestamp.")
+    args = parser.parse_args()
+    main(args.truths, args.timestamps, args.lifetime, args.per_timestamp)
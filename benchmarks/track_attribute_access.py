@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+"""Microbenchmark of attribute access on :class:`~.Track`
+
+Measures throughput of attributes accessed directly on a track (e.g. :attr:`~.Track.states`),
+and those proxied to the track's latest state (e.g. :attr:`~.State.state_vector`), compared
+with accessing the same attributes on the state itself.
+
+Usage: ``python benchmarks/track_attribute_access.py [--number N]``
+"""
+import argparse
+import datetime
+import timeit
+
+import numpy as np
+
+from stonesoup.types.state import GaussianState
+from stonesoup.types.track import Track
+
+
+def main(number):
+    state = GaussianState(np.zeros((4, 1)), np.eye(4), datetime.datetime.now())
+    track = Track([state])
+
+    print(f"{'Access':<24}{'Accesses per second':>20}")
+    for stmt in ('state.state_vector', 'state.covar', 'state.timestamp',
+                 'track.states', 'track.state', 'track.metadata',
+                 'track.state_vector', 'track.covar', 'track.timestamp', 'track.ndim'):
+        duration = min(timeit.repeat(
+            stmt, number=number, repeat=5, globals={'state': state, 'track': track}))
+        print(f"{stmt:<24}{number/duration:>20,.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000,
+                        help="Number of accesses per timing. Default 200000.")
+    main(parser.parse_args().number)
@@ -35,6 +35,7 @@ setup(name='stonesoup',
               'Sphinx', 'sphinx_rtd_theme', 'sphinx-gallery>=0.8', 'pillow', 'folium',
           ],
           'video': ['ffmpeg-python', 'moviepy'],
+          'arrow': ['pyarrow'],
           'tensorflow': ['tensorflow>=2.2.0'],
           'tensornets': ['tensorflow>=2.2.0', 'tensornets'],
       },
@@ -228,6 +228,7 @@ class BaseMeta(ABCMeta):
     """
 
     _repr = BaseRepr()
+    _registry = {}
 
     def __new__(mcls, name, bases, namespace):
         if '__init__' not in namespace:
@@ -240,6 +241,7 @@ class BaseMeta(ABCMeta):
         cls = super().__new__(mcls, name, bases, namespace)
 
         cls._subclasses = set()
+        BaseMeta._add_to_registry(cls)
         cls._properties = OrderedDict()
         # Update subclass lists, and update properties from direct bases (in reverse order as
         # first defined class must take precedence, and dictionary update overwrites)
@@ -287,6 +289,7 @@ class BaseMeta(ABCMeta):
 
         cls._validate_init()
         cls._generate_signature()
+        cls._generate_init_binder()
 
         return cls
 
@@ -340,8 +343,66 @@ class BaseMeta(ABCMeta):
         cls.__init__.__signature__ = init_signature.replace(
             parameters=parameters)
 
+    def _generate_init_binder(cls):
+        """Generates function binding init arguments to parameters, based on init signature.
+
+        This is used by :meth:`Base.__init__` in place of binding the arguments with
+        :meth:`inspect.Signature.bind`, which is relatively slow. Function returns tuple of
+        values for each parameter, in signature order, with defaults applied.
+        """
+        parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+        namespace = {}
+        arguments = []
+        keyword_arguments = []
+        for parameter in parameters:
+            if parameter.default is parameter.empty:
+                argument = parameter.name
+            else:
+                namespace[f'_default_{parameter.name}'] = parameter.default
+                argument = f'{parameter.name}=_default_{parameter.name}'
+            if parameter.kind == parameter.KEYWORD_ONLY:
+                keyword_arguments.append(argument)
+            else:
+                arguments.append(argument)
+        if keyword_arguments:
+            arguments.append('*')
+            arguments.extend(keyword_arguments)
+        names = [parameter.name for parameter in parameters]
+        source = (f"def _init_binder({', '.join(arguments)}):\n"
+                  f"    return ({''.join(f'{name}, ' for name in names)})\n")
+        exec(source, namespace)
+        cls._init_parameter_names = tuple(names)
+        cls._init_binder = staticmethod(namespace['_init_binder'])
+        cls._init_binder_signature = cls.__init__.__signature__
+
+    @staticmethod
+    def _add_to_registry(cls):
+        classes = BaseMeta._registry.setdefault(f"{cls.__module__}.{cls.__qualname__}", [])
+        if cls not in classes:
+            classes.append(cls)
+
+    @staticmethod
+    def classes_by_name(name):
+        """Classes registered with a fully qualified name
+
+        The registry is updated as each class is created (or registered as a virtual subclass),
+        allowing classes to be found by name without searching all :attr:`subclasses`.
+
+        Parameters
+        ----------
+        name : str
+            Fully qualified class name (module and qualified name, separated by ``.``)
+
+        Returns
+        -------
+        : tuple of type
+            Classes, in order of creation. Typically only one, unless a class is redefined.
+        """
+        return tuple(BaseMeta._registry.get(name, ()))
+
     def register(cls, subclass):
         cls._subclasses.add(subclass)
+        BaseMeta._add_to_registry(subclass)
         return super().register(subclass)
 
     @property
@@ -367,10 +428,17 @@ class Base(metaclass=BaseMeta):
     declared."""
 
     def __init__(self, *args, **kwargs):
-        init_signature = inspect.signature(self.__init__)
-        bound_arguments = init_signature.bind(*args, **kwargs)
-        bound_arguments.apply_defaults()
-        for name, value in bound_arguments.arguments.items():
+        cls = type(self)
+        if cls._init_binder_signature is not getattr(cls.__init__, '__signature__', None):
+            # Signature changed since class created, so regenerate
+            cls._generate_init_binder()
+        try:
+            values = cls._init_binder(*args, **kwargs)
+        except TypeError:
+            # Bind with signature to raise same error as previously
+            inspect.signature(self.__init__).bind(*args, **kwargs)
+            raise
+        for name, value in zip(cls._init_parameter_names, values):
             setattr(self, name, value)
 
     def __repr__(self):
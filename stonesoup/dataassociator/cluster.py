@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import copy
+from concurrent.futures import Executor
+
+from .base import DataAssociator
+from ..base import Property
+from ..hypothesiser import Hypothesiser
+from ..types.multihypothesis import MultipleHypothesis
+
+
+def cluster_tracks(hypotheses):
+    """Split tracks into clusters, where tracks in different clusters share no detections in
+    their hypotheses.
+
+    This forms the connected components of the graph of tracks and the (gated) detections in
+    their hypotheses.
+
+    Parameters
+    ----------
+    hypotheses : mapping of :class:`~.Track` : sequence of :class:`~.Hypothesis`
+        Hypotheses for each track
+
+    Returns
+    -------
+    : list of list of :class:`~.Track`
+        Clusters of tracks
+    """
+    # Union-find over tracks, linked via shared detections
+    parents = {track: track for track in hypotheses}
+
+    def find(track):
+        while parents[track] is not track:
+            parents[track] = parents[parents[track]]
+            track = parents[track]
+        return track
+
+    detection_tracks = dict()
+    for track, track_hypotheses in hypotheses.items():
+        for hypothesis in track_hypotheses:
+            if not hypothesis:
+                continue
+            other_track = detection_tracks.setdefault(hypothesis.measurement, track)
+            parents[find(track)] = find(other_track)
+
+    clusters = dict()
+    for track in hypotheses:
+        clusters.setdefault(find(track), []).append(track)
+    return list(clusters.values())
+
+
+class _ClusterHypothesiser(Hypothesiser):
+    """Hypothesiser which returns hypotheses already generated for a cluster of tracks"""
+
+    hypotheses: dict = Property(doc="Hypotheses for each track in the cluster")
+
+    def hypothesise(self, track, detections, timestamp, **kwargs):
+        return self.hypotheses[track]
+
+
+def _associate_cluster(associator, tracks, hypotheses, timestamp, kwargs):
+    associator = copy.copy(associator)
+    associator.hypothesiser = _ClusterHypothesiser(
+        {track: hypotheses[track] for track in tracks})
+    detections = {hypothesis.measurement
+                  for track in tracks for hypothesis in hypotheses[track] if hypothesis}
+    associations = associator.associate(set(tracks), detections, timestamp, **kwargs)
+    # Returned in order of tracks, and as indices into each track's hypotheses, as tracks,
+    # detections and predictions may be copies if run in another process
+    return [_hypothesis_indices(associations.get(track), hypotheses[track])
+            for track in tracks]
+
+
+def _hypothesis_indices(association, track_hypotheses):
+    if association is None:
+        return None
+    indices = {id(hypothesis.measurement): index
+               for index, hypothesis in enumerate(track_hypotheses)}
+    # Associators may create a new missed detection, so map to the existing one
+    missed_index = next(
+        (index for index, hypothesis in enumerate(track_hypotheses) if not hypothesis), None)
+
+    def hypothesis_index(hypothesis):
+        index = indices.get(id(hypothesis.measurement))
+        if index is None:
+            if hypothesis or missed_index is None:
+                raise ValueError(
+                    "Associator returned a hypothesis which doesn't match any of the track's "
+                    "hypotheses from the hypothesiser")
+            index = missed_index
+        # Only new hypotheses (e.g. with updated probabilities) need to be returned
+        if hypothesis is track_hypotheses[index]:
+            return None, index
+        return hypothesis, index
+
+    if isinstance(association, MultipleHypothesis):
+        return association, [hypothesis_index(hypothesis) for hypothesis in association]
+    return hypothesis_index(association)
+
+
+def _restore_hypothesis(hypothesis_index, track_hypotheses):
+    hypothesis, index = hypothesis_index
+    original_hypothesis = track_hypotheses[index]
+    if hypothesis is None:
+        return original_hypothesis
+    hypothesis = copy.copy(hypothesis)
+    hypothesis.prediction = original_hypothesis.prediction
+    if hypothesis:
+        hypothesis.measurement = original_hypothesis.measurement
+    hypothesis.measurement_prediction = original_hypothesis.measurement_prediction
+    return hypothesis
+
+
+def _restore_association(result, track_hypotheses):
+    association, indices = result
+    if isinstance(association, MultipleHypothesis):
+        association = copy.copy(association)
+        association.single_hypotheses = [
+            _restore_hypothesis(hypothesis_index, track_hypotheses)
+            for hypothesis_index in indices]
+        return association
+    return _restore_hypothesis(result, track_hypotheses)
+
+
+class ClusteringAssociator(DataAssociator):
+    """Clustering Associator
+
+    Splits the association problem into independent clusters of tracks, and runs a wrapped
+    :attr:`associator` on each of them. Clusters are the connected components of the graph
+    formed by tracks and the detections in their hypotheses, such that tracks in different
+    clusters share no detections. As such, the :attr:`hypothesiser` should include gating (e.g.
+    :class:`~.DistanceGater`) for this to be effective.
+
+    Hypotheses are generated once for all tracks, and then passed to the wrapped associator for
+    each cluster in turn, or in parallel if an :attr:`executor` is provided.
+    """
+
+    associator: DataAssociator = Property(
+        doc="Associator to run on each cluster of tracks. The hypothesiser of this associator "
+            "is used to generate hypotheses, unless :attr:`hypothesiser` is set.")
+    hypothesiser: Hypothesiser = Property(
+        default=None,
+        doc="Generate a set of hypotheses for each prediction-detection pair. Default `None`, "
+            "where the :attr:`associator` hypothesiser is used.")
+    executor: Executor = Property(
+        default=None,
+        doc="Executor (e.g. :class:`~concurrent.futures.ThreadPoolExecutor` or "
+            ":class:`~concurrent.futures.ProcessPoolExecutor`) used to associate clusters in "
+            "parallel. Default `None`, where clusters are associated sequentially.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.hypothesiser is None:
+            self.hypothesiser = self.associator.hypothesiser
+
+    def associate(self, tracks, detections, timestamp, **kwargs):
+
+        # Generate a set of hypotheses for each track on each detection
+        hypotheses = self.generate_hypotheses(tracks, detections, timestamp, **kwargs)
+
+        clusters = cluster_tracks(hypotheses)
+        if self.executor is None:
+            results = [
+                _associate_cluster(self.associator, cluster, hypotheses, timestamp, kwargs)
+                for cluster in clusters]
+        else:
+            futures = [
+                self.executor.submit(
+                    _associate_cluster, self.associator, cluster,
+                    {track: hypotheses[track] for track in cluster}, timestamp, kwargs)
+                for cluster in clusters]
+            results = [future.result() for future in futures]
+
+        # Map back to original hypotheses, so detections and predictions can be compared by
+        # identity (e.g. in a tracker, to determine unassociated detections)
+        associations = {}
+        for cluster, cluster_results in zip(clusters, results):
+            associations.update(
+                (track, _restore_association(result, hypotheses[track]))
+                for track, result in zip(cluster, cluster_results)
+                if result is not None)
+
+        return associations
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+import heapq
+from abc import abstractmethod
+
+import numpy as np
+
+from ._assignment import assign2D
+from ..base import Base, Property
+from ..types.hypothesis import ProbabilityJointHypothesis
+from ..types.numeric import Probability
+
+
+class JointHypothesisEnumerator(Base):
+    """Joint hypothesis enumerator base class
+
+    An enumerator generates a bounded set of valid joint hypotheses (where no detection is
+    assigned to more than one track) from the probability hypotheses of each track, for use in
+    place of exhaustive enumeration by :class:`~.JPDA`. The returned joint hypotheses have
+    probabilities normalised relative to each other, such that marginal association probabilities
+    can be formed from them directly.
+    """
+
+    @abstractmethod
+    def enumerate(self, tracks, multihypths):
+        """Enumerate joint hypotheses
+
+        Parameters
+        ----------
+        tracks : sequence of :class:`~.Track`
+            Tracks to form joint hypotheses for
+        multihypths : mapping of :class:`~.Track` : :class:`~.MultipleHypothesis`
+            Probability hypotheses for each track, including the missed detection hypothesis
+
+        Returns
+        -------
+        : list of :class:`~.ProbabilityJointHypothesis`
+            Joint hypotheses, with probabilities normalised to sum to one
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _normalise(joint_hypotheses):
+        sum_probabilities = Probability.sum(
+            joint_hypothesis.probability for joint_hypothesis in joint_hypotheses)
+        for joint_hypothesis in joint_hypotheses:
+            joint_hypothesis.probability /= sum_probabilities
+        return joint_hypotheses
+
+    @staticmethod
+    def _hypothesis_table(tracks, multihypths):
+        """Index hypotheses of each track against a common list of detections
+
+        Returns
+        -------
+        : list of :class:`~.Detection`
+            Detections which appear in the hypotheses of any track
+        : list of dict
+            For each track, mapping of detection index (or `None` for missed detection) to
+            hypothesis
+        """
+        detections = []
+        detection_indices = {}
+        table = []
+        for track in tracks:
+            track_hypotheses = {}
+            for hypothesis in multihypths[track]:
+                if not hypothesis:
+                    track_hypotheses[None] = hypothesis
+                    continue
+                measurement = hypothesis.measurement
+                if measurement not in detection_indices:
+                    detection_indices[measurement] = len(detections)
+                    detections.append(measurement)
+                track_hypotheses[detection_indices[measurement]] = hypothesis
+            table.append(track_hypotheses)
+        return detections, table
+
+
+class MurtyEnumerator(JointHypothesisEnumerator):
+    """Murty's k-best assignment joint hypothesis enumerator
+
+    Finds the :attr:`num_hypotheses` most probable joint hypotheses, by ranking solutions of the
+    2D assignment problem (solved with :func:`~.assign2D`) with Murty's algorithm [1]_. The cost
+    of each track-detection pair is the negative log probability of the hypothesis, with an
+    additional column per track for missed detection.
+
+    References
+    ----------
+    .. [1] Murty, K. G. "An algorithm for ranking all the assignments in order of increasing
+       cost," Operations Research, vol. 16, no. 3, pp. 682-687, May-Jun. 1968.
+    """
+
+    num_hypotheses: int = Property(
+        default=100, doc="Maximum number of joint hypotheses to return. Default 100.")
+
+    @staticmethod
+    def _solve(cost_matrix):
+        # assign2D modifies cost matrix in place, so pass a copy
+        gain, col4row, _ = assign2D(cost_matrix.copy())
+        if gain.size <= 0:
+            return None
+        cost = np.sum(cost_matrix[np.arange(len(col4row)), col4row])
+        if not np.isfinite(cost):
+            return None
+        return cost, col4row
+
+    def enumerate(self, tracks, multihypths):
+        tracks = list(tracks)
+        if not tracks:
+            return []
+        detections, table = self._hypothesis_table(tracks, multihypths)
+        num_tracks, num_detections = len(tracks), len(detections)
+
+        # Cost matrix with a missed detection column for each track
+        cost_matrix = np.full((num_tracks, num_detections + num_tracks), np.inf)
+        for i, track_hypotheses in enumerate(table):
+            for j, hypothesis in track_hypotheses.items():
+                column = num_detections + i if j is None else j
+                cost_matrix[i, column] = -Probability(hypothesis.probability).log_value
+
+        solution = self._solve(cost_matrix)
+        if solution is None:
+            return []
+        counter = 0  # Tie breaker, so cost matrices aren't compared in heap
+        queue = [(solution[0], counter, solution[1], cost_matrix)]
+        assignments = []
+        while queue and len(assignments) < self.num_hypotheses:
+            _, _, col4row, node_matrix = heapq.heappop(queue)
+            assignments.append(col4row)
+
+            # Partition remaining solution space of this node
+            node_matrix = node_matrix.copy()
+            for i in range(num_tracks):
+                column = col4row[i]
+                child_matrix = node_matrix.copy()
+                child_matrix[i, column] = np.inf
+                child_solution = self._solve(child_matrix)
+                if child_solution is not None:
+                    counter += 1
+                    heapq.heappush(
+                        queue, (child_solution[0], counter, child_solution[1], child_matrix))
+                # Force assignment of row i for subsequent partitions
+                cost = node_matrix[i, column]
+                node_matrix[i, :] = np.inf
+                node_matrix[:, column] = np.inf
+                node_matrix[i, column] = cost
+
+        joint_hypotheses = []
+        for col4row in assignments:
+            joint_hypotheses.append(ProbabilityJointHypothesis({
+                track: track_hypotheses[None if column >= num_detections else column]
+                for track, track_hypotheses, column in zip(tracks, table, col4row)}))
+
+        return self._normalise(joint_hypotheses)
+
+
+class GibbsEnumerator(JointHypothesisEnumerator):
+    """Gibbs sampling joint hypothesis enumerator
+
+    Draws joint hypotheses by Gibbs sampling, where each track's association is sampled in turn
+    conditioned on the associations of all other tracks, such that no detection is assigned twice.
+    Distinct sampled joint hypotheses are returned, with probabilities normalised relative to each
+    other.
+    """
+
+    num_samples: int = Property(
+        default=1000, doc="Number of Gibbs sampling iterations. Default 1000.")
+    seed: int = Property(default=None, doc="Seed for random number generation. Default `None`.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.random_state = np.random.RandomState(self.seed)
+
+    def enumerate(self, tracks, multihypths):
+        tracks = list(tracks)
+        if not tracks:
+            return []
+        _, table = self._hypothesis_table(tracks, multihypths)
+
+        options = []
+        log_weights = []
+        for track_hypotheses in table:
+            options.append(list(track_hypotheses))
+            log_weights.append(np.array([Probability(hypothesis.probability).log_value
+                                         for hypothesis in track_hypotheses.values()]))
+
+        # Start from all missed detections, which is always valid
+        assignment = [None] * len(tracks)
+        samples = set()
+        for _ in range(self.num_samples):
+            for i, (track_options, track_log_weights) in enumerate(zip(options, log_weights)):
+                used = set(assignment[:i] + assignment[i+1:])
+                valid = np.array([option is None or option not in used
+                                  for option in track_options])
+                weights = np.where(valid, np.exp(track_log_weights - np.max(
+                    track_log_weights[valid])), 0)
+                assignment[i] = track_options[
+                    self.random_state.choice(len(track_options), p=weights/np.sum(weights))]
+            samples.add(tuple(assignment))
+
+        joint_hypotheses = [
+            ProbabilityJointHypothesis({
+                track: track_hypotheses[option]
+                for track, track_hypotheses, option in zip(tracks, table, sample)})
+            for sample in samples]
+
+        return self._normalise(joint_hypotheses)
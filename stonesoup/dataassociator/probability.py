@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from .base import DataAssociator
+from .cluster import cluster_tracks
+from .enumerator import JointHypothesisEnumerator
 from ..base import Property
 from ..hypothesiser import Hypothesiser
 from ..hypothesiser.probability import PDAHypothesiser
@@ -52,10 +54,20 @@ class JPDA(DataAssociator):
     then Detection is assumed to be outside Track's gate, and the probability
     of association is dropped from the Gaussian Mixture.  This calculation
     takes place in the function :meth:`enumerate_JPDA_hypotheses`.
+
+    Tracks are first split into clusters which share no detections, as the joint hypotheses of
+    each cluster are independent of the others. Enumeration of all valid joint hypotheses grows
+    exponentially with the size of a cluster, so an approximate :attr:`enumerator` (e.g.
+    :class:`~.MurtyEnumerator` or :class:`~.GibbsEnumerator`) can be used to bound this.
     """
 
     hypothesiser: PDAHypothesiser = Property(
         doc="Generate a set of hypotheses for each prediction-detection pair")
+    enumerator: JointHypothesisEnumerator = Property(
+        default=None,
+        doc="Enumerator used to generate joint hypotheses for each cluster of tracks. Default "
+            "`None`, where all valid joint hypotheses are enumerated with "
+            ":meth:`enumerate_JPDA_hypotheses`.")
 
     def associate(self, tracks, detections, timestamp, **kwargs):
 
@@ -63,14 +75,28 @@ class JPDA(DataAssociator):
         # available Detections
         hypotheses = self.generate_hypotheses(tracks, detections, timestamp, **kwargs)
 
-        # enumerate the Joint Hypotheses of track/detection associations
-        joint_hypotheses = \
-            self.enumerate_JPDA_hypotheses(tracks, hypotheses)
-
         # Calculate MultiMeasurementHypothesis for each Track over all
         # available Detections with probabilities drawn from JointHypotheses
         new_hypotheses = dict()
 
+        for cluster in cluster_tracks(hypotheses):
+            new_hypotheses.update(self._marginal_hypotheses(cluster, hypotheses, timestamp))
+
+        return new_hypotheses
+
+    def _marginal_hypotheses(self, tracks, hypotheses, timestamp):
+        """Calculate marginal association probabilities for a cluster of tracks from their
+        joint hypotheses."""
+
+        # enumerate the Joint Hypotheses of track/detection associations
+        if self.enumerator is None:
+            joint_hypotheses = \
+                self.enumerate_JPDA_hypotheses(tracks, hypotheses)
+        else:
+            joint_hypotheses = self.enumerator.enumerate(tracks, hypotheses)
+
+        new_hypotheses = dict()
+
         for track in tracks:
 
             single_measurement_hypotheses = list()
@@ -2,6 +2,7 @@
 import pytest
 import numpy as np
 
+from ...gater.distance import DistanceGater
 from ...hypothesiser.probability import PDAHypothesiser
 from ...hypothesiser.distance import DistanceHypothesiser
 from ...measures import Mahalanobis
@@ -40,3 +41,8 @@ def probability_hypothesiser(predictor, updater):
 @pytest.fixture()
 def distance_hypothesiser(predictor, updater):
     return DistanceHypothesiser(predictor, updater, Mahalanobis(), 10)
+
+
+@pytest.fixture()
+def gated_hypothesiser(probability_hypothesiser):
+    return DistanceGater(probability_hypothesiser, Mahalanobis(), gate_threshold=5)
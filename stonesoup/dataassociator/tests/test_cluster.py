@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from ..cluster import ClusteringAssociator, cluster_tracks
+from ..neighbour import GNNWith2DAssignment
+from ..probability import JPDA
+from ...gater.distance import DistanceGater
+from ...measures import Mahalanobis
+from ...hypothesiser import Hypothesiser
+from ...types.detection import Detection, MissedDetection
+from ...types.hypothesis import SingleHypothesis
+from ...types.state import GaussianState
+from ...types.track import Track
+
+
+@pytest.fixture()
+def scenario():
+    timestamp = datetime.datetime.now()
+    tracks = [
+        Track([GaussianState(np.array([[x, 0, y, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+        for x, y in [(0, 0), (1.5, 0), (0, 1.5), (100, 100), (101, 100), (-100, 50)]]
+    detections = {
+        Detection(np.array([[x, y]]), timestamp)
+        for x, y in [(0, 0.5), (1, 0), (1, 1), (100.2, 100), (500, 500)]}
+    return tracks, detections, timestamp
+
+
+def test_cluster_tracks(gated_hypothesiser, scenario):
+    tracks, detections, timestamp = scenario
+
+    hypotheses = {track: gated_hypothesiser.hypothesise(track, detections, timestamp)
+                  for track in tracks}
+
+    clusters = cluster_tracks(hypotheses)
+    assert sorted(len(cluster) for cluster in clusters) == [1, 2, 3]
+    assert {frozenset(cluster) for cluster in clusters} \
+        == {frozenset(tracks[:3]), frozenset(tracks[3:5]), frozenset(tracks[5:])}
+
+    assert cluster_tracks({}) == []
+
+
+@pytest.mark.parametrize(
+    'executor', [None, ThreadPoolExecutor, ProcessPoolExecutor],
+    ids=['sequential', 'thread', 'process'])
+def test_clustering_jpda(executor, gated_hypothesiser, scenario):
+    tracks, detections, timestamp = scenario
+
+    associator = JPDA(gated_hypothesiser)
+    expected_associations = associator.associate(set(tracks), detections, timestamp)
+
+    if executor is None:
+        clustering_associator = ClusteringAssociator(associator)
+        associations = clustering_associator.associate(set(tracks), detections, timestamp)
+    else:
+        with executor(max_workers=2) as pool:
+            clustering_associator = ClusteringAssociator(associator, executor=pool)
+            associations = clustering_associator.associate(set(tracks), detections, timestamp)
+
+    assert clustering_associator.hypothesiser is gated_hypothesiser
+    assert associations.keys() == set(tracks)
+    for track in tracks:
+        expected = {
+            hypothesis.measurement: float(hypothesis.probability)
+            for hypothesis in expected_associations[track] if hypothesis}
+        hypotheses = {
+            hypothesis.measurement: float(hypothesis.probability)
+            for hypothesis in associations[track] if hypothesis}
+        assert len(hypotheses) == len(expected)
+        for measurement, probability in hypotheses.items():
+            # Original detections, even when associated in another process
+            assert measurement in detections
+            assert np.isclose(probability, expected[measurement])
+
+
+def test_clustering_gnn(distance_hypothesiser, scenario):
+    tracks, detections, timestamp = scenario
+    hypothesiser = DistanceGater(distance_hypothesiser, Mahalanobis(), gate_threshold=5)
+
+    associator = GNNWith2DAssignment(hypothesiser)
+    expected_associations = associator.associate(set(tracks), detections, timestamp)
+
+    with ThreadPoolExecutor() as pool:
+        clustering_associator = ClusteringAssociator(associator, executor=pool)
+        associations = clustering_associator.associate(set(tracks), detections, timestamp)
+
+    assert associations.keys() == expected_associations.keys()
+    for track, hypothesis in associations.items():
+        if hypothesis:
+            assert hypothesis.measurement is expected_associations[track].measurement
+        else:
+            assert not expected_associations[track]
+
+
+class _NewHypothesisAssociator(GNNWith2DAssignment):
+    """Returns new missed detection hypotheses"""
+    def associate(self, tracks, detections, timestamp, **kwargs):
+        return {track: SingleHypothesis(None, MissedDetection(timestamp=timestamp))
+                for track in tracks}
+
+
+@pytest.mark.parametrize('executor', [None, ThreadPoolExecutor], ids=['sequential', 'thread'])
+def test_clustering_unmatched_hypothesis(executor, scenario):
+    tracks, detections, timestamp = scenario
+
+    class TrueDetectionHypothesiser(Hypothesiser):
+        """Hypotheses without a missed detection hypothesis"""
+        def hypothesise(self, track, detections, timestamp):
+            return [SingleHypothesis(track.state, detection) for detection in detections]
+
+    associator = ClusteringAssociator(
+        _NewHypothesisAssociator(TrueDetectionHypothesiser()))
+    if executor is None:
+        with pytest.raises(ValueError, match="doesn't match any of the track's hypotheses"):
+            associator.associate(set(tracks[:2]), detections, timestamp)
+    else:
+        with executor() as pool:
+            associator.executor = pool
+            with pytest.raises(ValueError, match="doesn't match any"):
+                associator.associate(set(tracks[:2]), detections, timestamp)
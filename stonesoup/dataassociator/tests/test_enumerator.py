@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import numpy as np
+import pytest
+
+from ..enumerator import MurtyEnumerator, GibbsEnumerator
+from ..probability import JPDA
+from ...types.detection import Detection
+from ...types.state import GaussianState
+from ...types.track import Track
+
+
+@pytest.fixture()
+def scenario():
+    timestamp = datetime.datetime.now()
+    tracks = [
+        Track([GaussianState(np.array([[x, 0, y, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+        for x, y in [(0, 0), (1.5, 0), (0, 1.5), (100, 100), (101, 100)]]
+    detections = {
+        Detection(np.array([[x, y]]), timestamp)
+        for x, y in [(0, 0.5), (1, 0), (1, 1), (100.5, 100), (500, 500)]}
+    return tracks, detections, timestamp
+
+
+@pytest.mark.parametrize(
+    'enumerator',
+    [MurtyEnumerator(num_hypotheses=1000), GibbsEnumerator(num_samples=2000, seed=1)],
+    ids=['murty', 'gibbs'])
+def test_enumerator(enumerator, gated_hypothesiser, scenario):
+    tracks, detections, timestamp = scenario
+    tracks = tracks[:3]  # Single cluster
+
+    hypotheses = {track: gated_hypothesiser.hypothesise(track, detections, timestamp)
+                  for track in tracks}
+    exhaustive_joint_hypotheses = JPDA.enumerate_JPDA_hypotheses(tracks, hypotheses)
+    joint_hypotheses = enumerator.enumerate(tracks, hypotheses)
+
+    assert 0 < len(joint_hypotheses) <= len(exhaustive_joint_hypotheses)
+    if isinstance(enumerator, MurtyEnumerator):
+        # Enough hypotheses to have found every valid joint hypothesis
+        assert len(joint_hypotheses) == len(exhaustive_joint_hypotheses)
+    assert np.isclose(float(sum(hyp.probability for hyp in joint_hypotheses)), 1)
+    assert all(JPDA.isvalid(hyp.hypotheses.values()) for hyp in joint_hypotheses)
+
+    # Probabilities relative to each other should match exhaustive enumeration
+    exhaustive = {
+        tuple(hyp.hypotheses[track].measurement for track in tracks): hyp.probability
+        for hyp in exhaustive_joint_hypotheses}
+    keys = [tuple(hyp.hypotheses[track].measurement for track in tracks)
+            for hyp in joint_hypotheses]
+    assert len(set(keys)) == len(keys)
+    ratio = float(joint_hypotheses[0].probability / exhaustive[keys[0]])
+    for hyp, key in zip(joint_hypotheses, keys):
+        assert np.isclose(float(hyp.probability / exhaustive[key]), ratio)
+
+
+def test_murty_ranking(gated_hypothesiser, scenario):
+    tracks, detections, timestamp = scenario
+
+    hypotheses = {track: gated_hypothesiser.hypothesise(track, detections, timestamp)
+                  for track in tracks}
+    exhaustive_joint_hypotheses = sorted(
+        JPDA.enumerate_JPDA_hypotheses(tracks, hypotheses),
+        key=lambda hyp: hyp.probability, reverse=True)
+    joint_hypotheses = MurtyEnumerator(num_hypotheses=5).enumerate(tracks, hypotheses)
+
+    assert len(joint_hypotheses) == 5
+    # Should be the 5 best, in order (normalised differently so compare ratios)
+    ratio = joint_hypotheses[0].probability / exhaustive_joint_hypotheses[0].probability
+    for hyp, exhaustive_hyp in zip(joint_hypotheses, exhaustive_joint_hypotheses):
+        assert np.isclose(float(hyp.probability / exhaustive_hyp.probability), float(ratio))
+
+    assert MurtyEnumerator().enumerate([], hypotheses) == []
+    assert GibbsEnumerator().enumerate([], hypotheses) == []
+
+
+@pytest.mark.parametrize(
+    'enumerator',
+    [None, MurtyEnumerator(num_hypotheses=1000), GibbsEnumerator(num_samples=2000, seed=1)],
+    ids=['exhaustive', 'murty', 'gibbs'])
+def test_jpda_enumerator(enumerator, gated_hypothesiser, scenario):
+    tracks, detections, timestamp = scenario
+
+    associator = JPDA(gated_hypothesiser, enumerator)
+    associations = associator.associate(set(tracks), detections, timestamp)
+
+    # Marginals should match those of global exhaustive enumeration
+    hypotheses = {track: gated_hypothesiser.hypothesise(track, detections, timestamp)
+                  for track in tracks}
+    joint_hypotheses = JPDA.enumerate_JPDA_hypotheses(tracks, hypotheses)
+    for track in tracks:
+        assert len(associations[track]) == len(hypotheses[track])
+        for hypothesis in associations[track]:
+            expected = sum(
+                float(joint_hypothesis.probability) for joint_hypothesis in joint_hypotheses
+                if (joint_hypothesis.hypotheses[track].measurement is hypothesis.measurement
+                    or not (joint_hypothesis.hypotheses[track] or hypothesis)))
+            # Gibbs sampling may miss the least probable joint hypotheses
+            assert np.isclose(float(hypothesis.probability), expected,
+                              atol=1e-2 if isinstance(enumerator, GibbsEnumerator) else 1e-8)
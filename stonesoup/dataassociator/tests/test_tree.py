@@ -12,6 +12,7 @@ from ..neighbour import (
     NearestNeighbour, GlobalNearestNeighbour, GNNWith2DAssignment)
 from ..probability import PDA, JPDA
 from ..tree import DetectionKDTreeMixIn, TPRTreeMixIn
+from ...models.measurement.linear import LinearGaussian
 from ...models.measurement.nonlinear import CartesianToBearingRange
 from ...types.array import CovarianceMatrix
 from ...types.detection import Detection, MissedDetection
@@ -359,3 +360,70 @@ def test_no_tracks_probability(pda_associator):
 
     # Since no Tracks went in, there should be no associations
     assert not associations
+
+
+def test_tpr_tree_incremental(distance_hypothesiser, measurement_model, updater):
+    if rtree is None:
+        return pytest.skip("'rtree' module not available")
+    associator = TPRTreeNN(distance_hypothesiser, measurement_model, datetime.timedelta(hours=1))
+    timestamp = datetime.datetime.now()
+
+    t1 = Track([GaussianState(np.array([[0, 0, 0, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+    t2 = Track([GaussianState(np.array([[3, 0, 3, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+    d1 = Detection(np.array([[0, 0]]), timestamp)
+    tracks = {t1, t2}
+
+    # Both tracks inserted
+    associations = associator.associate(tracks, {d1}, timestamp)
+    assert (associator.tree_hits, associator.tree_misses, associator.tree_rebuilds) == (0, 2, 0)
+    assert associations[t1].measurement is d1
+
+    # Unchanged, so tree entries reused
+    associator.associate(tracks, {d1}, timestamp)
+    assert (associator.tree_hits, associator.tree_misses, associator.tree_rebuilds) == (2, 2, 0)
+
+    # Only updated track reinserted
+    timestamp += datetime.timedelta(seconds=1)
+    t1.append(updater.update(associations[t1]))
+    t2.append(associations[t2].prediction)
+    d2 = Detection(np.array([[3, 3]]), timestamp)
+    associations = associator.associate(tracks, {d2}, timestamp)
+    assert (associator.tree_hits, associator.tree_misses, associator.tree_rebuilds) == (3, 3, 0)
+    assert associations[t2].measurement is d2
+
+    # Deleted track removed from tree
+    associator.associate({t1}, {d2}, timestamp)
+    assert (associator.tree_hits, associator.tree_misses, associator.tree_rebuilds) == (4, 3, 0)
+    assert t2 not in associator._tree
+
+    # Beyond horizon, so tree rebuilt
+    timestamp += datetime.timedelta(hours=2)
+    associator.associate(tracks, set(), timestamp)
+    assert (associator.tree_hits, associator.tree_misses, associator.tree_rebuilds) == (4, 5, 1)
+    assert set(associator._tree) == tracks
+
+
+@pytest.mark.parametrize('number_of_neighbours', [None, 1])
+def test_kd_tree_multiple_models(
+        distance_hypothesiser, predictor, updater, measurement_model, number_of_neighbours):
+    associator = DetectionKDTreeNN(
+        distance_hypothesiser, predictor, updater,
+        number_of_neighbours=number_of_neighbours, max_distance=1)
+    measurement_model2 = LinearGaussian(
+        ndim_state=4, mapping=[2], noise_covar=CovarianceMatrix([[0.5]]))
+    timestamp = datetime.datetime.now()
+
+    t1 = Track([GaussianState(np.array([[0, 1, 0, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+    t2 = Track([GaussianState(np.array([[3, 0, 5, 0]]), np.diag([1, 0.1, 1, 0.1]), timestamp)])
+    tracks = {t1, t2}
+
+    # Detections from different models and times, with t1 moving in x
+    d1 = Detection(np.array([[1.1, 0]]), timestamp + datetime.timedelta(seconds=1))
+    d2 = Detection(np.array([[3, 5]]), timestamp)
+    d3 = Detection(np.array([[5.2]]), timestamp, measurement_model=measurement_model2)
+    d4 = Detection(np.array([[0.1]]), timestamp, measurement_model=measurement_model2)
+
+    hypotheses = associator.generate_hypotheses(tracks, {d1, d2, d3, d4}, timestamp)
+
+    assert {hypothesis.measurement for hypothesis in hypotheses[t1] if hypothesis} == {d1, d4}
+    assert {hypothesis.measurement for hypothesis in hypotheses[t2] if hypothesis} == {d2, d3}
@@ -69,7 +69,7 @@ class TrackToTrack(TrackToTrackAssociator):
         """
         associations = set()
         for track2 in tracks_set_2:
-            truth_timestamps = [state.timestamp for state in track2.states]
+            truth_timestamps = {state.timestamp for state in track2.states}
             for track1 in tracks_set_1:
 
                 track1_states = sorted(
@@ -77,7 +77,7 @@ class TrackToTrack(TrackToTrackAssociator):
                      for state in track1
                      if state.timestamp in truth_timestamps),
                     key=attrgetter('timestamp'))
-                track_timestamps = [state.timestamp for state in track1_states]
+                track_timestamps = {state.timestamp for state in track1_states}
 
                 track2_states = sorted(
                     (state
@@ -17,6 +17,7 @@ except (ImportError, AttributeError, OSError) as err:
 
 from .base import DataAssociator
 from ..base import Property
+from ..hypothesiser import Hypothesiser
 from ..models.base import LinearModel
 from ..models.measurement import MeasurementModel
 from ..predictor import Predictor
@@ -32,10 +33,14 @@ class DetectionKDTreeMixIn(DataAssociator):
     then queried against the kd-tree, and only matching detections are passed
     to the :attr:`hypothesiser`.
 
+    A separate kd-tree is constructed for each group of detections which share a measurement
+    model and timestamp, which is then queried with the measurement predictions of all tracks
+    at once.
+
     Notes
     -----
-    This is only suitable where measurements are in same space as each other
-    and at the same timestamp.
+    Distances are evaluated in measurement space, so this is most suitable where measurement
+    models are linear (or angles are small relative to :attr:`max_distance`).
     """
     predictor: Predictor = Property(
         doc="Predict tracks to detection times")
@@ -58,30 +63,38 @@ class DetectionKDTreeMixIn(DataAssociator):
                 track, detections, timestamp, **kwargs)
                 for track in tracks}
 
-        detections_list = list(detections)
-        tree = KDTree(
-            np.vstack([detection.state_vector[:, 0]
-                       for detection in detections_list]))
-
+        tracks = list(tracks)
         track_detections = defaultdict(set)
-        for track in tracks:
-            prediction = self.predictor.predict(track.state, timestamp)
-            meas_pred = self.updater.predict_measurement(prediction)
+        for (measurement_model, detection_time), detections_list in \
+                Hypothesiser._group_detections(detections).items():
+            if detection_time is None:
+                detection_time = timestamp
+            tree = KDTree(
+                np.vstack([detection.state_vector[:, 0]
+                           for detection in detections_list]))
+
+            predictions = self.predictor.predict_many(
+                [track.state for track in tracks], detection_time)
+            meas_preds = np.vstack([
+                self.updater.predict_measurement(
+                    prediction, measurement_model=measurement_model).state_vector.ravel()
+                for prediction in predictions])
 
             if self.number_of_neighbours is None:
-                indexes = tree.query_ball_point(
-                    meas_pred.state_vector.ravel(),
-                    r=self.max_distance)
+                track_indexes = tree.query_ball_point(
+                    meas_preds, r=self.max_distance, workers=-1)
             else:
-                _, indexes = tree.query(
-                    meas_pred.state_vector.ravel(),
+                _, track_indexes = tree.query(
+                    meas_preds,
                     k=self.number_of_neighbours,
-                    distance_upper_bound=self.max_distance)
+                    distance_upper_bound=self.max_distance,
+                    workers=-1)
 
-            for index in np.atleast_1d(indexes):
-                # Index is equal to length of detections when no neighbours found
-                if index != len(detections_list):
-                    track_detections[track].add(detections_list[index])
+            for track, indexes in zip(tracks, track_indexes):
+                for index in np.atleast_1d(indexes):
+                    # Index is equal to length of detections when no neighbours found
+                    if index != len(detections_list):
+                        track_detections[track].add(detections_list[index])
 
         return {track: self.hypothesiser.hypothesise(
             track, track_detections[track], timestamp, **kwargs)
@@ -92,6 +105,14 @@ class TPRTreeMixIn(DataAssociator):
     """Detection TPR tree based mixin
 
     Construct a TPR-tree.
+
+    The tree is maintained incrementally between calls: only tracks which are new, or whose
+    state has been updated since they were last inserted, are (re)inserted, and tracks no longer
+    present are removed. As the bounding boxes of the tree become looser the further they are
+    extrapolated, the tree is rebuilt from the current track states once :attr:`horizon_time`
+    has elapsed since it was last built. Counters :attr:`tree_hits` (tracks whose tree entry was
+    reused), :attr:`tree_misses` (tracks which had to be inserted or reinserted) and
+    :attr:`tree_rebuilds` are provided to aid tuning of :attr:`horizon_time`.
     """
     measurement_model: MeasurementModel = Property(
         doc="Measurement model used within the TPR tree")
@@ -117,59 +138,93 @@ class TPRTreeMixIn(DataAssociator):
             self.vel_mapping = [i + 1 for i in self.pos_mapping]
 
         # Create tree
+        self._tree = self._new_tree()
+        self._tree_time = None
+        self._coords = dict()
+        self._states = dict()
+
+        self.tree_hits = 0
+        self.tree_misses = 0
+        self.tree_rebuilds = 0
+
+    def _new_tree(self):
         tree_property = rtree.index.Property(
             type=rtree.index.RT_TPRTree,
             tpr_horizon=self.horizon_time.total_seconds(),
             dimension=len(self.pos_mapping))
-        self._tree = rtree.index.RtreeContainer(properties=tree_property)
-        self._coords = dict()
+        return rtree.index.RtreeContainer(properties=tree_property)
+
+    @staticmethod
+    def _tree_timestamp(timestamp):
+        return timestamp.astimezone(datetime.timezone.utc).timestamp()
 
     def _track_tree_coordinates(self, track):
-        state_vector = track.state_vector[self.pos_mapping, :]
-        state_delta = 3 * np.sqrt(
-            np.diag(track.covar)[self.pos_mapping].reshape(-1, 1))
-        vel_vector = track.state_vector[self.vel_mapping, :]
-        vel_delta = 3 * np.sqrt(
-            np.diag(track.covar)[self.vel_mapping].reshape(-1, 1))
+        state_vector = track.state_vector
+        std_devs = 3 * np.sqrt(np.diag(track.covar))
 
-        min_pos = (state_vector - state_delta).ravel()
-        max_pos = (state_vector + state_delta).ravel()
-        min_vel = (vel_vector - vel_delta).ravel()
-        max_vel = (vel_vector + vel_delta).ravel()
+        pos_vector = np.asarray(state_vector[self.pos_mapping, 0], dtype=float)
+        pos_delta = std_devs[self.pos_mapping]
+        vel_vector = np.asarray(state_vector[self.vel_mapping, 0], dtype=float)
+        vel_delta = std_devs[self.vel_mapping]
 
-        return ((*min_pos, *max_pos), (*min_vel, *max_vel),
-                track.timestamp.astimezone(datetime.timezone.utc).timestamp())
+        return ((*(pos_vector - pos_delta), *(pos_vector + pos_delta)),
+                (*(vel_vector - vel_delta), *(vel_vector + vel_delta)),
+                self._tree_timestamp(track.timestamp))
 
-    def generate_hypotheses(self, tracks, detections, timestamp, **kwargs):
-        # No need for tree here.
-        if not tracks:
-            return dict()
+    def _tree_delete(self, track, c_time):
+        coords = self._coords.pop(track)
+        del self._states[track]
+        self._tree.delete(
+            track, coords[:-1] + ((coords[-1] - 1e-6, self._tree_timestamp(c_time)),))
 
-        # Update the tree in this first section
-        sorted_tracks = sorted(tracks.union(self._tree), key=attrgetter('timestamp'))
+    def _tree_insert(self, track):
+        self._coords[track] = self._track_tree_coordinates(track)
+        self._states[track] = track.state
+        self._tree.insert(track, self._coords[track])
+
+    def _update_tree(self, tracks, timestamp):
+        # Rebuild once bounding boxes have been extrapolated beyond the horizon
+        if self._tree_time is None or timestamp - self._tree_time > self.horizon_time:
+            if self._tree_time is not None:
+                self._tree = self._new_tree()
+                self._coords.clear()
+                self._states.clear()
+                self.tree_rebuilds += 1
+            self._tree_time = timestamp
+
+        # Tracks no longer present, and those new or updated since insertion
+        deleted_tracks = self._coords.keys() - tracks
+        changed_tracks = {
+            track for track in tracks
+            if track not in self._states
+            or (track.state is not self._states[track] and isinstance(track.state, Update))}
+        self.tree_misses += len(changed_tracks)
+        self.tree_hits += len(tracks) - len(changed_tracks)
+        if not deleted_tracks and not changed_tracks:
+            return
+
+        # Apply changes in time order, as required by the tree
+        sorted_tracks = sorted(deleted_tracks | changed_tracks, key=attrgetter('timestamp'))
         # Get initial starting time from earliest track
         c_time = sorted_tracks[0].timestamp
         for track in sorted_tracks:
-            if track not in self._tree:  # track not in tree, so insert it
-                self._coords[track] = self._track_tree_coordinates(track)
-                self._tree.insert(track, self._coords[track])
-
-            elif track not in tracks:  # track in tree, but not in tracks now; remove it from tree
-                coords = self._coords[track][:-1] \
-                            + ((self._coords[track][-1] - 1e-6,
-                                c_time.astimezone(datetime.timezone.utc).timestamp()),)
-                self._tree.delete(track, coords)
-                del self._coords[track]
-            elif isinstance(track.state, Update):  # Track in tree, and updated; so update it.
-                coords = self._coords[track][:-1] \
-                            + ((self._coords[track][-1]-1e-6,
-                                c_time.astimezone(datetime.timezone.utc).timestamp()),)
-                self._tree.delete(track, coords)
-                self._coords[track] = self._track_tree_coordinates(track)
-                self._tree.insert(track, self._coords[track])
+            if track in deleted_tracks:
+                self._tree_delete(track, c_time)
+            else:
+                if track in self._coords:
+                    self._tree_delete(track, c_time)
+                self._tree_insert(track)
             # Set current tree to tracks timestamp
             c_time = track.timestamp
 
+    def generate_hypotheses(self, tracks, detections, timestamp, **kwargs):
+        # No need for tree here.
+        if not tracks:
+            return dict()
+
+        # Update the tree in this first section
+        self._update_tree(set(tracks), timestamp)
+
         # With tree up to date, find tracks that intersect with detections
         track_detections = defaultdict(set)
         for detection in sorted(detections, key=attrgetter('timestamp')):
@@ -189,7 +244,7 @@ class TPRTreeMixIn(DataAssociator):
                     detection, **kwargs)[self.pos_mapping, :]
 
             # Find intersections
-            det_time = detection.timestamp.astimezone(datetime.timezone.utc).timestamp()
+            det_time = self._tree_timestamp(detection.timestamp)
             intersected_tracks = self._tree.intersection((
                 (*state_meas.ravel(), *state_meas.ravel()),
                 (0, 0)*len(self.pos_mapping),
@@ -545,6 +545,36 @@ def gm_reduce_single(means, covars, weights):
     return mean.view(StateVector), covar.view(CovarianceMatrix)
 
 
+def segment_logsumexp(values, offsets):
+    """Log-sum-exp of each contiguous segment of an array
+
+    Vectorised equivalent of calling :func:`scipy.special.logsumexp` on each segment
+    ``values[offsets[i]:offsets[i+1]]``, e.g. to normalise the log weights of particles from many
+    targets concatenated together.
+
+    Parameters
+    ----------
+    values : :class:`numpy.ndarray`
+        One dimensional array of log values
+    offsets : :class:`numpy.ndarray` of int
+        Start of each segment, followed by the end of the last, of length number of segments
+        plus one. Segments must be non-empty.
+
+    Returns
+    -------
+    : :class:`numpy.ndarray`
+        Log of the sum of the exponential of the values in each segment
+    """
+    values = np.asarray(values, dtype=np.float64)
+    starts = np.asarray(offsets[:-1])
+    maxima = np.maximum.reduceat(values, starts)
+    # Avoid subtracting infinite maxima, as would result in NaN
+    maxima[~np.isfinite(maxima)] = 0
+    sums = np.add.reduceat(np.exp(values - np.repeat(maxima, np.diff(offsets))), starts)
+    with np.errstate(divide='ignore'):
+        return np.log(sums) + maxima
+
+
 def mod_bearing(x):
     r"""Calculates the modulus of a bearing. Bearing angles are within the \
     range :math:`-\pi` to :math:`\pi`.
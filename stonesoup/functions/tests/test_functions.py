@@ -2,11 +2,13 @@ import pytest
 import numpy as np
 from numpy import deg2rad
 from scipy.linalg import cholesky, LinAlgError
+from scipy.special import logsumexp
 from pytest import approx, raises
 
 from .. import (
     cholesky_eps, jacobian, gm_reduce_single, mod_bearing, mod_elevation, gauss2sigma,
-    rotx, roty, rotz, cart2sphere, cart2angles, pol2cart, sphere2cart, dotproduct)
+    rotx, roty, rotz, cart2sphere, cart2angles, pol2cart, sphere2cart, dotproduct,
+    segment_logsumexp)
 from ...types.array import StateVector, StateVectors, Matrix
 from ...types.state import State, GaussianState
 
@@ -264,3 +266,15 @@ def test_dotproduct(state_vector1, state_vector2):
                 out += a_i * b_i
 
             assert dotproduct(state_vector1, state_vector2) == out
+
+
+def test_segment_logsumexp():
+    values = np.array([*np.log([0.1, 0.2, 0.3, 1e-300, 1e-300, 5]), -np.inf, -np.inf])
+    offsets = np.array([0, 3, 5, 6, 8])
+
+    result = segment_logsumexp(values, offsets)
+
+    assert result.shape == (4, )
+    for value, start, end in zip(result, offsets[:-1], offsets[1:]):
+        assert value == approx(logsumexp(values[start:end]))
+    assert result[3] == -np.inf
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import datetime
+from collections import defaultdict
 from typing import Set, Sequence
 
 from ..base import Base
@@ -37,3 +38,23 @@ class Hypothesiser(Base):
             Ordered sequence of "best" to "worse" hypothesis.
         """
         raise NotImplementedError
+
+    @staticmethod
+    def _group_detections(detections):
+        """Group detections which share a measurement model and timestamp, such that the state
+        and measurement prediction can be shared between them.
+
+        Parameters
+        ----------
+        detections : set of :class:`~.Detection`
+            Detections to group
+
+        Returns
+        -------
+        : dict
+            Mapping of (measurement model, timestamp) to list of :class:`~.Detection`
+        """
+        groups = defaultdict(list)
+        for detection in detections:
+            groups[detection.measurement_model, detection.timestamp].append(detection)
+        return groups
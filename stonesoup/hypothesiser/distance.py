@@ -65,25 +65,28 @@ class DistanceHypothesiser(Hypothesiser):
                 self.missed_distance
                 ))
 
-        # True detection hypotheses
-        for detection in detections:
+        # True detection hypotheses, evaluated together for detections sharing a measurement
+        # model and timestamp
+        for (measurement_model, detection_time), group in \
+                self._group_detections(detections).items():
 
             # Re-evaluate prediction
             prediction = self.predictor.predict(
-                track, timestamp=detection.timestamp, **kwargs)
+                track, timestamp=detection_time, **kwargs)
 
-            # Compute measurement prediction and distance measure
+            # Compute measurement prediction and distance measures
             measurement_prediction = self.updater.predict_measurement(
-                prediction, detection.measurement_model, **kwargs)
-            distance = self.measure(measurement_prediction, detection)
+                prediction, measurement_model, **kwargs)
+            distances = self.measure.pairwise([measurement_prediction], group)[0]
 
-            if self.include_all or distance < self.missed_distance:
-                # True detection hypothesis
-                hypotheses.append(
-                    SingleDistanceHypothesis(
-                        prediction,
-                        detection,
-                        distance,
-                        measurement_prediction))
+            for detection, distance in zip(group, distances):
+                if self.include_all or distance < self.missed_distance:
+                    # True detection hypothesis
+                    hypotheses.append(
+                        SingleDistanceHypothesis(
+                            prediction,
+                            detection,
+                            distance,
+                            measurement_prediction))
 
         return MultipleHypothesis(sorted(hypotheses, reverse=True))
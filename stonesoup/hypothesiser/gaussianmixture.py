@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
+import numpy as np
+
 from . import Hypothesiser
+from .distance import DistanceHypothesiser
 from ..base import Property
+from ..types.detection import MissedDetection
+from ..types.hypothesis import SingleDistanceHypothesis
 from ..types.multihypothesis import MultipleHypothesis
 from ..types.prediction import (TaggedWeightedGaussianStatePrediction,
                                 WeightedGaussianStatePrediction)
@@ -13,6 +18,13 @@ class GaussianMixtureHypothesiser(Hypothesiser):
     Generates a list of :class:`MultipleHypothesis`, where each
     MultipleHypothesis in the list contains SingleHypotheses
     pertaining to an individual component-detection hypothesis
+
+    With :attr:`vectorised` enabled, and a :class:`~.DistanceHypothesiser`
+    as the underlying :attr:`hypothesiser`, all components are predicted
+    together (see :meth:`~.Predictor.predict_many`), and the distances
+    between every component and detection calculated together (see
+    :meth:`~.Measure.pairwise`), with hypotheses only created for pairs within
+    the hypothesiser's missed distance (unless its `include_all` is set).
     """
 
     hypothesiser: Hypothesiser = Property(
@@ -21,6 +33,10 @@ class GaussianMixtureHypothesiser(Hypothesiser):
         default=False,
         doc="Flag to order the :class:`~.MultipleHypothesis` "
             "list by detection or component")
+    vectorised: bool = Property(
+        default=False,
+        doc="Flag to generate hypotheses for all components together, when the underlying "
+            "hypothesiser is a :class:`~.DistanceHypothesiser`. Default `False`.")
 
     def hypothesise(self, components, detections, timestamp, **kwargs):
         """Form hypotheses for associations between Detections and Gaussian
@@ -50,57 +66,122 @@ class GaussianMixtureHypothesiser(Hypothesiser):
         if len(timestamps) > 1:
             raise ValueError("All detections must have the same timestamp")
 
-        hypotheses = list()
-        for component in components:
-            # Get hypotheses for that component for all measurements
-            component_hypotheses = self.hypothesiser.hypothesise(component,
-                                                                 detections,
-                                                                 timestamp,
-                                                                 **kwargs)
-            for hypothesis in component_hypotheses:
-                if isinstance(component, TaggedWeightedGaussianState):
-                    hypothesis.prediction = \
-                        TaggedWeightedGaussianStatePrediction(
-                            tag=component.tag if component.tag != "birth"
-                            else None,
-                            weight=component.weight,
-                            state_vector=hypothesis.prediction.state_vector,
-                            covar=hypothesis.prediction.covar,
-                            timestamp=hypothesis.prediction.timestamp
-                            )
-                else:
-                    hypothesis.prediction = WeightedGaussianStatePrediction(
-                        weight=component.weight,
-                        state_vector=hypothesis.prediction.state_vector,
-                        covar=hypothesis.prediction.covar,
-                        timestamp=hypothesis.prediction.timestamp
-                    )
-            # Create Multiple Hypothesis and add to list
-            if len(component_hypotheses) > 0:
-                hypotheses.append(MultipleHypothesis(component_hypotheses))
+        if self.vectorised and type(self.hypothesiser).hypothesise \
+                is DistanceHypothesiser.hypothesise:
+            hypotheses = self._hypothesise_vectorised(
+                components, detections, timestamp, **kwargs)
+        else:
+            hypotheses = list()
+            for component in components:
+                # Get hypotheses for that component for all measurements
+                component_hypotheses = self.hypothesiser.hypothesise(component,
+                                                                     detections,
+                                                                     timestamp,
+                                                                     **kwargs)
+                # Component predictions shared between hypotheses with the same prediction, such
+                # that they can be updated together (see PointProcessUpdater)
+                component_predictions = dict()
+                for hypothesis in component_hypotheses:
+                    prediction = hypothesis.prediction
+                    if id(prediction) not in component_predictions:
+                        # Prediction kept, so id isn't reused
+                        component_predictions[id(prediction)] = (
+                            prediction, self._component_prediction(component, prediction))
+                    hypothesis.prediction = component_predictions[id(prediction)][1]
+                # Create Multiple Hypothesis and add to list
+                if len(component_hypotheses) > 0:
+                    hypotheses.append(MultipleHypothesis(component_hypotheses))
 
         # Reorder list of MultipleHypothesis so that they are ordered
         # by detection, not component
         if self.order_by_detection:
-            single_hypothesis_list = list()
-            # Retrieve all single hypotheses
+            # Retrieve all single hypotheses, split by detection in a single pass
+            detection_hypotheses = {detection: list() for detection in detections}
+            miss_detections = list()
             for multiple_hypothesis in hypotheses:
                 for single_hypothesis in multiple_hypothesis:
-                    single_hypothesis_list.append(single_hypothesis)
-            reordered_hypotheses = list()
-            # Get miss detected components
-            miss_detections_hypothesis = MultipleHypothesis(
-                [x for x in single_hypothesis_list if not x])
-            for detection in detections:
-                # Create multiple hypothesis per detection
-                detection_multiple_hypothesis = \
-                    MultipleHypothesis(list([hypothesis for hypothesis in single_hypothesis_list
-                                            if hypothesis.measurement == detection]))
-                # Add to new list
-                reordered_hypotheses.append(detection_multiple_hypothesis)
+                    if single_hypothesis:
+                        detection_hypotheses[single_hypothesis.measurement].append(
+                            single_hypothesis)
+                    else:
+                        miss_detections.append(single_hypothesis)
+            # Create multiple hypothesis per detection
+            reordered_hypotheses = [
+                MultipleHypothesis(detection_hypotheses[detection]) for detection in detections]
             # Add miss detected hypothesis to end
-            reordered_hypotheses.append(miss_detections_hypothesis)
+            reordered_hypotheses.append(MultipleHypothesis(miss_detections))
             # Assign reordered list to original list
             hypotheses = reordered_hypotheses
 
         return hypotheses
+
+    @staticmethod
+    def _component_prediction(component, prediction):
+        """Prediction carrying the weight (and tag) of the component"""
+        if isinstance(component, TaggedWeightedGaussianState):
+            return TaggedWeightedGaussianStatePrediction(
+                tag=component.tag if component.tag != "birth"
+                else None,
+                weight=component.weight,
+                state_vector=prediction.state_vector,
+                covar=prediction.covar,
+                timestamp=prediction.timestamp
+                )
+        else:
+            return WeightedGaussianStatePrediction(
+                weight=component.weight,
+                state_vector=prediction.state_vector,
+                covar=prediction.covar,
+                timestamp=prediction.timestamp
+            )
+
+    def _hypothesise_vectorised(self, components, detections, timestamp, **kwargs):
+        """Hypotheses for each component, equivalent to those of the underlying
+        :class:`~.DistanceHypothesiser`, with components predicted together and distances to
+        detections calculated together."""
+        hypothesiser = self.hypothesiser
+        components = list(components)
+        if not components:
+            return []
+
+        # Missed detection hypotheses, with predictions to timestamp
+        predictions = hypothesiser.predictor.predict_many(components, timestamp, **kwargs)
+        components_hypotheses = [
+            [SingleDistanceHypothesis(
+                self._component_prediction(component, prediction),
+                MissedDetection(timestamp=timestamp),
+                hypothesiser.missed_distance)]
+            for component, prediction in zip(components, predictions)]
+
+        # True detection hypotheses, evaluated together for detections sharing a measurement
+        # model and timestamp
+        for (measurement_model, detection_time), group in \
+                self._group_detections(detections).items():
+            predictions = hypothesiser.predictor.predict_many(
+                components, detection_time, **kwargs)
+            measurement_predictions = [
+                hypothesiser.updater.predict_measurement(
+                    prediction, measurement_model, **kwargs)
+                for prediction in predictions]
+            distances = hypothesiser.measure.pairwise(measurement_predictions, group)
+            if hypothesiser.include_all:
+                valid = np.ones(distances.shape, dtype=bool)
+            else:
+                valid = distances < hypothesiser.missed_distance
+
+            # Only create hypotheses for pairs within missed distance, with component predictions
+            # shared between detections
+            component_predictions = dict()
+            for component_index, detection_index in zip(*valid.nonzero()):
+                if component_index not in component_predictions:
+                    component_predictions[component_index] = self._component_prediction(
+                        components[component_index], predictions[component_index])
+                components_hypotheses[component_index].append(
+                    SingleDistanceHypothesis(
+                        component_predictions[component_index],
+                        group[detection_index],
+                        distances[component_index, detection_index],
+                        measurement_predictions[component_index]))
+
+        return [MultipleHypothesis(sorted(component_hypotheses, reverse=True))
+                for component_hypotheses in components_hypotheses]
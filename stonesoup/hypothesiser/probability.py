@@ -1,7 +1,9 @@
+import numpy as np
 from scipy.stats import multivariate_normal as mn
 
 from .base import Hypothesiser
 from ..base import Property
+from ..types.array import StateVectors
 from ..types.detection import MissedDetection
 from ..types.hypothesis import SingleProbabilityHypothesis
 from ..types.multihypothesis import MultipleHypothesis
@@ -116,28 +118,35 @@ class PDAHypothesiser(Hypothesiser):
                 probability
                 ))
 
-        # True detection hypotheses
-        for detection in detections:
+        # True detection hypotheses, evaluated together for detections sharing a measurement
+        # model and timestamp
+        for (measurement_model, detection_time), group in \
+                self._group_detections(detections).items():
             # Re-evaluate prediction
             prediction = self.predictor.predict(
-                track, timestamp=detection.timestamp, **kwargs)
-            # Compute measurement prediction and probability measure
+                track, timestamp=detection_time, **kwargs)
+            # Compute measurement prediction and probability measures
             measurement_prediction = self.updater.predict_measurement(
-                prediction, detection.measurement_model, **kwargs)
+                prediction, measurement_model, **kwargs)
             # Calculate difference before to handle custom types (mean defaults to zero)
             # This is required as log pdf coverts arrays to floats
-            log_pdf = mn.logpdf(
-                (detection.state_vector - measurement_prediction.state_vector).ravel(),
-                cov=measurement_prediction.covar)
-            pdf = Probability(log_pdf, log_value=True)
-            probability = (pdf * self.prob_detect)/self.clutter_spatial_density
-
-            # True detection hypothesis
-            hypotheses.append(
-                SingleProbabilityHypothesis(
-                    prediction,
-                    detection,
-                    probability,
-                    measurement_prediction))
+            differences = \
+                StateVectors([detection.state_vector for detection in group]) \
+                - measurement_prediction.state_vector
+            log_pdfs = np.atleast_1d(mn.logpdf(
+                np.asarray(differences, dtype=np.float_).T,
+                cov=measurement_prediction.covar))
+
+            for detection, log_pdf in zip(group, log_pdfs):
+                pdf = Probability(log_pdf, log_value=True)
+                probability = (pdf * self.prob_detect)/self.clutter_spatial_density
+
+                # True detection hypothesis
+                hypotheses.append(
+                    SingleProbabilityHypothesis(
+                        prediction,
+                        detection,
+                        probability,
+                        measurement_prediction))
 
         return MultipleHypothesis(hypotheses, normalise=True, total_weight=1)
@@ -67,3 +67,29 @@ def test_distance_include_all(predictor, updater):
     last_hypothesis = hypotheses[-1]
     assert last_hypothesis.measurement is detection3
     assert last_hypothesis.distance > hypothesiser.missed_distance
+
+
+def test_distance_multiple_timestamps(predictor, updater):
+
+    timestamp = datetime.datetime.now()
+    later_timestamp = timestamp + datetime.timedelta(seconds=1)
+    track = Track([GaussianState(np.array([[0]]), np.array([[1]]), timestamp)])
+    detection1 = Detection(np.array([[2]]), timestamp=timestamp)
+    detection2 = Detection(np.array([[3]]), timestamp=later_timestamp)
+    detection3 = Detection(np.array([[1]]), timestamp=later_timestamp)
+    detections = {detection1, detection2, detection3}
+
+    measure = measures.Mahalanobis()
+    hypothesiser = DistanceHypothesiser(
+        predictor, updater, measure=measure, missed_distance=3)
+
+    hypotheses = hypothesiser.hypothesise(track, detections, timestamp)
+
+    assert len(hypotheses) == 4
+    for hypothesis in hypotheses:
+        if hypothesis:
+            assert hypothesis.prediction.timestamp == hypothesis.measurement.timestamp
+            assert hypothesis.distance == measure(
+                hypothesis.measurement_prediction, hypothesis.measurement)
+    assert [hypothesis.distance for hypothesis in hypotheses] \
+        == sorted(hypothesis.distance for hypothesis in hypotheses)
@@ -2,11 +2,17 @@
 import datetime
 
 import numpy as np
+import pytest
 
 from ..distance import DistanceHypothesiser
 from ..gaussianmixture import GaussianMixtureHypothesiser
+from ...models.measurement.linear import LinearGaussian
+from ...models.transition.linear import (
+    CombinedLinearGaussianTransitionModel, ConstantVelocity)
+from ...predictor.kalman import KalmanPredictor
 from ...types.detection import Detection
-from ...types.state import WeightedGaussianState
+from ...types.state import TaggedWeightedGaussianState, WeightedGaussianState
+from ...updater.kalman import KalmanUpdater
 from ...types.hypothesis import SingleHypothesis
 from ...types.multihypothesis import MultipleHypothesis
 from ...types.mixture import GaussianMixture
@@ -108,3 +114,57 @@ def test_gm_ordered_by_component(predictor, updater):
     assert hypotheses[0][1].prediction.state_vector == np.array([[1.3]])
     assert hypotheses[1][0].prediction.state_vector == np.array([[6]])
     assert hypotheses[1][1].prediction.state_vector == np.array([[6]])
+
+
+@pytest.mark.parametrize('order_by_detection', [False, True], ids=['component', 'detection'])
+@pytest.mark.parametrize('include_all', [False, True], ids=['gated', 'include_all'])
+def test_gm_vectorised(order_by_detection, include_all):
+    timestamp = datetime.datetime(2020, 1, 1)
+    transition_model = CombinedLinearGaussianTransitionModel(
+        [ConstantVelocity(0.1), ConstantVelocity(0.1)])
+    measurement_model = LinearGaussian(4, [0, 2], np.diag([0.5, 0.5]))
+    random_state = np.random.RandomState(1)
+    components = [
+        TaggedWeightedGaussianState(
+            random_state.uniform(-20, 20, (4, 1)), np.diag([2, 0.5, 2, 0.5]), timestamp,
+            weight=random_state.uniform(), tag=tag)
+        for tag in [1, 2, 3, "birth", "birth"]]
+    components.append(WeightedGaussianState(
+        np.array([[0], [1], [0], [1]]), np.diag([1, 1, 1, 1]), timestamp, weight=0.5))
+    detection_time = timestamp + datetime.timedelta(seconds=1)
+    detections = {
+        Detection(random_state.uniform(-20, 20, (2, 1)), detection_time,
+                  measurement_model=measurement_model)
+        for _ in range(10)}
+
+    hypothesiser = DistanceHypothesiser(
+        KalmanPredictor(transition_model), KalmanUpdater(measurement_model),
+        measure=measures.Mahalanobis(), missed_distance=3, include_all=include_all)
+    expected_hypotheses = GaussianMixtureHypothesiser(
+        hypothesiser, order_by_detection=order_by_detection).hypothesise(
+            components, detections, detection_time)
+    hypotheses = GaussianMixtureHypothesiser(
+        hypothesiser, order_by_detection=order_by_detection, vectorised=True).hypothesise(
+            components, detections, detection_time)
+
+    assert len(hypotheses) == len(expected_hypotheses)
+    for multi_hyp, expected_multi_hyp in zip(hypotheses, expected_hypotheses):
+        assert len(multi_hyp) == len(expected_multi_hyp)
+        for hyp, expected_hyp in zip(multi_hyp, expected_multi_hyp):
+            assert type(hyp.prediction) is type(expected_hyp.prediction)
+            assert hyp.prediction.weight == expected_hyp.prediction.weight
+            if isinstance(expected_hyp.prediction, TaggedWeightedGaussianState) \
+                    and expected_hyp.prediction.tag in {1, 2, 3}:
+                assert hyp.prediction.tag == expected_hyp.prediction.tag
+            assert np.allclose(hyp.prediction.state_vector, expected_hyp.prediction.state_vector)
+            assert np.allclose(hyp.prediction.covar, expected_hyp.prediction.covar)
+            assert np.isclose(hyp.distance, expected_hyp.distance)
+            if expected_hyp:
+                assert hyp.measurement is expected_hyp.measurement
+            else:
+                assert not hyp
+
+    # Component predictions shared between detections, so can be updated together
+    for multi_hyps in (hypotheses, expected_hypotheses):
+        assert len({id(hyp.prediction)
+                    for multi_hyp in multi_hyps for hyp in multi_hyp if hyp}) <= len(components)
@@ -8,8 +8,8 @@ from ..deleter import Deleter
 from ..models.base import LinearModel, ReversibleModel
 from ..models.measurement import MeasurementModel
 from ..types.hypothesis import SingleHypothesis
-from ..types.numeric import Probability
-from ..types.particle import Particle
+from ..types.array import StateVectors
+from ..types.particle import Particles
 from ..types.state import State, GaussianState
 from ..types.track import Track
 from ..types.update import GaussianStateUpdate, ParticleStateUpdate, Update
@@ -254,14 +254,14 @@ class GaussianParticleInitiator(ParticleInitiator):
             A list of new tracks with a initial :class:`~.ParticleState`
         """
         tracks = self.initiator.initiate(detections, timestamp, **kwargs)
-        weight = Probability(1 / self.number_particles)
+        log_weight = np.full(self.number_particles, -np.log(self.number_particles))
         for track in tracks:
             samples = multivariate_normal.rvs(track.state_vector.ravel(),
                                               track.covar,
                                               size=self.number_particles)
-            particles = [
-                Particle(sample.reshape(-1, 1), weight=weight)
-                for sample in samples]
+            particles = Particles(
+                state_vector=StateVectors(samples.reshape(self.number_particles, -1).T),
+                log_weight=log_weight)
             track[-1] = ParticleStateUpdate(
                 particles,
                 track.hypothesis,
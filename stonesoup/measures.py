@@ -5,6 +5,7 @@ import numpy as np
 from scipy.spatial import distance
 
 from .base import Base, Property
+from .types.array import StateVectors
 from .types.state import State
 
 
@@ -53,6 +54,54 @@ class Measure(Base):
         """
         return NotImplementedError
 
+    def pairwise(self, states1, states2):
+        r"""
+        Compute the distance between every pair of :class:`~.State` objects from two sequences
+
+        The default implementation calls the measure for each pair in turn. Measures which can be
+        evaluated on stacked state vectors should override this.
+
+        Parameters
+        ----------
+        states1 : sequence of :class:`~.State`
+        states2 : sequence of :class:`~.State`
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (len(states1), len(states2))
+            distance measure between each pair of input :class:`~.State` objects
+
+        """
+        return np.array([[self(state1, state2) for state2 in states2] for state1 in states1],
+                        dtype=np.float_).reshape(len(states1), len(states2))
+
+    def _state_vectors(self, states2):
+        """(Mapped) state vectors of `states2` stacked, for use with :meth:`_differences`.
+
+        Returns
+        -------
+        : :class:`~.StateVectors` of shape (ndim, len(states2))
+        """
+        if self.mapping is not None:
+            return StateVectors([state2.state_vector[self.mapping2, :] for state2 in states2])
+        else:
+            return StateVectors([state2.state_vector for state2 in states2])
+
+    def _differences(self, state1, state_vectors2):
+        """Differences between the (mapped) state vector of `state1` and stacked state vectors
+        `state_vectors2` (from :meth:`_state_vectors`), calculated on state vectors so any
+        custom types (e.g. angles) are respected.
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (ndim, len(states2))
+        """
+        if self.mapping is not None:
+            u = state1.state_vector[self.mapping, :]
+        else:
+            u = state1.state_vector
+        return np.asarray(state_vectors2 - u, dtype=np.float_)
+
 
 class Euclidean(Measure):
     r"""Euclidean distance measure
@@ -88,6 +137,27 @@ class Euclidean(Measure):
         else:
             return distance.euclidean(state1.state_vector[:, 0], state2.state_vector[:, 0])
 
+    def pairwise(self, states1, states2):
+        r"""Calculate the Euclidean distance between every pair of state vectors
+
+        Parameters
+        ----------
+        states1 : sequence of :class:`~.State`
+        states2 : sequence of :class:`~.State`
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (len(states1), len(states2))
+            Euclidean distances between input :class:`~.State`
+
+        """
+        if not states2:
+            return np.empty((len(states1), 0))
+        state_vectors2 = self._state_vectors(states2)
+        return np.array([
+            np.sqrt(np.sum(self._differences(state1, state_vectors2)**2, axis=0))
+            for state1 in states1]).reshape(len(states1), len(states2))
+
 
 class EuclideanWeighted(Measure):
     r"""Weighted Euclidean distance measure
@@ -136,6 +206,29 @@ class EuclideanWeighted(Measure):
                                       state2.state_vector[:, 0],
                                       self.weighting)
 
+    def pairwise(self, states1, states2):
+        r"""Calculate the weighted Euclidean distance between every pair of state
+        objects
+
+        Parameters
+        ----------
+        states1 : sequence of :class:`~.State`
+        states2 : sequence of :class:`~.State`
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (len(states1), len(states2))
+            Weighted euclidean distances between input :class:`~.State` objects
+
+        """
+        if not states2:
+            return np.empty((len(states1), 0))
+        weighting = np.asarray(self.weighting, dtype=np.float_)[:, np.newaxis]
+        state_vectors2 = self._state_vectors(states2)
+        return np.array([
+            np.sqrt(np.sum(weighting*self._differences(state1, state_vectors2)**2, axis=0))
+            for state1 in states1]).reshape(len(states1), len(states2))
+
 
 class Mahalanobis(Measure):
     r"""Mahalanobis distance measure
@@ -183,6 +276,38 @@ class Mahalanobis(Measure):
 
         return distance.mahalanobis(u, v, vi)
 
+    def pairwise(self, states1, states2):
+        r"""Calculate the Mahalanobis distance between every pair of state objects
+
+        For each state in `states1`, the distances to all of `states2` are found with a single
+        linear solve against the covariance of that state.
+
+        Parameters
+        ----------
+        states1 : sequence of :class:`~.State`
+        states2 : sequence of :class:`~.State`
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (len(states1), len(states2))
+            Mahalanobis distances between input :class:`~.State` objects
+
+        """
+        if not states2:
+            return np.empty((len(states1), 0))
+        distances = np.empty((len(states1), len(states2)))
+        state_vectors2 = self._state_vectors(states2)
+        for i, state1 in enumerate(states1):
+            if self.mapping is not None:
+                rows = np.array(self.mapping, dtype=np.intp)
+                cov = state1.covar[rows[:, np.newaxis], rows]
+            else:
+                cov = state1.covar
+            deltas = self._differences(state1, state_vectors2)
+            distances[i] = np.sqrt(
+                np.sum(deltas * np.linalg.solve(np.asarray(cov, dtype=np.float_), deltas), axis=0))
+        return distances
+
 
 class SquaredGaussianHellinger(Measure):
     r"""Squared Gaussian Hellinger distance measure
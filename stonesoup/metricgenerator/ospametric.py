@@ -1,4 +1,6 @@
-from itertools import chain, zip_longest
+import copy
+from concurrent.futures import Executor
+from itertools import chain
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment
@@ -11,11 +13,16 @@ from ..types.time import TimeRange
 from ..types.metric import SingleTimeMetric, TimeRangeMetric
 
 
+def _compute_chunk(generator, states_at_times):
+    return [generator._compute_single_time_metric(measured_states, truth_states)
+            for measured_states, truth_states in states_at_times]
+
+
 class GOSPAMetric(MetricGenerator):
     """
     Computes the Generalized Optimal SubPattern Assignment (GOPSA) metric
     for two sets of :class:`~.Track` objects. This implementation of GOSPA
-    is based on the auction algorithm.
+    solves the assignment with :func:`~scipy.optimize.linear_sum_assignment`.
 
     The GOPSA metric is calculated at each time step in which a
     :class:`~.Track` object is present
@@ -30,6 +37,14 @@ class GOSPAMetric(MetricGenerator):
     measure: Measure = Property(
         default=Euclidean(),
         doc="Distance measure to use. Default :class:`~.measures.Euclidean()`")
+    executor: Executor = Property(
+        default=None,
+        doc="Executor (e.g. :class:`~concurrent.futures.ProcessPoolExecutor`) used to compute "
+            "metrics for chunks of timestamps in parallel. Default `None`, where timestamps are "
+            "processed sequentially.")
+    chunk_size: int = Property(
+        default=100,
+        doc="Number of timestamps in each chunk when using :attr:`executor`. Default 100.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -101,24 +116,8 @@ class GOSPAMetric(MetricGenerator):
         for the GOSPA metric at each timestamp
         """
 
-        # Make a list of all the unique timestamps used
-        # Make a sorted list of all the unique timestamps used
-        timestamps = sorted({
-            state.timestamp
-            for state in chain(measured_states, truth_states)})
-
-        gospa_metrics = []
-
-        for timestamp in timestamps:
-            meas_points = [state
-                           for state in measured_states
-                           if state.timestamp == timestamp]
-            truth_points = [state
-                            for state in truth_states
-                            if state.timestamp == timestamp]
-            metric, truth_to_measured_assignment = self.compute_gospa_metric(
-                    meas_points, truth_points)
-            gospa_metrics.append(metric)
+        timestamps, gospa_metrics = self._compute_single_time_metrics(
+            measured_states, truth_states)
 
         # If only one timestamp is present then return a SingleTimeMetric
         if len(timestamps) == 1:
@@ -130,6 +129,55 @@ class GOSPAMetric(MetricGenerator):
                 time_range=TimeRange(min(timestamps), max(timestamps)),
                 generator=self)
 
+    @staticmethod
+    def _states_by_timestamp(measured_states, truth_states):
+        """Group measured and truth states by timestamp, in a single pass over each
+
+        Returns
+        -------
+        : list of :class:`datetime.datetime`
+            Sorted unique timestamps
+        : list of (list of :class:`~.State`, list of :class:`~.State`)
+            Measured and truth states at each timestamp
+        """
+        states_by_timestamp = {}
+        for index, states in enumerate((measured_states, truth_states)):
+            for state in states:
+                states_by_timestamp.setdefault(state.timestamp, ([], []))[index].append(state)
+        timestamps = sorted(states_by_timestamp)
+        return timestamps, [states_by_timestamp[timestamp] for timestamp in timestamps]
+
+    def _compute_single_time_metric(self, measured_states, truth_states):
+        metric, _ = self.compute_gospa_metric(measured_states, truth_states)
+        return metric
+
+    def _compute_single_time_metrics(self, measured_states, truth_states):
+        """Compute metric at every timestamp, in parallel chunks if :attr:`executor` set
+
+        Returns
+        -------
+        : list of :class:`datetime.datetime`
+            Sorted unique timestamps
+        : list of :class:`~.SingleTimeMetric`
+            Metric at each timestamp
+        """
+        timestamps, states_at_times = self._states_by_timestamp(measured_states, truth_states)
+        if self.executor is None:
+            return timestamps, _compute_chunk(self, states_at_times)
+
+        # Copy without executor, which can't be passed to other processes
+        generator = copy.copy(self)
+        generator.executor = None
+        futures = [
+            self.executor.submit(
+                _compute_chunk, generator, states_at_times[index:index+self.chunk_size])
+            for index in range(0, len(states_at_times), self.chunk_size)]
+        metrics = [metric for future in futures for metric in future.result()]
+        for metric in metrics:
+            # Generator is a copy if computed in another process
+            metric.generator = self
+        return timestamps, metrics
+
     def compute_assignments(self, cost_matrix, max_iter):
         """Compute assignments using Auction Algorithm.
 
@@ -255,14 +303,10 @@ class GOSPAMetric(MetricGenerator):
 
         cost_matrix = np.full((m, n), self.c, dtype=np.float_)  # c could be int, so force to float
 
-        for i_track, track_state, in zip_longest(range(m), track_states):
-            for i_truth, truth_state in zip_longest(range(n), truth_states):
-                if None in (track_state, truth_state):
-                    continue
-
-                distance = self.measure(track_state, truth_state)
-                if distance < self.c:
-                    cost_matrix[i_track, i_truth] = distance
+        if track_states and truth_states:
+            distances = self.measure.pairwise(track_states, truth_states)
+            cost_matrix[:len(track_states), :len(truth_states)] = np.where(
+                distances < self.c, distances, self.c)
 
         return cost_matrix
 
@@ -315,12 +359,14 @@ class GOSPAMetric(MetricGenerator):
             if self.alpha == 2:
                 gospa_metric['missed'] = opt_cost
         else:
-            # Use auction algorithm when both truth_states
+            # Solve assignment when both truth_states
             # and measured_states are non-empty
             cost_matrix = -1. * np.power(cost_matrix, self.p)
-            truth_to_measured_assignment, measured_to_truth_assignment, _ =\
-                self.compute_assignments(cost_matrix,
-                                         10 * num_truth_states * num_measured_states)
+            truth_indices, measured_indices = linear_sum_assignment(cost_matrix, maximize=True)
+            truth_to_measured_assignment = np.full((num_truth_states, ), unassigned_index)
+            truth_to_measured_assignment[truth_indices] = measured_indices
+            measured_to_truth_assignment = np.full((num_measured_states, ), unassigned_index)
+            measured_to_truth_assignment[measured_indices] = truth_indices
             # Now use assignments to compute bids
             for i in range(num_truth_states):
                 if truth_to_measured_assignment[i] != unassigned_index:
@@ -396,22 +442,8 @@ class OSPAMetric(GOSPAMetric):
             each timestamp
         """
 
-        # Make a sorted list of all the unique timestamps used
-        timestamps = sorted({
-            state.timestamp
-            for state in chain(measured_states, truth_states)})
-
-        ospa_distances = []
-
-        for timestamp in timestamps:
-            meas_points = [state
-                           for state in measured_states
-                           if state.timestamp == timestamp]
-            truth_points = [state
-                            for state in truth_states
-                            if state.timestamp == timestamp]
-            ospa_distances.append(
-                self.compute_OSPA_distance(meas_points, truth_points))
+        timestamps, ospa_distances = self._compute_single_time_metrics(
+            measured_states, truth_states)
 
         # If only one timestamp is present then return a SingleTimeMetric
         if len(timestamps) == 1:
@@ -423,6 +455,9 @@ class OSPAMetric(GOSPAMetric):
                 time_range=TimeRange(min(timestamps), max(timestamps)),
                 generator=self)
 
+    def _compute_single_time_metric(self, measured_states, truth_states):
+        return self.compute_OSPA_distance(measured_states, truth_states)
+
     def compute_OSPA_distance(self, track_states, truth_states):
         r"""
         Computes the Optimal SubPattern Assignment (OPSA) metric for a single
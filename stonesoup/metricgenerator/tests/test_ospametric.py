@@ -1,5 +1,7 @@
 """GOSPA/OSPA tests."""
 import datetime
+import itertools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 import numpy as np
 import pytest
@@ -341,3 +343,55 @@ def test_ospa_computemetric_cardinality_error(p, first_value, second_value):
     assert second_association.value == pytest.approx(second_value)
     assert second_association.timestamp == time + datetime.timedelta(seconds=1)
     assert second_association.generator == generator
+
+
+@pytest.mark.parametrize('generator_class', [GOSPAMetric, OSPAMetric])
+@pytest.mark.parametrize(
+    'executor', [ThreadPoolExecutor, ProcessPoolExecutor], ids=['thread', 'process'])
+def test_metric_executor(generator_class, executor):
+    time = datetime.datetime.now()
+    random_state = np.random.RandomState(1)
+    tracks = {Track(states=[State(state_vector=random_state.rand(2, 1)*10,
+                                  timestamp=time + datetime.timedelta(seconds=j))
+                            for j in range(i, 25)])
+              for i in range(8)}
+    truths = {GroundTruthPath(states=[
+        GroundTruthState(state_vector=random_state.rand(2, 1)*10,
+                         timestamp=time + datetime.timedelta(seconds=j))
+        for j in range(25 - i)])
+        for i in range(6)}
+    manager = SimpleManager()
+    manager.add_data(truths, tracks)
+
+    expected_metric = generator_class(c=5, p=2).compute_metric(manager)
+    with executor(max_workers=2) as pool:
+        generator = generator_class(c=5, p=2, executor=pool, chunk_size=4)
+        metric = generator.compute_metric(manager)
+
+    assert len(metric.value) == len(expected_metric.value) == 25
+    for single_time_metric, expected_single_time_metric in zip(
+            metric.value, expected_metric.value):
+        assert single_time_metric.timestamp == expected_single_time_metric.timestamp
+        assert single_time_metric.generator is generator
+        assert single_time_metric.value == expected_single_time_metric.value
+
+
+def test_gospametric_optimal_assignment():
+    generator = GOSPAMetric(c=3, p=2)
+    time = datetime.datetime.now()
+    random_state = np.random.RandomState(2)
+    measured_states = [State(random_state.rand(2, 1)*5, time) for _ in range(6)]
+    truth_states = [State(random_state.rand(2, 1)*5, time) for _ in range(4)]
+
+    metric, truth_to_measured = generator.compute_gospa_metric(measured_states, truth_states)
+
+    # Should match minimum over all assignments of truths to measured states
+    cost_matrix = generator.compute_cost_matrix(truth_states, measured_states)**generator.p
+    dummy_cost = generator.c**generator.p / 2
+    best_cost = min(
+        np.sum(cost_matrix[np.arange(len(truth_states)), assignment])
+        + (len(measured_states) - len(truth_states)) * dummy_cost
+        for assignment in itertools.permutations(range(len(measured_states)),
+                                                 len(truth_states)))
+    assert metric.value['distance'] == pytest.approx(best_cost**(1/generator.p))
+    assert sorted(truth_to_measured) == sorted(set(truth_to_measured))
@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
+import datetime
 
 import numpy as np
+import pytest
 
 from ..tracktotruthmetrics import SIAPMetrics, IDSIAPMetrics
 from ...measures import Euclidean
+from ...types.association import TimeRangeAssociation
 from ...types.groundtruth import GroundTruthPath
 from ...types.metric import SingleTimeMetric, TimeRangeMetric
+from ...types.time import TimeRange
 from ...types.track import Track
 
 
@@ -186,3 +190,33 @@ def test_id_siap(trial_manager, trial_truths, trial_tracks, trial_associations):
                 assert thing.generator == siap_generator
         else:
             assert isinstance(metric.value, (float, int))
+
+
+def _metric_values(metric):
+    if isinstance(metric.value, list):
+        return [(thing.timestamp, thing.value) for thing in metric.value]
+    return metric.value
+
+
+@pytest.mark.parametrize('generator_class', [SIAPMetrics, IDSIAPMetrics])
+def test_siap_single_pass(
+        generator_class, trial_manager, trial_truths, trial_tracks, trial_timestamps):
+    kwargs = {'position_measure': Euclidean((0, 2)), 'velocity_measure': Euclidean((1, 3))}
+    if generator_class is IDSIAPMetrics:
+        kwargs.update(truth_id="colour", track_id="colour")
+    # Include association which extends beyond truth and track states
+    truth, track = trial_truths[2], trial_tracks[2]
+    trial_manager.association_set.associations.add(TimeRangeAssociation(
+        {truth, track},
+        TimeRange(trial_timestamps[3], trial_timestamps[3] + datetime.timedelta(seconds=1))))
+
+    metrics = generator_class(**kwargs).compute_metric(trial_manager)
+    single_pass_metrics = generator_class(**kwargs, single_pass=True).compute_metric(
+        trial_manager)
+
+    assert [metric.title for metric in metrics] \
+        == [metric.title for metric in single_pass_metrics]
+    for metric, single_pass_metric in zip(metrics, single_pass_metrics):
+        assert metric.time_range.start_timestamp == single_pass_metric.time_range.start_timestamp
+        assert metric.time_range.end_timestamp == single_pass_metric.time_range.end_timestamp
+        assert _metric_values(metric) == _metric_values(single_pass_metric)
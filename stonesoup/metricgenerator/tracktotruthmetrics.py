@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import math
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from operator import attrgetter
 
 from .base import MetricGenerator
@@ -9,6 +12,16 @@ from ..types.time import TimeRange
 from ..types.track import Track
 
 
+class _TimestampBucket:
+    """Number of truths and tracks, and the associations, at a single timestamp"""
+    __slots__ = ('num_truths', 'num_tracks', 'associations')
+
+    def __init__(self):
+        self.num_truths = 0
+        self.num_tracks = 0
+        self.associations = []
+
+
 class SIAPMetrics(MetricGenerator):
     r"""SIAP Metrics
 
@@ -40,6 +53,12 @@ class SIAPMetrics(MetricGenerator):
           track segment per truth. The output is a float (seconds), with a target score equal to
           the sum of all true object lifetimes.
 
+    By default, the metrics at each timestamp are calculated by searching all tracks, truths and
+    associations at each timestamp, using the methods such as :meth:`num_truths_at_time`. With
+    :attr:`single_pass` enabled, tracks, truths and associations are instead swept once, sorting
+    them into buckets per timestamp, from which all the metrics are calculated. This gives
+    identical results, but scales far better with the number of timestamps.
+
     Reference
         [1] Single Integrated Air Picture (SIAP) Metrics Implementation, Votruba et al, 29-10-2001
     """
@@ -48,6 +67,12 @@ class SIAPMetrics(MetricGenerator):
         doc="Distance measure used in calculating position accuracy scores.")
     velocity_measure: Measure = Property(
         doc="Distance measure used in calculating velocity accuracy scores.")
+    single_pass: bool = Property(
+        default=False,
+        doc="Whether to calculate metrics at each timestamp from buckets of tracks, truths and "
+            "associations per timestamp, formed in a single pass over them. Note that the "
+            "methods calculating values at a given timestamp (e.g. :meth:`num_truths_at_time`) "
+            "are not used in this mode. Default `False`.")
 
     def compute_metric(self, manager, **kwargs):
         r"""Compute metrics:
@@ -92,18 +117,17 @@ class SIAPMetrics(MetricGenerator):
 
         J_sum = JT_sum = NA_sum = N_sum = PA_sum = VA_sum = 0
 
-        for timestamp in timestamps:
-            Jt = self.num_truths_at_time(manager, timestamp)
+        if self.single_pass:
+            values_at_times = self._values_from_buckets(manager, timestamps)
+        else:
+            values_at_times = self._values_at_times(manager, timestamps)
+
+        for timestamp, (Jt, JTt, NAt, Nt, PAt, VAt) in zip(timestamps, values_at_times):
             J_sum += Jt
-            JTt = self.num_associated_truths_at_time(manager, timestamp)
             JT_sum += JTt
-            NAt = self.num_associated_tracks_at_time(manager, timestamp)
             NA_sum += NAt
-            Nt = self.num_tracks_at_time(manager, timestamp)
             N_sum += Nt
-            PAt = self.accuracy_at_time(manager, timestamp, self.position_measure)
             PA_sum += PAt
-            VAt = self.accuracy_at_time(manager, timestamp, self.velocity_measure)
             VA_sum += VAt
 
             completeness_at_times.append(
@@ -197,6 +221,76 @@ class SIAPMetrics(MetricGenerator):
                 rate_track_num, longest_track_seg, completeness_at_times, ambiguity_at_times,
                 spuriousness_at_times, position_accuracy_at_times, velocity_accuracy_at_times]
 
+    def _values_at_times(self, manager, timestamps):
+        """Yield :math:`J(t)`, :math:`JT(t)`, :math:`NA(t)`, :math:`N(t)`, :math:`PA(t)` and
+        :math:`VA(t)` for each timestamp, searching `manager` data at each timestamp."""
+        for timestamp in timestamps:
+            yield (self.num_truths_at_time(manager, timestamp),
+                   self.num_associated_truths_at_time(manager, timestamp),
+                   self.num_associated_tracks_at_time(manager, timestamp),
+                   self.num_tracks_at_time(manager, timestamp),
+                   self.accuracy_at_time(manager, timestamp, self.position_measure),
+                   self.accuracy_at_time(manager, timestamp, self.velocity_measure))
+
+    def _values_from_buckets(self, manager, timestamps):
+        """Yield :math:`J(t)`, :math:`JT(t)`, :math:`NA(t)`, :math:`N(t)`, :math:`PA(t)` and
+        :math:`VA(t)` for each timestamp, from buckets formed in a single pass over `manager`
+        data."""
+        buckets = self._timestamp_buckets(manager, timestamps)
+        # Counts, as truths and tracks may be a sequence rather than a set
+        truth_counts = Counter(manager.groundtruth_paths)
+        track_counts = Counter(manager.tracks)
+        for timestamp in timestamps:
+            bucket = buckets[timestamp]
+            association_objects = {
+                thing for assoc in bucket.associations for thing in assoc.objects}
+            state_pairs = []
+            for association in bucket.associations:
+                truth, track = self.truth_track_from_association(association)
+                state_pairs.append((truth[timestamp], track[timestamp]))
+            yield (bucket.num_truths,
+                   sum(truth_counts[thing] for thing in association_objects),
+                   sum(track_counts[thing] for thing in association_objects),
+                   bucket.num_tracks,
+                   math.fsum(self.position_measure(*pair) for pair in state_pairs),
+                   math.fsum(self.velocity_measure(*pair) for pair in state_pairs))
+
+    @staticmethod
+    def _timestamp_buckets(manager, timestamps):
+        """Sort truths, tracks and associations held by `manager` into buckets for each of the
+        sorted `timestamps`, in a single pass over them.
+
+        Returns
+        -------
+        dict of :class:`datetime.datetime`: _TimestampBucket
+            Bucket for each timestamp
+        """
+        buckets = {timestamp: _TimestampBucket() for timestamp in timestamps}
+        for truth in manager.groundtruth_paths:
+            for timestamp in {state.timestamp for state in truth}:
+                buckets[timestamp].num_truths += 1
+        for track in manager.tracks:
+            for timestamp in {state.timestamp for state in track.states}:
+                buckets[timestamp].num_tracks += 1
+
+        for association in manager.association_set:
+            if hasattr(association, "timestamp"):
+                association_timestamps = [association.timestamp]
+            elif getattr(association, "time_range", None) is not None:
+                # Time range inclusive of start and end
+                association_timestamps = timestamps[
+                    bisect_left(timestamps, association.time_range.start_timestamp):
+                    bisect_right(timestamps, association.time_range.end_timestamp)]
+            else:
+                association_timestamps = [
+                    timestamp for timestamp in timestamps
+                    if timestamp in association.time_range]
+            for timestamp in association_timestamps:
+                bucket = buckets.get(timestamp)
+                if bucket is not None:
+                    bucket.associations.append(association)
+        return buckets
+
     @staticmethod
     def num_truths_at_time(manager, timestamp):
         """:math:`J(t)`. Calculate the number of true objects held by `manager` at `timestamp`.
@@ -307,11 +401,12 @@ class SIAPMetrics(MetricGenerator):
             would be to consider each true object and track at most once.
         """
         associations = manager.association_set.associations_at_timestamp(timestamp)
-        error_sum = 0
+        errors = []
         for association in associations:
             truth, track = self.truth_track_from_association(association)
-            error_sum += measure(truth[timestamp], track[timestamp])
-        return error_sum
+            errors.append(measure(truth[timestamp], track[timestamp]))
+        # Accurate sum, such that result is independent of order of associations
+        return math.fsum(errors)
 
     @staticmethod
     def truth_track_from_association(association):
@@ -554,10 +649,13 @@ class IDSIAPMetrics(SIAPMetrics):
 
         JT_sum = JU_sum = JC_sum = JI_sum = JA_sum = 0
 
-        for timestamp in timestamps:
-            JTt = self.num_associated_truths_at_time(manager, timestamp)
+        if self.single_pass:
+            id_values_at_times = self._id_values_from_buckets(manager, timestamps)
+        else:
+            id_values_at_times = self._id_values_at_times(manager, timestamps)
+
+        for timestamp, (JTt, JUt, JCt, JIt) in zip(timestamps, id_values_at_times):
             JT_sum += JTt
-            JUt, JCt, JIt = self.num_id_truths_at_time(manager, timestamp)
             JU_sum += JUt
             JC_sum += JCt
             JI_sum += JIt
@@ -615,6 +713,62 @@ class IDSIAPMetrics(SIAPMetrics):
                         id_completeness_at_times, id_correctness_at_times, id_ambiguity_at_times])
         return metrics
 
+    def _id_values_at_times(self, manager, timestamps):
+        """Yield :math:`JT(t)`, :math:`JU(t)`, :math:`JC(t)` and :math:`JI(t)` for each
+        timestamp, searching `manager` data at each timestamp."""
+        for timestamp in timestamps:
+            yield (self.num_associated_truths_at_time(manager, timestamp),
+                   *self.num_id_truths_at_time(manager, timestamp))
+
+    def _id_values_from_buckets(self, manager, timestamps):
+        """Yield :math:`JT(t)`, :math:`JU(t)`, :math:`JC(t)` and :math:`JI(t)` for each
+        timestamp, from buckets formed in a single pass over `manager` data."""
+        buckets = self._timestamp_buckets(manager, timestamps)
+        truth_counts = Counter(manager.groundtruth_paths)
+        track_ids = {}  # Track to mapping of timestamp to track ID
+        for timestamp in timestamps:
+            truth_tracks = {}
+            for association in buckets[timestamp].associations:
+                _, track = self.truth_track_from_association(association)
+                for thing in association.objects:
+                    if thing in truth_counts:
+                        truth_tracks.setdefault(thing, []).append(track)
+
+            counts = Counter()
+            for truth, tracks in truth_tracks.items():
+                truth_id = truth.metadata.get(self.truth_id)
+                ids = [self._bucketed_track_id(track, timestamp, track_ids) for track in tracks]
+                counts[self._id_assignment(truth_id, ids)] += truth_counts[truth]
+
+            yield (sum(truth_counts[truth] for truth in truth_tracks),
+                   counts['unknown'], counts['correct'], counts['incorrect'])
+
+    def _bucketed_track_id(self, track, timestamp, track_ids):
+        try:
+            ids = track_ids[track]
+        except KeyError:
+            # Later states take precedence, as when indexing track by timestamp
+            ids = track_ids[track] = {
+                state.timestamp: metadata.get(self.track_id)
+                for state, metadata in zip(track.states, track.metadatas)}
+        try:
+            return ids[timestamp]
+        except KeyError:
+            return self.find_track_id(track, timestamp)
+
+    @staticmethod
+    def _id_assignment(truth_id, track_ids):
+        """Whether `track_ids` associated with a truth are unknown, correct or incorrect for
+        `truth_id`, or `None` if ambiguous."""
+        if all(track_id is None for track_id in track_ids):
+            return 'unknown'
+        elif (all(track_id == truth_id and track_id is not None for track_id in track_ids)
+              and truth_id is not None):
+            return 'correct'
+        elif all(track_id != truth_id and track_id is not None for track_id in track_ids):
+            return 'incorrect'
+        return None
+
     def find_track_id(self, track, timestamp):
         """Find `track` ID at `timestamp`.
 
@@ -684,12 +838,12 @@ class IDSIAPMetrics(SIAPMetrics):
 
                 track_ids.append(self.find_track_id(track, timestamp))
 
-            if all(track_id is None for track_id in track_ids):
+            assignment = self._id_assignment(truth_id, track_ids)
+            if assignment == 'unknown':
                 unknown_count += 1
-            elif (all(track_id == truth_id and track_id is not None for track_id in track_ids)
-                  and truth_id is not None):
+            elif assignment == 'correct':
                 correct_count += 1
-            elif all(track_id != truth_id and track_id is not None for track_id in track_ids):
+            elif assignment == 'incorrect':
                 incorrect_count += 1
 
         return unknown_count, correct_count, incorrect_count
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
-from scipy.spatial import distance as dist
+import numpy as np
+from scipy.spatial import distance as dist, KDTree
 import uuid
 
 from ..base import Property
 from .base import MixtureReducer
+from ..functions import gm_reduce_single
+from ..types.array import StateVectors
 from ..types.state import TaggedWeightedGaussianState, WeightedGaussianState
 from operator import attrgetter
 
@@ -31,6 +34,19 @@ class GaussianMixtureReducer(MixtureReducer):
     merge_threshold: float = Property(default=16, doc='Threshold for merging')
     merging: bool = Property(default=True, doc='Flag for merging')
     pruning: bool = Property(default=True, doc='Flag for pruning')
+    batched: bool = Property(
+        default=False,
+        doc="Flag for merging with :meth:`merge_batched`, operating on stacked means and "
+            "covariances, rather than :meth:`merge`. Default `False`.")
+    kdtree_max_distance: float = Property(
+        default=None,
+        doc="Maximum Euclidean distance between means for a component to be considered for "
+            "merging, using a k-d tree to find candidates, when :attr:`batched` is `True`. "
+            "Default `None`, where all remaining components are considered.")
+    max_number_components: int = Property(
+        default=None,
+        doc="Maximum number of components to keep after pruning and merging, where the highest "
+            "weighted are kept. Default `None`, where number of components is not limited.")
 
     def reduce(self, components_list):
         """
@@ -52,7 +68,15 @@ class GaussianMixtureReducer(MixtureReducer):
             if self.pruning:
                 components_list = self.prune(components_list)
             if len(components_list) > 1 & self.merging:
-                components_list = self.merge(components_list)
+                if self.batched:
+                    components_list = self.merge_batched(components_list)
+                else:
+                    components_list = self.merge(components_list)
+            if self.max_number_components is not None \
+                    and len(components_list) > self.max_number_components:
+                components_list = sorted(
+                    components_list, key=attrgetter('weight'),
+                    reverse=True)[:self.max_number_components]
         return components_list
 
     def prune(self, components_list):
@@ -153,24 +177,117 @@ class GaussianMixtureReducer(MixtureReducer):
             components_list, key=attrgetter('weight'))
 
         merged_components = []
-        final_merged_components = []
         while remaining_components:
             # Get highest weighted component
             best_component = remaining_components.pop()
+            inverse_covar = np.linalg.inv(best_component.covar)
             # Check for similar components
             # (modifying list in loop, so copy used)
             for component in remaining_components.copy():
                 # Calculate distance between component and best component
                 distance = dist.mahalanobis(
-                    best_component.mean[:, 0], component.mean[:, 0], best_component.covar)
+                    best_component.mean[:, 0], component.mean[:, 0], inverse_covar)
                 # Merge if similar
                 if distance < self.merge_threshold:
                     remaining_components.remove(component)
                     best_component = self.merge_components(
                         best_component, component
                     )
+                    inverse_covar = np.linalg.inv(best_component.covar)
             # Add potentially merged component to new mixture
             merged_components.append(best_component)
+        # Assign merged components to the mixture
+        return self._unique_tags(merged_components)
+
+    def merge_batched(self, components_list):
+        """
+        Merging is the act of combining similar components in the mixture
+        that fall with a distance threshold :attr:`merge_threshold` into
+        a single component.
+
+        This operates on stacked means and covariances, as in [1]. Distances
+        from the highest weighted remaining component to all other remaining
+        components are calculated together, and all those within the
+        threshold are merged in a single moment matching step with
+        :func:`~.gm_reduce_single`. Unlike :meth:`merge`, the highest
+        weighted component isn't updated as each component is merged into it,
+        so results may differ slightly. Candidates can be limited with a k-d
+        tree, by setting :attr:`kdtree_max_distance`.
+
+        Parameters
+        ----------
+        components_list : :class:`~.list`
+            Components of the Gaussian Mixture to be merged
+
+        Returns
+        -------
+        :class:`~.list`
+            Merged components
+
+        """
+        components_list = list(components_list)
+        means = StateVectors([component.state_vector for component in components_list])
+        covars = np.stack([component.covar for component in components_list], axis=2)
+        weights = np.array([float(component.weight) for component in components_list])
+
+        if self.kdtree_max_distance is not None:
+            tree = KDTree(np.asarray(means, dtype=np.float_).T)
+        else:
+            tree = None
+
+        remaining = np.ones(len(components_list), dtype=bool)
+        merged_components = []
+        # Highest weighted first, in same order as merge
+        for index in reversed(sorted(range(len(components_list)),
+                                     key=lambda index: components_list[index].weight)):
+            if not remaining[index]:
+                continue
+            best_component = components_list[index]
+            if tree is not None:
+                candidates = np.array(
+                    tree.query_ball_point(
+                        np.asarray(best_component.state_vector, dtype=np.float_).ravel(),
+                        self.kdtree_max_distance),
+                    dtype=int)
+                candidates = candidates[remaining[candidates]]
+            else:
+                candidates = np.flatnonzero(remaining)
+
+            # Mahalanobis distances as merge, using best component covariance, with a single
+            # solve for all candidates
+            differences = np.asarray(
+                means[:, candidates] - best_component.state_vector, dtype=np.float_)
+            distances = np.sqrt(np.einsum(
+                'ij,ij->j', differences,
+                np.linalg.solve(np.asarray(best_component.covar, dtype=np.float_), differences)))
+            cluster = candidates[(distances < self.merge_threshold) | (candidates == index)]
+            remaining[cluster] = False
+
+            if len(cluster) == 1:
+                merged_components.append(best_component)
+                continue
+            merged_mean, merged_covar = gm_reduce_single(
+                means[:, cluster], covars[:, :, cluster], weights[cluster])
+            merged_weight = min(np.sum(weights[cluster]), 1)
+            if isinstance(best_component, TaggedWeightedGaussianState):
+                merged_components.append(TaggedWeightedGaussianState(
+                    state_vector=merged_mean,
+                    covar=merged_covar,
+                    weight=merged_weight,
+                    tag=best_component.tag,
+                    timestamp=best_component.timestamp))
+            else:
+                merged_components.append(WeightedGaussianState(
+                    state_vector=merged_mean,
+                    covar=merged_covar,
+                    weight=merged_weight,
+                    timestamp=best_component.timestamp))
+
+        return self._unique_tags(merged_components)
+
+    @staticmethod
+    def _unique_tags(merged_components):
+        final_merged_components = []
         if all(isinstance(component, TaggedWeightedGaussianState)
                for component in merged_components):
             # Check for duplicate tags
@@ -195,5 +312,4 @@ class GaussianMixtureReducer(MixtureReducer):
         else:
             # Just weighted components (no tags)
             final_merged_components.extend(merged_components)
-        # Assign merged components to the mixture
         return final_merged_components
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
+from operator import attrgetter
+
 import numpy as np
+import pytest
+from scipy.spatial import distance
 
 from stonesoup.mixturereducer.gaussianmixture import GaussianMixtureReducer
 from stonesoup.types.mixture import GaussianMixture
@@ -65,3 +69,78 @@ def test_gaussianmixture_reducer():
                                             merge_threshold=merge_threshold)
     reduced_mixture_state = mixturereducer.reduce(mixturestate)
     assert len(reduced_mixture_state) == 1
+
+
+@pytest.mark.parametrize('kdtree_max_distance', [None, 5])
+def test_gaussianmixture_reducer_batched(kdtree_max_distance):
+    random_state = np.random.RandomState(1)
+    dim = 4
+    # Well separated clusters of components
+    centres = [np.array([[0], [0], [0], [0]]), np.array([[50], [0], [50], [0]]),
+               np.array([[0], [50], [0], [50]])]
+    components = [
+        TaggedWeightedGaussianState(
+            state_vector=centre + random_state.rand(dim, 1),
+            covar=np.eye(dim)*random_state.uniform(1, 2),
+            weight=random_state.uniform(0.01, 0.1),
+            tag=i)
+        for i, centre in enumerate(centres*10)]
+    weight_sums = [sum(component.weight for component in components[i::3]) for i in range(3)]
+
+    mixturereducer = GaussianMixtureReducer(merge_threshold=16)
+    batched_mixturereducer = GaussianMixtureReducer(
+        merge_threshold=16, batched=True, kdtree_max_distance=kdtree_max_distance)
+    reduced_components = sorted(mixturereducer.reduce(components), key=attrgetter('weight'))
+    batched_reduced_components = sorted(
+        batched_mixturereducer.reduce(components), key=attrgetter('weight'))
+
+    assert len(reduced_components) == len(batched_reduced_components) == 3
+    for component, batched_component in zip(reduced_components, batched_reduced_components):
+        assert isinstance(batched_component, TaggedWeightedGaussianState)
+        assert batched_component.tag == component.tag
+        assert np.isclose(batched_component.weight, component.weight)
+        assert np.allclose(batched_component.state_vector, component.state_vector)
+        assert np.allclose(batched_component.covar, component.covar)
+    assert np.allclose(sorted(weight_sums),
+                       [component.weight for component in batched_reduced_components])
+
+
+@pytest.mark.parametrize('batched', [False, True])
+@pytest.mark.parametrize(
+    'best_covar, offset', [(100, 15), (0.01, 1)], ids=['broad', 'narrow'])
+def test_gaussianmixture_reducer_mahalanobis(batched, best_covar, offset):
+    best_component = WeightedGaussianState(
+        state_vector=np.array([[0], [0]]), covar=np.eye(2)*best_covar, weight=0.5)
+    component = WeightedGaussianState(
+        state_vector=np.array([[offset], [0]]), covar=np.eye(2), weight=0.1)
+    merge_threshold = 4
+
+    # Distance using inverse of best component covariance
+    mahalanobis_distance = distance.mahalanobis(
+        best_component.state_vector.ravel(), component.state_vector.ravel(),
+        np.linalg.inv(best_component.covar))
+    assert np.isclose(mahalanobis_distance, offset / np.sqrt(best_covar))
+
+    mixturereducer = GaussianMixtureReducer(merge_threshold=merge_threshold, batched=batched)
+    reduced_components = mixturereducer.reduce([best_component, component])
+    if mahalanobis_distance < merge_threshold:
+        assert len(reduced_components) == 1
+        assert np.isclose(reduced_components[0].weight, 0.6)
+    else:
+        assert len(reduced_components) == 2
+
+
+def test_gaussianmixture_reducer_max_components():
+    components = [
+        WeightedGaussianState(
+            state_vector=np.array([[i*100], [0]]), covar=np.eye(2), weight=0.1 + i/100)
+        for i in range(10)]
+
+    mixturereducer = GaussianMixtureReducer(max_number_components=4)
+    reduced_components = mixturereducer.reduce(components)
+    assert len(reduced_components) == 4
+    assert {component.weight for component in reduced_components} \
+        == {component.weight for component in components[6:]}
+
+    mixturereducer = GaussianMixtureReducer(max_number_components=4, batched=True)
+    assert len(mixturereducer.reduce(components)) == 4
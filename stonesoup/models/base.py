@@ -103,6 +103,30 @@ class Model(Base):
         """
         raise NotImplementedError
 
+    def logpdf(self, state1: State, state2: State, **kwargs) -> Union[float, np.ndarray]:
+        r"""Model log pdf/likelihood evaluation function
+
+        Evaluates the natural log of the pdf/likelihood of ``state1``, given the state
+        ``state2`` which is passed to :meth:`function()`.
+
+        The default implementation takes the log of the output of :meth:`pdf`, so models which
+        can evaluate the log likelihood directly should override this.
+
+        Parameters
+        ----------
+        state1 : State
+        state2 : State
+
+        Returns
+        -------
+        : float or :class:`~.numpy.ndarray` of float
+            The log likelihood of ``state1``, given ``state2``
+        """
+        likelihood = self.pdf(state1, state2, **kwargs)
+        if np.ndim(likelihood) == 0:
+            return Probability._log(likelihood)
+        return np.array([Probability._log(value) for value in likelihood], dtype=np.float64)
+
 
 class LinearModel(Model):
     """LinearModel class
@@ -279,6 +303,37 @@ class GaussianModel(Model):
             The likelihood of ``state1``, given ``state2``
         """
 
+        log_likelihood = np.atleast_1d(self._gaussian_logpdf(state1, state2, **kwargs))
+        likelihood = np.array([Probability(value, log_value=True) for value in log_likelihood])
+
+        if len(likelihood) == 1:
+            likelihood = likelihood[0]
+
+        return likelihood
+
+    def logpdf(self, state1: State, state2: State, **kwargs) -> Union[float, np.ndarray]:
+        r"""Model log pdf/likelihood evaluation function
+
+        Evaluates the natural log of the pdf/likelihood of ``state1``, given the state
+        ``state2`` which is passed to :meth:`function()`, without creating
+        :class:`~.Probability` objects.
+
+        Parameters
+        ----------
+        state1 : State
+        state2 : State
+
+        Returns
+        -------
+        : float or :class:`~.numpy.ndarray` of float
+            The log likelihood of ``state1``, given ``state2``
+        """
+        if type(self).pdf is not GaussianModel.pdf:
+            # Subclass has non-Gaussian likelihood, so use log of its pdf
+            return super().logpdf(state1, state2, **kwargs)
+        return self._gaussian_logpdf(state1, state2, **kwargs)
+
+    def _gaussian_logpdf(self, state1, state2, **kwargs):
         covar = self.covar(**kwargs)
 
         # If model has None-type covariance or contains None, it does not represent a Gaussian
@@ -287,15 +342,14 @@ class GaussianModel(Model):
 
         # Calculate difference before to handle custom types (mean defaults to zero)
         # This is required as log pdf coverts arrays to floats
-        likelihood = np.array([Probability(value, log_value=True)
-                               for value in np.atleast_1d(multivariate_normal.logpdf(
-                                  (state1.state_vector - self.function(state2, **kwargs)).T,
-                                  cov=covar))])
+        log_likelihood = np.atleast_1d(multivariate_normal.logpdf(
+            (state1.state_vector - self.function(state2, **kwargs)).T,
+            cov=covar))
 
-        if len(likelihood) == 1:
-            likelihood = likelihood[0]
+        if len(log_likelihood) == 1:
+            log_likelihood = log_likelihood[0]
 
-        return likelihood
+        return log_likelihood
 
     @abstractmethod
     def covar(self, **kwargs) -> CovarianceMatrix:
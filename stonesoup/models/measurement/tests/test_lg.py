@@ -65,6 +65,10 @@ def test_lgmodel(H, R, ndim_state, mapping):
         meas_pred_wo_noise.T,
         mean=np.array(H@state_vec).ravel(),
         cov=R)
+    assert approx(lg.logpdf(State(meas_pred_wo_noise), state)) == multivariate_normal.logpdf(
+        meas_pred_wo_noise.T,
+        mean=np.array(H@state_vec).ravel(),
+        cov=R)
 
     # Propagate a state vector through the model
     # (with internal noise)
@@ -98,7 +98,8 @@ class ConstantTurn(GaussianTransitionModel, TimeVariantModel):
     def function(self, state, noise=False, **kwargs) -> StateVector:
         time_interval_sec = kwargs['time_interval'].total_seconds()
         sv1 = state.state_vector
-        turn_rate = sv1[4, :]
+        # Copy so patching zero turn rates doesn't modify the caller's state
+        turn_rate = sv1[4, :].copy()
         # Avoid divide by zero in the function evaluation
         turn_rate[turn_rate == 0.] = np.finfo(float).eps
         dAngle = turn_rate * time_interval_sec
@@ -5,23 +5,26 @@ from ..types.state import StateMutableSequence
 
 
 def predict_lru_cache(*args, **kwargs):
-    """LRU Cache decorator for :meth:`~.Predictor.predict` methods
+    """Cache decorator for :meth:`~.Predictor.predict` methods
 
-    This ensures the current state is extracted for the LRU cache to function
+    Predictions are cached in the predictor's :attr:`~.Predictor.prediction_cache` (see
+    :class:`~.PredictionCache`), with caching disabled if this is `None`.
+
+    This ensures the current state is extracted for the cache to function
     correctly, as caching should be on current state, not on mutable sequence.
 
-    This should function same as :class:`functools.lru_cache` otherwise.
+    Arguments are accepted for compatibility with :func:`functools.lru_cache`, but are ignored,
+    with the cache instead configured via :attr:`~.Predictor.prediction_cache`.
     """
 
-    lru_cache_instance = functools.lru_cache(*args, **kwargs)
-
     def decorator(func):
-        func = lru_cache_instance(func)
-
         @functools.wraps(func)
         def predict(self, prior, *args, **kwargs):
             if isinstance(prior, StateMutableSequence):
                 prior = prior.state
-            return func(self, prior, *args, **kwargs)
+            cache = self.prediction_cache
+            if cache is None:
+                return func(self, prior, *args, **kwargs)
+            return cache.predict(func, self, prior, *args, **kwargs)
         return predict
     return decorator
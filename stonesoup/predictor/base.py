@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 """Base classes for Stone Soup Predictor interface"""
+import copy
 from abc import abstractmethod
 
 from ..base import Base, Property
 from ..models.transition import TransitionModel
 from ..models.control import ControlModel
+from .cache import PredictionCache
+
+_DEFAULT_CACHE = object()
 
 
 class Predictor(Base):
@@ -30,6 +34,31 @@ class Predictor(Base):
     transition_model: TransitionModel = Property(doc="transition model")
     control_model: ControlModel = Property(default=None, doc="control model")
 
+    _prediction_cache = _DEFAULT_CACHE
+
+    @property
+    def prediction_cache(self):
+        """Cache of predictions made by :meth:`predict` (where supported by the predictor)
+
+        A default :class:`~.PredictionCache` is created on first use. This can be replaced with a
+        differently configured cache, or set to `None` to disable caching.
+        """
+        if self._prediction_cache is _DEFAULT_CACHE:
+            self._prediction_cache = PredictionCache()
+        return self._prediction_cache
+
+    @prediction_cache.setter
+    def prediction_cache(self, value):
+        self._prediction_cache = value
+
+    def __copy__(self):
+        # Copies get their own (empty) cache, as their predictions may differ once modified
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        if isinstance(self._prediction_cache, PredictionCache):
+            new._prediction_cache = copy.copy(self._prediction_cache)
+        return new
+
     @abstractmethod
     def predict(self, prior, timestamp=None, **kwargs):
         """The prediction function itself
@@ -48,3 +77,24 @@ class Predictor(Base):
             State prediction
         """
         raise NotImplementedError
+
+    def predict_many(self, priors, timestamp=None, **kwargs):
+        """Predict a number of priors to a common time
+
+        The default implementation simply calls :meth:`predict` for each prior in turn. Predictors
+        which can make use of stacked arrays should override this.
+
+        Parameters
+        ----------
+        priors : sequence of :class:`~.State`
+            The prior states
+        timestamp : :class:`datetime.datetime`, optional
+            Time at which the predictions are made (used by the transition
+            model)
+
+        Returns
+        -------
+        : list of :class:`~.StatePrediction`
+            State predictions, in the same order as `priors`
+        """
+        return [self.predict(prior, timestamp=timestamp, **kwargs) for prior in priors]
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+import datetime
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
+from typing import Callable
+
+import numpy as np
+
+from ..base import Base, Property
+from ..types.particle import Particles
+
+PredictionCacheInfo = namedtuple(
+    'PredictionCacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+def identity_key(prior):
+    """Key a prediction on the identity of the prior
+
+    Equivalent to caching with :func:`functools.lru_cache`, as states hash on identity, such that
+    any change to the prior (e.g. a new state appended to a track) results in a new prediction.
+
+    Parameters
+    ----------
+    prior : :class:`~.State`
+        The prior state
+
+    Returns
+    -------
+    : int
+        Identity of the prior
+    """
+    return id(prior)
+
+
+def content_key(prior):
+    """Key a prediction on the content of the prior
+
+    A digest is formed from the type of the prior and the values of its properties, with arrays
+    (including the state vectors and weights of any :class:`~.Particles`) hashed on their
+    content. As such, predictions are shared between priors which are equal but different
+    objects, such as copies. Other (non-array) property values are hashed as normal, which for
+    most Stone Soup components (e.g. hypotheses) is on identity.
+
+    Parameters
+    ----------
+    prior : :class:`~.State`
+        The prior state
+
+    Returns
+    -------
+    : bytes
+        Digest of the prior's type and property values
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(type(prior)).encode())
+    for name in type(prior)._properties:
+        value = getattr(prior, name)
+        if isinstance(value, Particles):
+            _update_digest(digest, value.state_vector)
+            _update_digest(digest, value.log_weight)
+        else:
+            _update_digest(digest, value)
+    return digest.digest()
+
+
+def _update_digest(digest, value):
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            # Custom types (e.g. angles) kept, with values as floats
+            digest.update(repr([type(element) for element in value.flat]).encode())
+            value = value.astype(np.float64)
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    else:
+        try:
+            digest.update(repr(hash(value)).encode())
+        except TypeError:
+            # Unhashable, so fall back to identity
+            digest.update(repr(id(value)).encode())
+
+
+class PredictionCache(Base):
+    """Prediction cache
+
+    Cache of predictions used by :meth:`~.Predictor.predict`, such that a prediction of the same
+    prior, to the same time, with the same arguments and models, is only calculated once. This
+    is typically the case where a prediction is used by the hypothesiser and then again by the
+    updater, or for multiple detections or sensors at the same time.
+
+    Entries are keyed on the output of :attr:`key` for the prior, along with the prediction
+    arguments (e.g. timestamp), the predictor (on identity) and its transition and control
+    models, such that a cache shared between predictors doesn't return another's predictions.
+    Priors are only held by weak reference, with entries removed once their prior is garbage
+    collected. The cache is bounded to :attr:`maxsize` entries, evicting the least recently used,
+    and optionally entries expire after :attr:`ttl`. Statistics are available via
+    :meth:`cache_info`.
+
+    Trackers clear the caches of their predictors at the start of each scan (see
+    :meth:`~.Tracker.clear_prediction_caches`), as predictions are rarely reused between scans.
+    """
+
+    maxsize: int = Property(
+        default=128,
+        doc="Maximum number of predictions to cache, with the least recently used evicted. "
+            "`None` for no limit. Default 128.")
+    ttl: datetime.timedelta = Property(
+        default=None,
+        doc="Time (wall clock) after which a cached prediction expires. Default `None`, where "
+            "predictions don't expire.")
+    key: Callable = Property(
+        default=identity_key,
+        doc="Function which returns a hashable key for a prior state. Default "
+            ":func:`identity_key`; :func:`content_key` can be used to share predictions "
+            "between equal priors which are different objects.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reset()
+
+    def _reset(self):
+        self._entries = OrderedDict()
+        self._dead_refs = []
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __getstate__(self):
+        # Cached entries (with weak references) and lock aren't copied
+        state = self.__dict__.copy()
+        for name in ('_entries', '_dead_refs', '_lock'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+    def _cache_key(self, predictor, prior, args, kwargs):
+        return (self.key(prior), predictor, predictor.transition_model, predictor.control_model,
+                args, frozenset(kwargs.items()))
+
+    def _on_prior_collected(self, key):
+        def callback(ref):
+            # Removal deferred to next access, as may be called during cache operations
+            self._dead_refs.append((key, ref))
+        return callback
+
+    def _remove_dead(self):
+        while self._dead_refs:
+            key, ref = self._dead_refs.pop()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def predict(self, func, predictor, prior, *args, **kwargs):
+        """Return cached prediction if available, otherwise predict and cache result
+
+        Parameters
+        ----------
+        func : callable
+            Prediction function, called as ``func(predictor, prior, *args, **kwargs)``
+        predictor : :class:`~.Predictor`
+            The predictor
+        prior : :class:`~.State`
+            The prior state
+        \\*args, \\*\\*kwargs
+            Prediction arguments (e.g. timestamp)
+
+        Returns
+        -------
+        : :class:`~.Prediction`
+            The (possibly cached) prediction
+        """
+        if self.maxsize == 0:
+            return func(predictor, prior, *args, **kwargs)
+        try:
+            key = self._cache_key(predictor, prior, args, kwargs)
+            hash(key)
+        except TypeError:
+            # Unhashable arguments, so can't cache
+            return func(predictor, prior, *args, **kwargs)
+
+        with self._lock:
+            self._remove_dead()
+            entry = self._entries.get(key)
+            if entry is not None:
+                _, prediction, expiry = entry
+                if expiry is None or time.monotonic() < expiry:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return prediction
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+
+        prediction = func(predictor, prior, *args, **kwargs)
+
+        try:
+            ref = weakref.ref(prior, self._on_prior_collected(key))
+        except TypeError:
+            # Prior can't be weakly referenced, so not cached
+            return prediction
+        expiry = None if self.ttl is None else time.monotonic() + self.ttl.total_seconds()
+        with self._lock:
+            self._entries[key] = (ref, prediction, expiry)
+            self._entries.move_to_end(key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return prediction
+
+    def clear(self):
+        """Remove all cached predictions (statistics are retained)"""
+        with self._lock:
+            self._entries.clear()
+            self._dead_refs.clear()
+
+    def cache_info(self):
+        """Cache statistics
+
+        Returns
+        -------
+        : :class:`PredictionCacheInfo`
+            Named tuple of `hits`, `misses`, `evictions`, `maxsize` and `currsize`
+        """
+        with self._lock:
+            self._remove_dead()
+            return PredictionCacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def __len__(self):
+        return self.cache_info().currsize
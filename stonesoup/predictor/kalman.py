@@ -1,19 +1,24 @@
 # -*- coding: utf-8 -*-
 
+import copy
+from collections import defaultdict
+from functools import partial
+
 import numpy as np
 import scipy.linalg as la
-from functools import partial
 
 from .base import Predictor
 from ._utils import predict_lru_cache
 from ..base import Property
+from ..types.array import StateVectors
 from ..types.prediction import Prediction, SqrtGaussianStatePrediction
+from ..types.state import StateMutableSequence
 from ..models.base import LinearModel
 from ..models.transition import TransitionModel
 from ..models.transition.linear import LinearGaussianTransitionModel
 from ..models.control import ControlModel
 from ..models.control.linear import LinearControlModel
-from ..functions import gauss2sigma, unscented_transform
+from ..functions import gauss2sigma, sigma2gauss, unscented_transform
 
 
 class KalmanPredictor(Predictor):
@@ -195,6 +200,133 @@ class KalmanPredictor(Predictor):
         return Prediction.from_state(prior, x_pred, p_pred, timestamp=timestamp,
                                      transition_model=self.transition_model)
 
+    def _group_by_interval(self, priors, timestamp):
+        """Private function to group priors by prediction interval
+
+        Parameters
+        ----------
+        priors : list of :class:`~.State`
+            The prior states
+        timestamp : :class:`datetime.datetime`, optional
+            The (current) timestamp
+
+        Returns
+        -------
+        : dict
+            Mapping of :class:`datetime.timedelta` (or None) to list of indices of `priors`
+
+        """
+        groups = defaultdict(list)
+        for index, prior in enumerate(priors):
+            groups[self._predict_over_interval(prior, timestamp)].append(index)
+        return groups
+
+    @staticmethod
+    def _batch_state(states):
+        """Private function to create a single state holding stacked state vectors, so models
+        can be evaluated for all states in a single call.
+
+        Parameters
+        ----------
+        states : list of :class:`~.State`
+            The states to stack
+
+        Returns
+        -------
+        : :class:`~.State`
+            Copy of the first state, with :attr:`state_vector` as a :class:`~.StateVectors`
+
+        """
+        batch_state = copy.copy(states[0])
+        batch_state.state_vector = StateVectors([state.state_vector for state in states])
+        return batch_state
+
+    def _predict_stacked(self, priors, predict_over_interval, **kwargs):
+        """Private function to predict a number of priors, which share a prediction interval,
+        using stacked arrays.
+
+        Parameters
+        ----------
+        priors : list of :class:`~.GaussianState`
+            The prior states
+        predict_over_interval : :class:`datetime.timedelta`
+            The interval over which to predict
+        **kwargs : various, optional
+            These are passed to :meth:`_transition_function`
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (N, Ns, 1)
+            The predicted means
+        : :class:`numpy.ndarray` of shape (N, Ns, Ns)
+            The predicted covariances
+
+        """
+        # Prediction of the means
+        x_preds = self._transition_function(
+            self._batch_state(priors), time_interval=predict_over_interval, **kwargs) \
+            + self.control_model.control_input()
+        x_preds = np.asarray(x_preds).T[:, :, np.newaxis]
+
+        # Prediction of the covariances
+        prior_covs = np.array([prior.covar for prior in priors], dtype=np.float_)
+        if isinstance(self.transition_model, LinearModel):
+            trans_m = np.asarray(self._transition_matrix(
+                prior=priors[0], time_interval=predict_over_interval))
+        else:
+            trans_m = np.array([
+                self._transition_matrix(prior=prior, time_interval=predict_over_interval)
+                for prior in priors], dtype=np.float_)
+        trans_cov = np.asarray(self.transition_model.covar(time_interval=predict_over_interval))
+        ctrl_mat = self._control_matrix
+        ctrl_noi = self.control_model.control_noise
+
+        p_preds = trans_m @ prior_covs @ np.swapaxes(trans_m, -1, -2) + trans_cov \
+            + np.asarray(ctrl_mat @ ctrl_noi @ ctrl_mat.T)
+
+        return x_preds, p_preds
+
+    def predict_many(self, priors, timestamp=None, **kwargs):
+        r"""Batched version of :meth:`predict`
+
+        Priors are grouped by prediction interval, and each group is predicted with single
+        operations on stacked state vectors and covariances. Subclasses which modify
+        :meth:`predict` or :meth:`_predicted_covariance` fall back to predicting each prior in
+        turn.
+
+        Parameters
+        ----------
+        priors : sequence of :class:`~.State`
+            :math:`\mathbf{x}_{k-1}` for each prior
+        timestamp : :class:`datetime.datetime`, optional
+            :math:`k`
+        **kwargs :
+            These are passed, via :meth:`~.KalmanFilter.transition_function` to
+            :meth:`~.LinearGaussianTransitionModel.matrix`
+
+        Returns
+        -------
+        : list of :class:`~.GaussianStatePrediction`
+            :math:`\mathbf{x}_{k|k-1}`, the predicted states, in the same order as `priors`
+
+        """
+        if type(self).predict is not KalmanPredictor.predict \
+                or type(self)._predicted_covariance is not KalmanPredictor._predicted_covariance:
+            return super().predict_many(priors, timestamp=timestamp, **kwargs)
+
+        priors = [prior.state if isinstance(prior, StateMutableSequence) else prior
+                  for prior in priors]
+        predictions = [None] * len(priors)
+        for predict_over_interval, indices in self._group_by_interval(priors, timestamp).items():
+            group = [priors[index] for index in indices]
+            x_preds, p_preds = self._predict_stacked(group, predict_over_interval, **kwargs)
+            for index, prior, x_pred, p_pred in zip(indices, group, x_preds, p_preds):
+                predictions[index] = Prediction.from_state(
+                    prior, x_pred, p_pred, timestamp=timestamp,
+                    transition_model=self.transition_model)
+
+        return predictions
+
 
 class ExtendedKalmanPredictor(KalmanPredictor):
     """ExtendedKalmanPredictor class
@@ -384,6 +516,115 @@ class UnscentedKalmanPredictor(KalmanPredictor):
         return Prediction.from_state(prior, x_pred, p_pred, timestamp=timestamp,
                                      transition_model=self.transition_model)
 
+    def _sigma_points_stacked(self, priors):
+        """Private function to calculate sigma points for a number of priors at once. This is
+        equivalent to calling :func:`~.gauss2sigma` on each prior.
+
+        Parameters
+        ----------
+        priors : list of :class:`~.GaussianState`
+            The prior states
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of shape (N, Ns, 2*Ns+1)
+            The sigma points of each prior
+        : :class:`numpy.ndarray` of shape (2*Ns+1,)
+            The sigma point mean weights
+        : :class:`numpy.ndarray` of shape (2*Ns+1,)
+            The sigma point covariance weights
+
+        """
+        ndim_state = priors[0].ndim
+        kappa = 3.0 - ndim_state if self.kappa is None else self.kappa
+
+        means = np.array([prior.state_vector for prior in priors], dtype=np.float_)
+        sqrt_sigmas = np.linalg.cholesky(
+            np.array([prior.covar for prior in priors], dtype=np.float_))
+
+        alpha2 = np.power(self.alpha, 2)
+        lamda = alpha2 * (ndim_state + kappa) - ndim_state
+        c = ndim_state + lamda
+
+        sigma_points = np.concatenate(
+            [means, means + sqrt_sigmas*np.sqrt(c), means - sqrt_sigmas*np.sqrt(c)], axis=2)
+
+        mean_weights = np.ones(2 * ndim_state + 1)
+        mean_weights[0] = lamda / c
+        mean_weights[1:] = 0.5 / c
+        covar_weights = np.copy(mean_weights)
+        covar_weights[0] = lamda / c + (1 - alpha2 + self.beta)
+
+        return sigma_points, mean_weights, covar_weights
+
+    def predict_many(self, priors, timestamp=None, **kwargs):
+        r"""Batched version of :meth:`predict`
+
+        Priors are grouped by prediction interval, and the sigma points of every prior in a group
+        are passed through the transition function in a single call, before being reconstructed
+        into Gaussians with stacked operations.
+
+        Parameters
+        ----------
+        priors : sequence of :class:`~.State`
+            Prior states, :math:`\mathbf{x}_{k-1}`
+        timestamp : :class:`datetime.datetime`
+            Time to transit to (:math:`k`)
+        **kwargs : various, optional
+            These are passed to :meth:`~.TransitionModel.covar`
+
+        Returns
+        -------
+        : list of :class:`~.GaussianStatePrediction`
+            The predicted states, in the same order as `priors`
+        """
+        priors = [prior.state if isinstance(prior, StateMutableSequence) else prior
+                  for prior in priors]
+        if type(self).predict is not UnscentedKalmanPredictor.predict \
+                or any(prior.state_vector.dtype == np.object_ for prior in priors):
+            return Predictor.predict_many(self, priors, timestamp=timestamp, **kwargs)
+
+        predictions = [None] * len(priors)
+        for predict_over_interval, indices in self._group_by_interval(priors, timestamp).items():
+            group = [priors[index] for index in indices]
+
+            total_noise_covar = \
+                self.transition_model.covar(
+                    time_interval=predict_over_interval, **kwargs) \
+                + self.control_model.control_noise
+
+            sigma_points, mean_weights, covar_weights = self._sigma_points_stacked(group)
+            num_priors, ndim_state, num_points = sigma_points.shape
+
+            # Pass sigma points of all priors through transition function at once
+            batch_state = copy.copy(group[0])
+            batch_state.state_vector = StateVectors(
+                sigma_points.transpose(1, 0, 2).reshape(ndim_state, num_priors*num_points))
+            sigma_points_t = self._transition_and_control_function(
+                batch_state, time_interval=predict_over_interval)
+
+            if sigma_points_t.dtype == np.object_:
+                # Custom types (e.g. angles) need averaging per prior
+                moments = [
+                    sigma2gauss(sigma_points_t[:, n*num_points:(n+1)*num_points],
+                                mean_weights, covar_weights, total_noise_covar)
+                    for n in range(num_priors)]
+            else:
+                sigma_points_t = np.asarray(sigma_points_t).reshape(
+                    -1, num_priors, num_points).transpose(1, 0, 2)
+                x_preds = sigma_points_t @ mean_weights[:, np.newaxis]
+                points_diff = sigma_points_t - x_preds
+                p_preds = (points_diff*covar_weights) @ np.swapaxes(points_diff, 1, 2) \
+                    + np.asarray(total_noise_covar)
+                moments = zip(x_preds, p_preds)
+
+            for index, prior, (x_pred, p_pred) in zip(indices, group, moments):
+                predictions[index] = Prediction.from_state(
+                    prior, x_pred, p_pred, timestamp=timestamp,
+                    transition_model=self.transition_model)
+
+        return predictions
+
 
 class SqrtKalmanPredictor(KalmanPredictor):
     r"""The version of the Kalman predictor that operates on the square root parameterisation of
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
+
+import numpy as np
 
 from .base import Predictor
 from ._utils import predict_lru_cache
@@ -6,7 +9,7 @@ from .kalman import KalmanPredictor, ExtendedKalmanPredictor
 from ..base import Property
 from ..types.particle import Particles
 from ..types.prediction import Prediction, ParticleStatePrediction
-from ..types.state import GaussianState
+from ..types.state import GaussianState, StateMutableSequence
 
 
 class ParticlePredictor(Predictor):
@@ -49,12 +52,71 @@ class ParticlePredictor(Predictor):
             num_samples=len(prior.particles),
             **kwargs)
         new_particles = Particles(state_vector=new_state_vector,
-                                  weight=prior.particles.weight,
+                                  log_weight=prior.particles.log_weight,
                                   parent=prior.particles.parent)
 
         return Prediction.from_state(prior, particles=new_particles, timestamp=timestamp,
                                      transition_model=self.transition_model)
 
+    def predict_many(self, priors, timestamp=None, **kwargs):
+        """Batched version of :meth:`predict`
+
+        Priors are grouped by prediction interval, and the particles of every prior in a group
+        are concatenated (see :meth:`~.Particles.concatenate`) such that the transition function
+        is evaluated, with noise, in a single call. The result is then split back into a
+        prediction for each prior. Subclasses which modify :meth:`predict` fall back to
+        predicting each prior in turn.
+
+        Parameters
+        ----------
+        priors : sequence of :class:`~.ParticleState`
+            The prior states
+        timestamp: :class:`datetime.datetime`, optional
+            A timestamp signifying when the prediction is performed
+            (the default is `None`)
+
+        Returns
+        -------
+        : list of :class:`~.ParticleStatePrediction`
+            The predicted states, in the same order as `priors`
+        """
+        if type(self).predict is not ParticlePredictor.predict:
+            return super().predict_many(priors, timestamp=timestamp, **kwargs)
+
+        priors = [prior.state if isinstance(prior, StateMutableSequence) else prior
+                  for prior in priors]
+        groups = defaultdict(list)
+        for index, prior in enumerate(priors):
+            try:
+                time_interval = timestamp - prior.timestamp
+            except TypeError:
+                # TypeError: (timestamp or prior.timestamp) is None
+                time_interval = None
+            groups[time_interval].append(index)
+
+        predictions = [None] * len(priors)
+        for time_interval, indices in groups.items():
+            group = [priors[index] for index in indices]
+            particles = Particles.concatenate([prior.particles for prior in group])
+            offsets = np.cumsum([0] + [len(prior.particles) for prior in group])
+
+            new_state_vector = self.transition_model.function(
+                particles,
+                noise=True,
+                time_interval=time_interval,
+                num_samples=len(particles),
+                **kwargs)
+
+            for index, prior, start, end in zip(indices, group, offsets[:-1], offsets[1:]):
+                new_particles = Particles(state_vector=new_state_vector[:, start:end],
+                                          log_weight=prior.particles.log_weight,
+                                          parent=prior.particles.parent)
+                predictions[index] = Prediction.from_state(
+                    prior, particles=new_particles, timestamp=timestamp,
+                    transition_model=self.transition_model)
+
+        return predictions
+
 
 class ParticleFlowKalmanPredictor(ParticlePredictor):
     """Gromov Flow Parallel Kalman Particle Predictor
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+import copy
+import datetime
+import gc
+import pickle
+import time
+
+import numpy as np
+import pytest
+
+from ..cache import PredictionCache, content_key
+from ..kalman import KalmanPredictor, ExtendedKalmanPredictor, UnscentedKalmanPredictor
+from ..particle import ParticlePredictor
+from ...models.transition.linear import ConstantVelocity
+from ...models.transition.nonlinear import ConstantTurn
+from ...types.particle import Particles
+from ...types.state import GaussianState, ParticleState
+
+
+@pytest.fixture()
+def predictor():
+    return KalmanPredictor(ConstantVelocity(noise_diff_coeff=0.1))
+
+
+@pytest.fixture()
+def timestamp():
+    return datetime.datetime(2021, 1, 1)
+
+
+def new_state(timestamp, x=0.):
+    return GaussianState([[x], [1.]], np.diag([1., 1.]), timestamp)
+
+
+def test_cache_hit_miss(predictor, timestamp):
+    state = new_state(timestamp)
+    prediction_time = timestamp + datetime.timedelta(seconds=1)
+
+    prediction = predictor.predict(state, prediction_time)
+    assert predictor.predict(state, timestamp=prediction_time) is not prediction  # kwargs differ
+    assert predictor.predict(state, prediction_time) is prediction
+    assert predictor.predict(state, prediction_time + datetime.timedelta(seconds=1)) \
+        is not prediction
+    # Equal but different state
+    assert predictor.predict(copy.copy(state), prediction_time) is not prediction
+
+    info = predictor.prediction_cache.cache_info()
+    assert info.hits == 1
+    assert info.misses == 4
+    assert info.evictions == 0
+    assert info.maxsize == 128
+    assert info.currsize == 3  # Copied state garbage collected
+    assert len(predictor.prediction_cache) == 3
+
+    # Different models
+    other_predictor = KalmanPredictor(ConstantVelocity(noise_diff_coeff=0.1))
+    other_predictor.prediction_cache = predictor.prediction_cache
+    assert other_predictor.predict(state, prediction_time) is not prediction
+
+    predictor.prediction_cache.clear()
+    assert len(predictor.prediction_cache) == 0
+    assert predictor.predict(state, prediction_time) is not prediction
+
+
+def test_cache_disabled(predictor, timestamp):
+    state = new_state(timestamp)
+    predictor.prediction_cache = None
+    assert predictor.predict(state, timestamp) is not predictor.predict(state, timestamp)
+
+    predictor.prediction_cache = PredictionCache(maxsize=0)
+    assert predictor.predict(state, timestamp) is not predictor.predict(state, timestamp)
+    assert len(predictor.prediction_cache) == 0
+
+
+def test_cache_lru(predictor, timestamp):
+    predictor.prediction_cache = PredictionCache(maxsize=2)
+    states = [new_state(timestamp, x) for x in range(3)]
+
+    predictions = [predictor.predict(state, timestamp) for state in states[:2]]
+    assert predictor.predict(states[0], timestamp) is predictions[0]  # Now most recent
+    predictor.predict(states[2], timestamp)  # Evicts least recently used
+
+    assert predictor.predict(states[0], timestamp) is predictions[0]
+    assert predictor.predict(states[1], timestamp) is not predictions[1]
+    info = predictor.prediction_cache.cache_info()
+    assert info.evictions == 2
+    assert info.currsize == 2
+
+
+def test_cache_ttl(predictor, timestamp):
+    predictor.prediction_cache = PredictionCache(ttl=datetime.timedelta(seconds=0.05))
+    state = new_state(timestamp)
+
+    prediction = predictor.predict(state, timestamp)
+    assert predictor.predict(state, timestamp) is prediction
+    time.sleep(0.1)
+    assert predictor.predict(state, timestamp) is not prediction
+    assert predictor.prediction_cache.cache_info().evictions == 1
+
+
+def test_cache_weakref(predictor, timestamp):
+    state = new_state(timestamp)
+    predictor.predict(state, timestamp)
+    assert len(predictor.prediction_cache) == 1
+
+    del state
+    gc.collect()
+    assert len(predictor.prediction_cache) == 0
+
+
+def test_content_key(timestamp):
+    state = new_state(timestamp)
+    assert content_key(state) == content_key(copy.copy(state))
+    assert content_key(state) != content_key(new_state(timestamp, 1.))
+    assert content_key(state) != content_key(
+        new_state(timestamp + datetime.timedelta(seconds=1)))
+
+    particles = Particles(np.array([[0., 1.], [1., 1.]]), log_weight=np.log([0.5, 0.5]))
+    particle_state = ParticleState(particles, timestamp=timestamp)
+    assert content_key(particle_state) == content_key(copy.deepcopy(particle_state))
+    other_particles = Particles(np.array([[0., 1.], [1., 1.]]), log_weight=np.log([0.4, 0.6]))
+    assert content_key(particle_state) != content_key(
+        ParticleState(other_particles, timestamp=timestamp))
+
+    predictor = ParticlePredictor(ConstantVelocity(noise_diff_coeff=0.1))
+    predictor.prediction_cache = PredictionCache(key=content_key)
+    prediction_time = timestamp + datetime.timedelta(seconds=1)
+    prediction = predictor.predict(particle_state, timestamp=prediction_time)
+    assert predictor.predict(
+        copy.deepcopy(particle_state), timestamp=prediction_time) is prediction
+
+
+def test_cache_copy(predictor, timestamp):
+    state = new_state(timestamp)
+    predictor.prediction_cache = PredictionCache(maxsize=10)
+    predictor.predict(state, timestamp)
+
+    for new_predictor in (pickle.loads(pickle.dumps(predictor)), copy.deepcopy(predictor)):
+        assert new_predictor.prediction_cache.maxsize == 10
+        assert len(new_predictor.prediction_cache) == 0
+        new_predictor.predict(state, timestamp)
+        assert len(new_predictor.prediction_cache) == 1
+
+    new_predictor = copy.copy(predictor)
+    assert new_predictor.prediction_cache is not predictor.prediction_cache
+    assert new_predictor.prediction_cache.maxsize == 10
+    assert len(new_predictor.prediction_cache) == 0
+
+
+def test_cache_predictor_key(timestamp):
+    transition_model = ConstantTurn(np.array([0.1, 0.1]), 0.01)
+    state = GaussianState([[0.], [1.], [0.], [1.], [0.2]], np.diag([1., 1., 1., 1., 0.1]),
+                          timestamp)
+    prediction_time = timestamp + datetime.timedelta(seconds=5)
+
+    # Copy with different parameters doesn't return original's predictions
+    predictor = UnscentedKalmanPredictor(transition_model)
+    prediction = predictor.predict(state, timestamp=prediction_time)
+    new_predictor = copy.copy(predictor)
+    new_predictor.alpha = 1.
+    new_prediction = new_predictor.predict(state, timestamp=prediction_time)
+    assert new_prediction is not prediction
+    assert not np.allclose(new_prediction.covar, prediction.covar)
+
+    # Nor does a different predictor sharing the same cache and model
+    other_predictor = ExtendedKalmanPredictor(transition_model)
+    other_predictor.prediction_cache = predictor.prediction_cache
+    other_prediction = other_predictor.predict(state, timestamp=prediction_time)
+    assert other_prediction is not prediction
+    assert predictor.predict(state, timestamp=prediction_time) is prediction
@@ -3,7 +3,9 @@ import datetime
 import pytest
 import numpy as np
 
-from ...models.transition.linear import ConstantVelocity
+from ...models.transition.linear import (
+    ConstantVelocity, CombinedLinearGaussianTransitionModel)
+from ...models.transition.nonlinear import ConstantTurn
 from ...predictor.kalman import (
     KalmanPredictor, ExtendedKalmanPredictor, UnscentedKalmanPredictor,
     SqrtKalmanPredictor)
@@ -79,6 +81,55 @@ def test_kalman(PredictorClass, transition_model,
     # TODO: Test with Control Model
 
 
+@pytest.mark.parametrize(
+    "PredictorClass, transition_model",
+    [
+        (KalmanPredictor, CombinedLinearGaussianTransitionModel(
+            [ConstantVelocity(0.1), ConstantVelocity(0.1)])),
+        (ExtendedKalmanPredictor, ConstantTurn([0.1, 0.1], np.radians(5))),
+        (UnscentedKalmanPredictor, ConstantTurn([0.1, 0.1], np.radians(5))),
+        (SqrtKalmanPredictor, CombinedLinearGaussianTransitionModel(
+            [ConstantVelocity(0.1), ConstantVelocity(0.1)])),
+    ],
+    ids=["standard", "extended", "unscented", "sqrt"]
+)
+def test_predict_many(PredictorClass, transition_model):
+    timestamp = datetime.datetime.now()
+    new_timestamp = timestamp + datetime.timedelta(seconds=2)
+
+    priors = []
+    for n in range(5):
+        state_vector = np.array([[n], [1.], [-n], [0.5], [np.radians(n)]])
+        covar = np.diag([1., 0.1, 1.2, 0.2, 0.01]) * (n + 1)
+        if transition_model.ndim_state == 4:
+            state_vector = state_vector[:4]
+            covar = covar[:4, :4]
+        if PredictorClass is SqrtKalmanPredictor:
+            prior = SqrtGaussianState(
+                state_vector, np.linalg.cholesky(covar),
+                timestamp=timestamp - datetime.timedelta(seconds=n % 2))
+        else:
+            prior = GaussianState(
+                state_vector, covar, timestamp=timestamp - datetime.timedelta(seconds=n % 2))
+        priors.append(prior)
+    # Tracks also accepted as priors
+    priors.append(Track([priors[0]]))
+
+    predictor = PredictorClass(transition_model=transition_model)
+    predictions = predictor.predict_many(priors, new_timestamp)
+
+    assert len(predictions) == len(priors)
+    for prior, prediction in zip(priors, predictions):
+        eval_prediction = predictor.predict(prior, new_timestamp)
+        assert type(prediction) is type(eval_prediction)
+        assert np.allclose(prediction.state_vector, eval_prediction.state_vector)
+        assert np.allclose(prediction.covar, eval_prediction.covar)
+        assert prediction.timestamp == new_timestamp
+        assert prediction.transition_model is transition_model
+
+    assert predictor.predict_many([], new_timestamp) == []
+
+
 def test_lru_cache():
     predictor = KalmanPredictor(ConstantVelocity(noise_diff_coeff=0))
 
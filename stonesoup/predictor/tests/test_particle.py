@@ -7,7 +7,7 @@ import pytest
 from ...models.transition.linear import ConstantVelocity
 from ...predictor.particle import (
     ParticlePredictor, ParticleFlowKalmanPredictor)
-from ...types.particle import Particle
+from ...types.particle import Particle, Particles
 from ...types.prediction import ParticleStatePrediction
 from ...types.state import ParticleState
 
@@ -66,3 +66,37 @@ def test_particle(predictor_class):
     assert np.all([eval_prediction.particles[i].state_vector ==
                    prediction.particles[i].state_vector for i in range(9)])
     assert np.all([prediction.particles[i].weight == 1 / 9 for i in range(9)])
+
+
+@pytest.mark.parametrize(
+    "predictor_class",
+    (ParticlePredictor, ParticleFlowKalmanPredictor))
+def test_particle_predict_many(predictor_class):
+    timestamp = datetime.datetime(2020, 1, 1)
+    new_timestamp = timestamp + datetime.timedelta(seconds=2)
+    random_state = np.random.RandomState(1)
+    # Different numbers of particles, and prediction intervals (grouped in order of priors)
+    priors = [
+        ParticleState(
+            Particles(random_state.randn(2, num_particles),
+                      log_weight=np.log(random_state.uniform(0, 1, num_particles))),
+            timestamp=prior_timestamp)
+        for num_particles, prior_timestamp in [
+            (10, timestamp), (25, timestamp),
+            (5, timestamp + datetime.timedelta(seconds=1))]]
+
+    # Seeded, so noise of batched and individual predictions should be the same
+    predictions = predictor_class(ConstantVelocity(0.1, seed=2)).predict_many(
+        priors, timestamp=new_timestamp)
+    predictor = predictor_class(ConstantVelocity(0.1, seed=2))
+    expected_predictions = [predictor.predict(prior, timestamp=new_timestamp)
+                            for prior in priors]
+
+    assert len(predictions) == len(priors)
+    for prediction, expected_prediction in zip(predictions, expected_predictions):
+        assert isinstance(prediction, ParticleStatePrediction)
+        assert prediction.timestamp == new_timestamp
+        assert np.allclose(prediction.particles.state_vector,
+                           expected_prediction.particles.state_vector)
+        assert np.array_equal(prediction.particles.log_weight,
+                              expected_prediction.particles.log_weight)
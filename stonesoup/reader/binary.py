@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""Binary recording readers for Stone Soup.
+
+Readers of recordings made with :class:`~.BinaryWriter`. A recording is a directory containing,
+for each of tracks, detections and ground truth:
+
+- ``<kind>.records``: fixed size records (a NumPy structured array) of each state, with time,
+  ID index, state vector, covariance (where states are Gaussian) and location of metadata;
+- ``<kind>.index``: time, start and stop record of each time step written;
+- ``<kind>.ids``: ID of each track or ground truth path, one JSON value per line; and
+- ``<kind>.metadata``: metadata of each state, as JSON.
+
+along with ``meta.json``, describing the record layout. All files are only ever appended to,
+with tracks and ground truth paths referenced by ID, such that only new states are written at
+each time step. Records are memory mapped when read, with time steps located by binary search
+of the index, allowing efficient random access by time range.
+"""
+import datetime
+import json
+from pathlib import Path
+
+import numpy as np
+
+from ..base import Property
+from ..buffered_generator import BufferedGenerator
+from ..tracker import Tracker
+from ..types.detection import Detection, GaussianDetection
+from ..types.groundtruth import GroundTruthPath, GroundTruthState
+from ..types.state import State, GaussianState
+from ..types.track import Track
+from .base import DetectionReader, GroundTruthReader
+from .file import FileReader
+
+BINARY_FORMAT_VERSION = 1
+META_FILENAME = 'meta.json'
+KINDS = ('tracks', 'detections', 'groundtruth_paths')
+INDEX_DTYPE = np.dtype([('time', 'M8[us]'), ('start', '<i8'), ('stop', '<i8')])
+
+
+def record_dtype(ndim, covar):
+    """NumPy structured dtype of records
+
+    Parameters
+    ----------
+    ndim : int
+        Number of state dimensions
+    covar : bool
+        Whether covariance is recorded
+
+    Returns
+    -------
+    : :class:`numpy.dtype`
+        Record dtype
+    """
+    fields = [('time', 'M8[us]'), ('id', '<i8'), ('metadata_offset', '<i8'),
+              ('metadata_length', '<i8'), ('state_vector', '<f8', (ndim, ))]
+    if covar:
+        fields.append(('covar', '<f8', (ndim, ndim)))
+    return np.dtype(fields)
+
+
+class BinaryReader(FileReader):
+    """Binary Reader
+
+    Memory mapped access to the records of a recording made with :class:`~.BinaryWriter`, for
+    random access by time range, e.g. for metric computation. Records are returned as NumPy
+    structured arrays with fields `time`, `id` (index into :meth:`ids`), `state_vector` and
+    `covar` (where recorded).
+
+    Files are reopened each time they are accessed, such that a recording can be read whilst
+    still being written.
+    """
+    path: Path = Property(doc="Directory of recording. Str will be converted to Path.")
+    start_time: datetime.datetime = Property(
+        default=None, doc="Time of first time step to read. Default `None`, from the start.")
+    end_time: datetime.datetime = Property(
+        default=None, doc="Time of last time step to read. Default `None`, to the end.")
+
+    def _meta(self):
+        with (self.path / META_FILENAME).open('r') as meta_file:
+            meta = json.load(meta_file)
+        if meta['version'] > BINARY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported binary format version {meta['version']}")
+        return meta
+
+    def kinds(self):
+        """Kinds of data (`tracks`, `detections` and/or `groundtruth_paths`) recorded"""
+        return [kind for kind in KINDS if kind in self._meta()['kinds']]
+
+    @staticmethod
+    def _memmap(path, dtype):
+        size = path.stat().st_size // dtype.itemsize if path.exists() else 0
+        if size == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(size, ))
+
+    def index(self, kind):
+        """Time step index
+
+        Parameters
+        ----------
+        kind : str
+            Kind of data
+
+        Returns
+        -------
+        : :class:`numpy.ndarray`
+            Structured array of time steps, with fields `time`, `start` and `stop` records
+        """
+        return self._memmap(self.path / f'{kind}.index', INDEX_DTYPE)
+
+    def records(self, kind, start_time=None, end_time=None):
+        """Records of states, optionally between times
+
+        Parameters
+        ----------
+        kind : str
+            Kind of data
+        start_time, end_time : :class:`datetime.datetime`, optional
+            Inclusive time range of time steps to return records for. Default `None`, for no
+            bound.
+
+        Returns
+        -------
+        : :class:`numpy.memmap`
+            Memory mapped structured array of records
+        """
+        kind_meta = self._meta()['kinds'].get(kind)
+        if kind_meta is None:
+            return np.empty(0, dtype=record_dtype(0, False))
+        dtype = record_dtype(kind_meta['ndim'], kind_meta['covar'])
+        records = self._memmap(self.path / f'{kind}.records', dtype)
+        index = self._time_slice(self.index(kind), start_time, end_time)
+        if len(index) == 0:
+            return records[:0]
+        return records[index['start'][0]:index['stop'][-1]]
+
+    @staticmethod
+    def _time_slice(index, start_time=None, end_time=None):
+        start = 0 if start_time is None else np.searchsorted(
+            index['time'], np.datetime64(start_time, 'us'), side='left')
+        stop = len(index) if end_time is None else np.searchsorted(
+            index['time'], np.datetime64(end_time, 'us'), side='right')
+        return index[start:stop]
+
+    def ids(self, kind):
+        """IDs of tracks or ground truth paths, indexed by record `id` field
+
+        Parameters
+        ----------
+        kind : str
+            Kind of data
+
+        Returns
+        -------
+        : list
+            IDs
+        """
+        path = self.path / f'{kind}.ids'
+        if not path.exists():
+            return []
+        with path.open('r') as ids_file:
+            return [json.loads(line) for line in ids_file]
+
+    def metadata(self, kind, records):
+        """Metadata of records
+
+        Parameters
+        ----------
+        kind : str
+            Kind of data
+        records : :class:`numpy.ndarray`
+            Records
+
+        Returns
+        -------
+        : list of dict
+            Metadata of each record
+        """
+        if len(records) == 0:
+            return []
+        data = self._memmap(self.path / f'{kind}.metadata', np.dtype('u1'))
+        return [json.loads(bytes(data[offset:offset + length])) if length else {}
+                for offset, length in zip(records['metadata_offset'],
+                                          records['metadata_length'])]
+
+    def time_steps(self, kind, start_time=None, end_time=None):
+        """Generator of time step time and records
+
+        Parameters
+        ----------
+        kind : str
+            Kind of data
+        start_time, end_time : :class:`datetime.datetime`, optional
+            Inclusive time range of time steps. Default `None`, for no bound.
+
+        Yields
+        ------
+        : :class:`datetime.datetime`
+            Time of time step
+        : :class:`numpy.ndarray`
+            Records written at time step
+        """
+        index = self._time_slice(self.index(kind), start_time, end_time)
+        if len(index) == 0:
+            return
+        records = self.records(kind, start_time, end_time)
+        offset = index['start'][0]
+        for time, start, stop in zip(index['time'].astype(datetime.datetime),
+                                     index['start'] - offset, index['stop'] - offset):
+            yield time, records[start:stop]
+
+    def states(self, kind, records, state_type=State, gaussian_state_type=GaussianState):
+        """Create states from records
+
+        Only state vector, covariance, timestamp and metadata are recorded, so states are
+        created as `gaussian_state_type` where covariance was recorded, otherwise `state_type`.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of data
+        records : :class:`numpy.ndarray`
+            Records
+        state_type, gaussian_state_type : type
+            State types to create. Metadata is only set if the type has a `metadata` property.
+
+        Returns
+        -------
+        : list of :class:`~.State`
+            States
+        """
+        times = records['time'].astype(datetime.datetime)
+        state_vectors = np.array(records['state_vector'])[..., np.newaxis]
+        if 'covar' in records.dtype.names:
+            covars = np.array(records['covar'])
+        else:
+            covars = np.full(len(records), None)
+        if 'metadata' in state_type.properties:
+            metadatas = self.metadata(kind, records)
+        else:
+            metadatas = np.full(len(records), None)
+
+        states = []
+        for state_vector, covar, time, metadata in zip(state_vectors, covars, times, metadatas):
+            kwargs = {} if metadata is None else {'metadata': metadata}
+            if covar is None or np.isnan(covar[0, 0]):
+                states.append(state_type(state_vector, timestamp=time, **kwargs))
+            else:
+                states.append(gaussian_state_type(state_vector, covar, timestamp=time, **kwargs))
+        return states
+
+
+class BinaryDetectionReader(BinaryReader, DetectionReader):
+    """Binary Detection Reader
+
+    Detections are read as :class:`~.Detection`, or :class:`~.GaussianDetection` where
+    covariance was recorded.
+    """
+
+    @BufferedGenerator.generator_method
+    def detections_gen(self):
+        for time, records in self.time_steps('detections', self.start_time, self.end_time):
+            yield time, set(self.states(
+                'detections', records, Detection, GaussianDetection))
+
+
+class BinaryGroundTruthReader(BinaryReader, GroundTruthReader):
+    """Binary Ground Truth Reader
+
+    Paths are built up from the states recorded at each time step, such that when replaying from
+    a :attr:`start_time`, paths only contain states from that time.
+    """
+
+    @BufferedGenerator.generator_method
+    def groundtruth_paths_gen(self):
+        ids = self.ids('groundtruth_paths')
+        paths = dict()
+        for time, records in self.time_steps(
+                'groundtruth_paths', self.start_time, self.end_time):
+            if records.size and records['id'].max() >= len(ids):
+                # Reread as written since
+                ids = self.ids('groundtruth_paths')
+            updated_paths = set()
+            for id_index, state in zip(records['id'].tolist(), self.states(
+                    'groundtruth_paths', records, GroundTruthState, GroundTruthState)):
+                id_ = ids[id_index]
+                if id_ not in paths:
+                    paths[id_] = GroundTruthPath(id=id_)
+                paths[id_].append(state)
+                updated_paths.add(paths[id_])
+            yield time, updated_paths
+
+
+class BinaryTrackReader(BinaryReader, Tracker):
+    """Binary Track Reader
+
+    Tracks are built up from the states recorded at each time step, as :class:`~.State` or
+    :class:`~.GaussianState`, such that when replaying from a :attr:`start_time`, tracks only
+    contain states from that time.
+    """
+
+    def __iter__(self):
+        self.data_iter = iter(self.time_steps('tracks', self.start_time, self.end_time))
+        self._ids = self.ids('tracks')
+        self._tracks = dict()
+        return super().__iter__()
+
+    @property
+    def tracks(self):
+        return set(self._tracks.values())
+
+    def __next__(self):
+        time, records = next(self.data_iter)
+        if records.size and records['id'].max() >= len(self._ids):
+            # Reread as written since
+            self._ids = self.ids('tracks')
+        updated_tracks = set()
+        for id_index, state in zip(records['id'].tolist(), self.states('tracks', records)):
+            id_ = self._ids[id_index]
+            if id_ not in self._tracks:
+                self._tracks[id_] = Track(id=id_)
+            self._tracks[id_].append(state)
+            updated_tracks.add(self._tracks[id_])
+        return time, updated_tracks
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""Columnar readers for Stone Soup.
+
+Readers of detections and ground truth from CSV, Parquet and Arrow IPC files, which read
+data in large columnar chunks using Apache Arrow. Conversion of time and state vector fields is
+carried out per column, and rows grouped by time by splitting the time column where its value
+changes, rather than row by row as with the readers in :mod:`stonesoup.reader.generic`. These
+readers yield the same output as :class:`~.CSVDetectionReader` and :class:`~.CSVGroundTruthReader`,
+and as such also assume the file is in time order.
+"""
+import datetime
+from typing import Sequence, Collection, Mapping
+
+import numpy as np
+from dateutil.parser import parse
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.ipc as paipc
+    import pyarrow.parquet as pq
+except ImportError as error:
+    raise ImportError(
+        "Usage of columnar readers requires that the optional package dependency 'pyarrow' "
+        "is installed. This can be achieved by running "
+        "'python -m pip install stonesoup[arrow]'")\
+        from error
+
+from .base import GroundTruthReader, DetectionReader
+from .file import FileReader
+from ..base import Property
+from ..buffered_generator import BufferedGenerator
+from ..types.array import StateVector
+from ..types.detection import Detection
+from ..types.groundtruth import GroundTruthPath, GroundTruthState
+
+
+class _ColumnarReader(FileReader):
+    state_vector_fields: Sequence[str] = Property(
+        doc='List of columns names to be used in state vector')
+    time_field: str = Property(
+        doc='Name of column to be used as time field')
+    time_field_format: str = Property(
+        default=None, doc='Optional datetime format')
+    timestamp: bool = Property(
+        default=False, doc='Treat time field as a timestamp from epoch')
+    metadata_fields: Collection[str] = Property(
+        default=None, doc='List of columns to be saved as metadata, default all')
+
+    def _batches(self):
+        """Generator of :class:`pyarrow.RecordBatch` chunks of the file"""
+        raise NotImplementedError
+
+    @property
+    def _required_fields(self):
+        return [self.time_field, *self.state_vector_fields]
+
+    def _columns(self, names):
+        """Names of columns to read, from all column `names` in file"""
+        if self.metadata_fields is None:
+            return list(names)
+        return [name for name in names
+                if name in self._required_fields or name in self.metadata_fields]
+
+    def _get_times(self, column):
+        if self.timestamp is True:
+            fractional, seconds = np.modf(
+                column.cast(pa.float64()).to_numpy(zero_copy_only=False))
+            return (seconds.astype(np.int64) * 10**6 + np.round(fractional * 1E6).astype(np.int64)
+                    ).astype('datetime64[us]')
+        elif pa.types.is_timestamp(column.type):
+            # Timezone aware times are converted to UTC
+            return column.cast(pa.timestamp('us')).to_numpy(zero_copy_only=False)
+        elif self.time_field_format is not None:
+            return pc.strptime(column, format=self.time_field_format, unit='us')\
+                .to_numpy(zero_copy_only=False)
+        else:
+            # Parse each unique value only
+            encoded = pc.dictionary_encode(column)
+            unique_times = np.array(
+                [parse(value, ignoretz=True) for value in encoded.dictionary.to_pylist()],
+                dtype='datetime64[us]')
+            return unique_times[encoded.indices.to_numpy(zero_copy_only=False)]
+
+    def _get_state_vectors(self, batch):
+        state_vectors = np.empty((batch.num_rows, len(self.state_vector_fields), 1))
+        for index, field in enumerate(self.state_vector_fields):
+            state_vectors[:, index, 0] = batch.column(field).cast(pa.float64())\
+                .to_numpy(zero_copy_only=False)
+        return state_vectors
+
+    def _get_metadata(self, batch):
+        if self.metadata_fields is None:
+            fields = [field for field in batch.schema.names
+                      if field != self.time_field and field not in self.state_vector_fields]
+        else:
+            fields = [field for field in self.metadata_fields if field in batch.schema.names]
+        if not fields:
+            return [{} for _ in range(batch.num_rows)]
+        return [dict(zip(fields, values))
+                for values in zip(*(batch.column(field).to_pylist() for field in fields))]
+
+    def _time_groups(self, convert):
+        """Generator of time and list of objects at that time
+
+        Parameters
+        ----------
+        convert : callable
+            Called with a :class:`pyarrow.RecordBatch` and array of :class:`datetime.datetime`
+            for each row, returning list of objects for each row.
+        """
+        previous_time = None
+        previous_objects = []
+        for batch in self._batches():
+            if batch.num_rows == 0:
+                continue
+            times = self._get_times(batch.column(self.time_field))
+            starts = np.flatnonzero(times[1:] != times[:-1]) + 1
+            starts = np.insert(starts, 0, 0)
+            group_times = times[starts].astype(datetime.datetime)
+            objects = convert(
+                batch, np.repeat(group_times, np.diff(np.append(starts, batch.num_rows))))
+
+            for time, group_objects in zip(group_times, np.split(objects, starts[1:])):
+                if time == previous_time:
+                    # Continuation of group from previous chunk
+                    previous_objects.extend(group_objects)
+                    continue
+                if previous_time is not None:
+                    yield previous_time, previous_objects
+                previous_time, previous_objects = time, list(group_objects)
+
+        # Yield remaining
+        yield previous_time, previous_objects
+
+
+class _ColumnarGroundTruthReader(GroundTruthReader, _ColumnarReader):
+    path_id_field: str = Property(doc='Name of column to be used as path ID')
+
+    @property
+    def _required_fields(self):
+        return [*super()._required_fields, self.path_id_field]
+
+    @BufferedGenerator.generator_method
+    def groundtruth_paths_gen(self):
+        groundtruth_dict = {}
+
+        def convert(batch, times):
+            path_states = np.empty(batch.num_rows, dtype=object)
+            for index, (state_vector, time, metadata, id_) in enumerate(zip(
+                    self._get_state_vectors(batch), times, self._get_metadata(batch),
+                    batch.column(self.path_id_field).to_pylist())):
+                if id_ not in groundtruth_dict:
+                    groundtruth_dict[id_] = GroundTruthPath(id=id_)
+                path_states[index] = groundtruth_dict[id_], GroundTruthState(
+                    StateVector(state_vector), timestamp=time, metadata=metadata)
+            return path_states
+
+        for time, path_states in self._time_groups(convert):
+            # States appended as yielded, such that paths are only updated up to current time
+            updated_paths = set()
+            for groundtruth_path, state in path_states:
+                groundtruth_path.append(state)
+                updated_paths.add(groundtruth_path)
+            yield time, updated_paths
+
+
+class _ColumnarDetectionReader(DetectionReader, _ColumnarReader):
+
+    @BufferedGenerator.generator_method
+    def detections_gen(self):
+        def convert(batch, times):
+            detections = np.empty(batch.num_rows, dtype=object)
+            detections[:] = [
+                Detection(StateVector(state_vector), timestamp=time, metadata=metadata)
+                for state_vector, time, metadata in zip(
+                    self._get_state_vectors(batch), times, self._get_metadata(batch))]
+            return detections
+
+        for time, detections in self._time_groups(convert):
+            yield time, set(detections)
+
+
+class _CSVReader(_ColumnarReader):
+    encoding: str = Property(
+        default="utf-8", doc="File encoding. Must be valid coding. Default 'utf-8'.")
+    csv_options: Mapping = Property(
+        default={}, doc='Keyword arguments for the underlying :class:`pyarrow.csv.ParseOptions` '
+                        '(e.g. `delimiter`)')
+    column_names: Sequence[str] = Property(
+        default=None, doc='Column names, where the file has no header. Default `None`, where '
+                          'the first row of the file is used.')
+    block_size: int = Property(
+        default=2**24, doc='Number of bytes of file to read per chunk. Default 16 MiB.')
+
+    def _open_csv(self, convert_options=None):
+        return pacsv.open_csv(
+            self.path,
+            read_options=pacsv.ReadOptions(
+                encoding=self.encoding, block_size=self.block_size,
+                column_names=self.column_names),
+            parse_options=pacsv.ParseOptions(**self.csv_options),
+            convert_options=convert_options)
+
+    def _batches(self):
+        with self._open_csv() as reader:
+            names = reader.schema.names
+
+        # Non-numeric fields kept as strings, consistent with CSVDetectionReader
+        column_types = {name: pa.string() for name in names
+                        if name not in self.state_vector_fields}
+        if self.timestamp is True:
+            column_types[self.time_field] = pa.float64()
+        convert_options = pacsv.ConvertOptions(
+            column_types=column_types, include_columns=self._columns(names),
+            strings_can_be_null=False, quoted_strings_can_be_null=False)
+        with self._open_csv(convert_options) as reader:
+            yield from reader
+
+
+class _ParquetReader(_ColumnarReader):
+    batch_size: int = Property(
+        default=2**16, doc='Maximum number of rows to read per chunk. Default 65536.')
+
+    def _batches(self):
+        with pq.ParquetFile(self.path) as parquet_file:
+            yield from parquet_file.iter_batches(
+                batch_size=self.batch_size, columns=self._columns(parquet_file.schema_arrow.names))
+
+
+class _ArrowReader(_ColumnarReader):
+
+    def _batches(self):
+        with pa.memory_map(str(self.path)) as source:
+            try:
+                reader = paipc.open_file(source)
+            except pa.ArrowInvalid:
+                # Not file format, so try streaming format
+                source.seek(0)
+                batches = paipc.open_stream(source)
+            else:
+                batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+            for batch in batches:
+                yield batch.select(self._columns(batch.schema.names))
+
+
+class ColumnarCSVGroundTruthReader(_ColumnarGroundTruthReader, _CSVReader):
+    """A columnar reader for csv files of truth data.
+
+    Equivalent to :class:`~.CSVGroundTruthReader`, but reads the file in chunks of columns with a
+    vectorised parser, which is considerably faster for large files. CSV file must have headers,
+    as these are used to determine which fields to use to generate the ground truth state. Those
+    states with the same ID will be put into a :class:`~.GroundTruthPath` in sequence, and all
+    paths that are updated at the same time are yielded together, and such assumes file is in
+    time order.
+
+    Parameters
+    ----------
+    """
+
+
+class ColumnarCSVDetectionReader(_ColumnarDetectionReader, _CSVReader):
+    """A columnar detection reader for csv files of detections.
+
+    Equivalent to :class:`~.CSVDetectionReader`, but reads the file in chunks of columns with a
+    vectorised parser, which is considerably faster for large files. CSV file must have headers,
+    as these are used to determine which fields to use to generate the detection. Detections at
+    the same time are yielded together, and such assume file is in time order.
+
+    Parameters
+    ----------
+    """
+
+
+class ParquetGroundTruthReader(_ColumnarGroundTruthReader, _ParquetReader):
+    """A reader for Parquet files of truth data.
+
+    States with the same ID will be put into a :class:`~.GroundTruthPath` in sequence, and all
+    paths that are updated at the same time are yielded together, and such assumes file is in
+    time order. The time field can be a timestamp column (with timezone aware times converted to
+    UTC), or as per :class:`~.CSVGroundTruthReader`.
+
+    Parameters
+    ----------
+    """
+
+
+class ParquetDetectionReader(_ColumnarDetectionReader, _ParquetReader):
+    """A detection reader for Parquet files of detections.
+
+    Detections at the same time are yielded together, and such assume file is in time order.
+    The time field can be a timestamp column (with timezone aware times converted to UTC), or as
+    per :class:`~.CSVDetectionReader`.
+
+    Parameters
+    ----------
+    """
+
+
+class ArrowGroundTruthReader(_ColumnarGroundTruthReader, _ArrowReader):
+    """A reader for Arrow IPC (Feather V2) files or streams of truth data.
+
+    The file is memory mapped. States with the same ID will be put into a
+    :class:`~.GroundTruthPath` in sequence, and all paths that are updated at the same time are
+    yielded together, and such assumes file is in time order. The time field can be a timestamp
+    column (with timezone aware times converted to UTC), or as per
+    :class:`~.CSVGroundTruthReader`.
+
+    Parameters
+    ----------
+    """
+
+
+class ArrowDetectionReader(_ColumnarDetectionReader, _ArrowReader):
+    """A detection reader for Arrow IPC (Feather V2) files or streams of detections.
+
+    The file is memory mapped. Detections at the same time are yielded together, and such
+    assume file is in time order. The time field can be a timestamp column (with timezone aware
+    times converted to UTC), or as per :class:`~.CSVDetectionReader`.
+
+    Parameters
+    ----------
+    """
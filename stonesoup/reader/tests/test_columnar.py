@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+import datetime
+from textwrap import dedent
+
+import numpy as np
+import pytest
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    from ..columnar import (
+        ColumnarCSVDetectionReader, ColumnarCSVGroundTruthReader, ParquetDetectionReader,
+        ParquetGroundTruthReader, ArrowDetectionReader, ArrowGroundTruthReader)
+except ImportError:
+    # Catch optional dependencies import error
+    pytest.skip("Skipping due to missing optional dependencies. Usage of columnar readers "
+                "requires that the optional package dependency 'pyarrow' is installed",
+                allow_module_level=True)
+
+from ..generic import CSVDetectionReader, CSVGroundTruthReader
+
+
+@pytest.fixture()
+def csv_filename(tmpdir):
+    csv_filename = tmpdir.join("test.csv")
+    with csv_filename.open('w') as csv_file:
+        csv_file.write(dedent("""\
+            x,y,z,identifier,t,epoch
+            10,20,30,22018332,2018-01-01T14:00:00Z,1514815200
+            11,21,31,22018332,2018-01-01T14:01:00Z,1514815260.25
+            12,22,32,22018332,2018-01-01T14:02:00Z,1514815320.5
+            13,23,,32018332,2018-01-01T14:02:00Z,1514815320.5
+            14,24,34,32018332,2018-01-01T14:02:00Z,1514815320.5
+            15,25,35,22018332,2018-01-01T14:03:00Z,1514815380.000001
+            16,26,36,32018332,2018-01-01T14:03:00Z,1514815380.000001
+            17,27,37,32018332,2018-01-01T14:04:00Z,1514815440
+            """))
+    return csv_filename
+
+
+def detection_stream(reader):
+    return [
+        (time, sorted(
+            ((*detection.state_vector.ravel(), detection.timestamp, detection.metadata)
+             for detection in detections),
+            key=lambda item: item[:2]))
+        for time, detections in reader]
+
+
+def groundtruth_stream(reader):
+    return [
+        (time, sorted(
+            ((path.id, len(path), *path.state_vector.ravel(), path.timestamp,
+              path.state.metadata)
+             for path in paths),
+            key=lambda item: item[:2]))
+        for time, paths in reader]
+
+
+@pytest.mark.parametrize('block_size', [2**24, 64], ids=['one_chunk', 'many_chunks'])
+@pytest.mark.parametrize(
+    'kwargs',
+    [{'time_field': 't'},
+     {'time_field': 't', 'time_field_format': '%Y-%m-%dT%H:%M:%SZ', 'metadata_fields': ['z']},
+     {'time_field': 'epoch', 'timestamp': True, 'metadata_fields': ['z', 'missing']}],
+    ids=['parse', 'format', 'timestamp'])
+def test_columnar_csv(csv_filename, kwargs, block_size):
+    expected = detection_stream(
+        CSVDetectionReader(csv_filename.strpath, ["x", "y"], **kwargs))
+    assert detection_stream(ColumnarCSVDetectionReader(
+        csv_filename.strpath, ["x", "y"], block_size=block_size, **kwargs)) == expected
+    assert len(expected) == 5
+
+    expected = groundtruth_stream(
+        CSVGroundTruthReader(csv_filename.strpath, ["x", "y"], path_id_field='identifier',
+                             **kwargs))
+    assert groundtruth_stream(ColumnarCSVGroundTruthReader(
+        csv_filename.strpath, ["x", "y"], path_id_field='identifier', block_size=block_size,
+        **kwargs)) == expected
+
+
+def test_columnar_csv_options(tmpdir):
+    csv_filename = tmpdir.join("test.csv")
+    with csv_filename.open('w') as csv_file:
+        csv_file.write(dedent("""\
+            10\t20\t1514815200
+            11\t21\t1514815260
+            """))
+
+    reader = ColumnarCSVDetectionReader(
+        csv_filename.strpath, ["x", "y"], "t", timestamp=True, column_names=['x', 'y', 't'],
+        csv_options={'delimiter': '\t'})
+    for n, (time, detections) in enumerate(reader):
+        detection, = detections
+        assert time == detection.timestamp == datetime.datetime(2018, 1, 1, 14, n)
+        assert np.array_equal(detection.state_vector, [[10 + n], [20 + n]])
+        assert detection.metadata == {}
+
+
+@pytest.fixture(params=['parquet', 'arrow_file', 'arrow_stream'])
+def columnar_file(request, csv_filename, tmpdir):
+    table = pacsv.read_csv(
+        csv_filename.strpath,
+        convert_options=pacsv.ConvertOptions(column_types={'identifier': pa.string()}))
+    filename = tmpdir.join(f"test.{request.param}").strpath
+    if request.param == 'parquet':
+        pq.write_table(table, filename, row_group_size=3)
+        return filename, ParquetDetectionReader, ParquetGroundTruthReader
+    elif request.param == 'arrow_file':
+        with pa.ipc.new_file(filename, table.schema) as writer:
+            writer.write_table(table, max_chunksize=3)
+    else:
+        with pa.ipc.new_stream(filename, table.schema) as writer:
+            writer.write_table(table, max_chunksize=3)
+    return filename, ArrowDetectionReader, ArrowGroundTruthReader
+
+
+def test_columnar_file(columnar_file, csv_filename):
+    filename, detection_reader, groundtruth_reader = columnar_file
+
+    # Timestamp column
+    expected = detection_stream(CSVDetectionReader(
+        csv_filename.strpath, ["x", "y"], 't', metadata_fields=['identifier']))
+    detections = detection_stream(detection_reader(
+        filename, ["x", "y"], 't', metadata_fields=['identifier']))
+    assert detections == expected
+
+    # Native types for metadata
+    expected = groundtruth_stream(CSVGroundTruthReader(
+        csv_filename.strpath, ["x", "y"], 'epoch', timestamp=True, path_id_field='identifier',
+        metadata_fields=['z']))
+    paths = groundtruth_stream(groundtruth_reader(
+        filename, ["x", "y"], 'epoch', timestamp=True, path_id_field='identifier',
+        metadata_fields=['z']))
+    assert [time for time, _ in paths] == [time for time, _ in expected]
+    for (_, time_paths), (_, expected_time_paths) in zip(paths, expected):
+        for path, expected_path in zip(time_paths, expected_time_paths):
+            assert path[:-1] == expected_path[:-1]
+            z = path[-1]['z']
+            assert z is None or z == int(expected_path[-1]['z'])
@@ -189,3 +189,58 @@ def test_tracks_yaml(tmpdir):
         total_tracks |= tracks
         ptime = time
     assert len(total_tracks) == 2
+
+
+def test_groundtruth_paths_yaml_delta(tmpdir):
+    filename = tmpdir.join("groundtruth_paths.yaml")
+    with filename.open('w') as file:
+        file.write(dedent("""\
+            ---
+            time: &id001 2018-01-01 14:00:00
+            groundtruth_paths: !!set
+              ? !stonesoup.types.groundtruth.GroundTruthPath
+              - states:
+                - !stonesoup.types.groundtruth.GroundTruthState
+                  - state_vector: !numpy.ndarray
+                    - [11]
+                  - timestamp: *id001
+              - id: '1'
+              :
+            deleted_groundtruth_paths: []
+            ...
+            ---
+            time: &id001 2018-01-01 14:01:00
+            groundtruth_paths: !!set
+              ? !stonesoup.types.groundtruth.GroundTruthPath
+              - states:
+                - !stonesoup.types.groundtruth.GroundTruthState
+                  - state_vector: !numpy.ndarray
+                    - [21]
+                  - timestamp: *id001
+              - id: '2'
+              :
+            deleted_groundtruth_paths: []
+            ...
+            ---
+            time: &id001 2018-01-01 14:02:00
+            groundtruth_paths: !!set
+              ? !stonesoup.types.groundtruth.GroundTruthPath
+              - states:
+                - !stonesoup.types.groundtruth.GroundTruthState
+                  - state_vector: !numpy.ndarray
+                    - [22]
+                  - timestamp: *id001
+              - id: '2'
+              :
+            deleted_groundtruth_paths: ['1']
+            ...
+            """))
+
+    reader = YAMLGroundTruthReader(filename.strpath, delta=True)
+    steps = [(time, {path.id: [state.state_vector[0, 0] for state in path] for path in paths})
+             for time, paths in reader]
+    assert steps == [
+        (datetime.datetime(2018, 1, 1, 14, 0), {'1': [11]}),
+        (datetime.datetime(2018, 1, 1, 14, 1), {'1': [11], '2': [21]}),
+        (datetime.datetime(2018, 1, 1, 14, 2), {'2': [21, 22]}),
+    ]
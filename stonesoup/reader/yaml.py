@@ -36,7 +36,13 @@ class YAMLDetectionReader(YAMLReader, DetectionReader):
 
 
 class YAMLGroundTruthReader(YAMLReader, GroundTruthReader):
-    """YAML Ground Truth Reader"""
+    """YAML Ground Truth Reader
+
+    In :attr:`delta` mode, reads files written by :class:`~.YAMLWriter` in delta mode, with
+    paths rebuilt from the new states at each time step, and all current paths yielded.
+    """
+    delta: bool = Property(
+        default=False, doc="Whether file was written in delta mode. Default `False`.")
 
     def data_gen(self):
         yield from super().data_gen()
@@ -45,6 +51,10 @@ class YAMLGroundTruthReader(YAMLReader, GroundTruthReader):
     def groundtruth_paths_gen(self):
         paths = dict()
         for time, document in self.data_gen():
+            if self.delta:
+                yield time, _apply_delta(paths, document, 'groundtruth_paths')
+                continue
+
             updated_paths = set()
             for path in document.get('groundtruth_paths', set()):
                 if path.id in paths:
@@ -69,7 +79,13 @@ class YAMLSensorDataReader(YAMLReader, SensorDataReader):
 
 
 class YAMLTrackReader(YAMLReader, Tracker):
-    """YAML Track Reader"""
+    """YAML Track Reader
+
+    In :attr:`delta` mode, reads files written by :class:`~.YAMLWriter` in delta mode, with
+    tracks rebuilt from the new states at each time step, and all current tracks yielded.
+    """
+    delta: bool = Property(
+        default=False, doc="Whether file was written in delta mode. Default `False`.")
 
     def data_gen(self):
         yield from super().data_gen()
@@ -85,6 +101,9 @@ class YAMLTrackReader(YAMLReader, Tracker):
 
     def __next__(self):
         time, document = next(self.data_iter)
+        if self.delta:
+            return time, _apply_delta(self._tracks, document, 'tracks')
+
         updated_tracks = set()
         for track in document.get('tracks', set()):
             if track.id in self.tracks:
@@ -94,3 +113,16 @@ class YAMLTrackReader(YAMLReader, Tracker):
             updated_tracks.add(self.tracks[track.id])
 
         return time, updated_tracks
+
+
+def _apply_delta(paths, document, key):
+    """Update `paths` (mapping of ID to track or path) from delta mode `document`, returning set
+    of current paths"""
+    for id_ in document.get(f'deleted_{key}', []):
+        paths.pop(id_, None)
+    for path in document.get(key, set()):
+        if path.id in paths:
+            paths[path.id].extend(path.states)
+        else:
+            paths[path.id] = path
+    return set(paths.values())
@@ -1,52 +1,198 @@
 # -*- coding: utf-8 -*-
+from typing import Optional
+
 import numpy as np
+from scipy.special import logsumexp
 
 from .base import Resampler
 from ..base import Property
-from ..types.numeric import Probability
 from ..types.particle import Particles
 
 
-class SystematicResampler(Resampler):
+class _IndexResampler(Resampler):
+    """Base class for resamplers which select particles by index, giving the selected particles
+    equal weight.
+
+    Subclasses implement :meth:`_indices`, which works on the array of log weights such that
+    selection is vectorised, with :class:`~.Probability` objects never created.
+    """
+
+    store_parent: bool = Property(
+        default=True,
+        doc="Whether to store the selected particles, with their weights prior to resampling, "
+            "as the :attr:`~.Particles.parent` of the resampled particles. Default `True`. "
+            "Setting `False` avoids a second copy of the resampled state vectors.")
+    seed: Optional[int] = Property(
+        default=None,
+        doc="Seed for random number generation. Default `None`, where the global numpy random "
+            "state is used.")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.random_state = np.random.RandomState(self.seed) if self.seed is not None \
+            else np.random
 
     def resample(self, particles):
         """Resample the particles
 
         Parameters
         ----------
-        particles : list of :class:`~.Particle`
+        particles : :class:`~.Particles` or list of :class:`~.Particle`
             The particles to be resampled according to their weight
 
         Returns
         -------
-        particles : list of :class:`~.Particle`
+        particles : :class:`~.Particles`
             The resampled particles
         """
 
         if not isinstance(particles, Particles):
             particles = Particles(particle_list=particles)
         n_particles = len(particles)
-        weight = Probability(1 / n_particles)
 
-        log_weights = np.array([weight.log_value for weight in particles.weight])
-        weight_order = np.argsort(log_weights, kind='stable')
-        max_log_value = log_weights[weight_order[-1]]
-        with np.errstate(divide='ignore'):
-            cdf = np.log(np.cumsum(np.exp(log_weights[weight_order] - max_log_value)))
-        cdf += max_log_value
+        index = self._indices(particles.log_weight)
+        if self.store_parent:
+            parent = Particles(state_vector=particles.state_vector[:, index],
+                               log_weight=particles.log_weight[index])
+        else:
+            parent = None
+        return Particles(state_vector=particles.state_vector[:, index],
+                         log_weight=np.full(n_particles, -np.log(n_particles)),
+                         parent=parent)
+
+    def _indices(self, log_weight):
+        """Indices of the particles selected, given their log weights
+
+        Parameters
+        ----------
+        log_weight : :class:`numpy.ndarray`
+            Log weights of the particles, which need not be normalised
+
+        Returns
+        -------
+        : :class:`numpy.ndarray` of int
+            Indices of selected particles, of same length as `log_weight`
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _normalised_weights(log_weight):
+        return np.exp(log_weight - logsumexp(log_weight))
+
+    @staticmethod
+    def _cumulative_weights(log_weight):
+        cdf = np.cumsum(_IndexResampler._normalised_weights(log_weight))
+        cdf[-1] = 1  # Remove any rounding error
+        return cdf
+
+    @staticmethod
+    def _counts_to_indices(counts):
+        return np.repeat(np.arange(len(counts)), counts)
+
+
+class SystematicResampler(_IndexResampler):
+    """Systematic Resampler
+
+    Selects particles with a single random offset to evenly spaced points on the cumulative
+    distribution of the weights, such that each particle is selected either the floor or ceiling
+    of its expected number of times.
+    """
+
+    def _indices(self, log_weight):
+        n_particles = len(log_weight)
+        cdf = self._cumulative_weights(log_weight)
+
+        # Number of points (j + u)/N, for j = 0..N-1, at or below each cumulative weight, with u
+        # in (0, 1] such that zero weight particles are never selected
+        u = 1 - self.random_state.uniform(0, 1)
+        num_below = np.clip(np.floor(n_particles*cdf - u) + 1, 0, n_particles).astype(int)
+        return self._counts_to_indices(np.diff(num_below, prepend=0))
 
-        # Pick random starting point
-        u_i = np.random.uniform(0, 1 / n_particles)
 
-        # Cycle through the cumulative distribution and copy the particle
-        # that pushed the score over the current value
-        u_j = u_i + (1 / n_particles) * np.arange(n_particles)
-        index = weight_order[np.searchsorted(cdf, np.log(u_j))]
-        new_particles = Particles(state_vector=particles.state_vector[:, index],
-                                  weight=[weight] * n_particles,
-                                  parent=Particles(state_vector=particles.state_vector[:, index],
-                                                   weight=particles.weight[index]))
-        return new_particles
+class StratifiedResampler(_IndexResampler):
+    """Stratified Resampler
+
+    Selects particles with points on the cumulative distribution of the weights drawn
+    independently and uniformly from each of N evenly sized strata.
+    """
+
+    def _indices(self, log_weight):
+        n_particles = len(log_weight)
+        cdf = self._cumulative_weights(log_weight)
+
+        # Number of points (j + u_j)/N, for j = 0..N-1, at or below each cumulative weight: all
+        # points of strata below that which the cumulative weight lies in, plus that of its own
+        # stratum if below it.
+        u = 1 - self.random_state.uniform(0, 1, n_particles)
+        scaled_cdf = n_particles * cdf
+        strata = np.minimum(np.floor(scaled_cdf).astype(int), n_particles)
+        num_below = strata + (
+            (strata < n_particles)
+            & (u[np.minimum(strata, n_particles - 1)] <= scaled_cdf - strata))
+        return self._counts_to_indices(np.diff(num_below, prepend=0))
+
+
+class MultinomialResampler(_IndexResampler):
+    """Multinomial Resampler
+
+    Selects particles independently with probability equal to their weight.
+    """
+
+    def _indices(self, log_weight):
+        n_particles = len(log_weight)
+        counts = self.random_state.multinomial(n_particles, self._normalised_weights(log_weight))
+        return self._counts_to_indices(counts)
+
+
+class ResidualResampler(_IndexResampler):
+    """Residual Resampler
+
+    Selects each particle the floor of its expected number of times, with the remaining
+    particles selected by multinomial resampling on the residual weights.
+    """
+
+    def _indices(self, log_weight):
+        n_particles = len(log_weight)
+        expected_counts = n_particles * self._normalised_weights(log_weight)
+        counts = np.floor(expected_counts).astype(int)
+
+        n_residual = n_particles - np.sum(counts)
+        if n_residual > 0:
+            residual_weights = expected_counts - counts
+            counts += self.random_state.multinomial(
+                n_residual, residual_weights / np.sum(residual_weights))
+        return self._counts_to_indices(counts)
+
+
+class MetropolisResampler(_IndexResampler):
+    """Metropolis Resampler
+
+    Selects each particle by running a Metropolis chain of :attr:`iterations` steps, starting
+    from the particle at the same index, with proposals drawn uniformly from all particles and
+    accepted based on the ratio of weights. As only ratios of weights are used, no sum over the
+    weights is required, making it suitable for parallel use [#]_. It is biased if the number of
+    iterations is too small relative to the spread of the weights.
+
+    References
+    ----------
+    .. [#] Murray, L.M., Lee, A. & Jacob, P.E. "Parallel resampling in the particle filter."
+       Journal of Computational and Graphical Statistics 25.3 (2016): 789-805.
+    """
+
+    iterations: int = Property(
+        default=20, doc="Number of Metropolis iterations for each particle. Default 20.")
+
+    def _indices(self, log_weight):
+        n_particles = len(log_weight)
+        index = np.arange(n_particles)
+        for _ in range(self.iterations):
+            proposal = self.random_state.randint(0, n_particles, n_particles)
+            # Uniform in (0, 1] such that zero weight particles are never accepted
+            log_u = np.log(1 - self.random_state.uniform(0, 1, n_particles))
+            with np.errstate(invalid='ignore'):
+                accept = log_u <= log_weight[proposal] - log_weight[index]
+            index = np.where(accept, proposal, index)
+        return index
 
 
 class ESSResampler(Resampler):
@@ -70,6 +216,11 @@ class ESSResampler(Resampler):
                                     doc='Resampler to wrap, which is called \
                                         when ESS below threshold')
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if isinstance(self.resampler, type):
+            self.resampler = self.resampler()
+
     def resample(self, particles):
         """
         Parameters
@@ -86,7 +237,8 @@ class ESSResampler(Resampler):
             particles = Particles(particle_list=particles)
         if self.threshold is None:
             self.threshold = len(particles) / 2
-        if 1 / np.sum(np.square(particles.weight)) < self.threshold:  # If ESS too small, resample
-            return self.resampler.resample(self.resampler, particles)
+        # If ESS too small, resample
+        if 1 / np.sum(np.exp(2*particles.log_weight)) < self.threshold:
+            return self.resampler.resample(particles)
         else:
             return particles
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import pytest
 
 from ...types.particle import Particle, \
     Particles
 from ..particle import SystematicResampler
 from ..particle import ESSResampler
+from ..particle import (
+    StratifiedResampler, MultinomialResampler, ResidualResampler, MetropolisResampler)
 
 
 def test_systematic_equal():
@@ -89,3 +92,82 @@ def test_ess_empty_threshold():
     resampler = ESSResampler()
     resampler.resample(particles)
     assert resampler.threshold == 5
+
+
+resamplers = pytest.mark.parametrize(
+    'resampler',
+    [SystematicResampler(seed=1), StratifiedResampler(seed=1), MultinomialResampler(seed=1),
+     ResidualResampler(seed=1), MetropolisResampler(iterations=200, seed=1)],
+    ids=['systematic', 'stratified', 'multinomial', 'residual', 'metropolis'])
+
+
+@resamplers
+def test_resampler_single(resampler):
+    particles = Particles(np.arange(20)[np.newaxis, :],
+                          log_weight=[0 if i == 10 else -np.inf for i in range(20)])
+
+    new_particles = resampler.resample(particles)
+
+    assert len(new_particles) == 20
+    assert np.all(new_particles.state_vector == 10)
+    assert np.allclose(new_particles.log_weight, -np.log(20))
+
+
+@resamplers
+def test_resampler_proportions(resampler):
+    # Random weights (unnormalised), with proportions compared over four groups of particles
+    weights = np.random.RandomState(2).uniform(0, 1, 1000)
+    particles = Particles(np.arange(1000)[np.newaxis, :], log_weight=np.log(weights) - 1000)
+
+    new_particles = resampler.resample(particles)
+
+    index = np.asarray(new_particles.state_vector, dtype=int).ravel()
+    groups = np.arange(1000) % 4
+    proportions = np.bincount(groups[index], minlength=4) / 1000
+    expected_proportions = np.bincount(groups, weights, minlength=4) / np.sum(weights)
+    assert np.allclose(proportions, expected_proportions, atol=0.05)
+
+    counts = np.bincount(index, minlength=1000)
+    expected_counts = 1000 * weights / np.sum(weights)
+    if isinstance(resampler, (SystematicResampler, ResidualResampler)):
+        # Each particle selected at least floor of expected number of times
+        assert np.all(counts >= np.floor(expected_counts))
+    if isinstance(resampler, SystematicResampler):
+        # ...and at most the ceiling
+        assert np.all(counts <= np.ceil(expected_counts))
+
+
+@pytest.mark.parametrize('store_parent', [True, False])
+@pytest.mark.parametrize(
+    'resampler_class',
+    [SystematicResampler, StratifiedResampler, MultinomialResampler, ResidualResampler,
+     MetropolisResampler])
+def test_resampler_parent(resampler_class, store_parent):
+    log_weight = np.log(np.arange(1, 11) / 55)
+    particles = Particles(np.arange(10)[np.newaxis, :], log_weight=log_weight)
+
+    new_particles = resampler_class(store_parent=store_parent).resample(particles)
+
+    if store_parent:
+        assert np.array_equal(new_particles.parent.state_vector, new_particles.state_vector)
+        index = np.asarray(new_particles.state_vector, dtype=int).ravel()
+        assert np.array_equal(new_particles.parent.log_weight, log_weight[index])
+    else:
+        assert new_particles.parent is None
+
+
+def test_resampler_seed():
+    particles = Particles(np.arange(100)[np.newaxis, :], log_weight=np.log(np.arange(100) + 1))
+    for resampler_class in (StratifiedResampler, MultinomialResampler, MetropolisResampler):
+        assert np.array_equal(resampler_class(seed=5).resample(particles).state_vector,
+                              resampler_class(seed=5).resample(particles).state_vector)
+
+
+def test_ess_resampler_instance():
+    particles = Particles(np.arange(10)[np.newaxis, :], log_weight=np.log(np.arange(1, 11) / 55))
+
+    resampler = ESSResampler(10, resampler=ResidualResampler(store_parent=False))
+    new_particles = resampler.resample(particles)
+
+    assert np.allclose(new_particles.log_weight, -np.log(10))
+    assert new_particles.parent is None
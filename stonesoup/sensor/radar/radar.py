@@ -15,7 +15,7 @@ from ...models.measurement.nonlinear import \
     (CartesianToBearingRange, CartesianToElevationBearingRange,
      CartesianToBearingRangeRate, CartesianToElevationBearingRangeRate)
 from ...sensor.sensor import Sensor
-from ...types.array import CovarianceMatrix
+from ...types.array import CovarianceMatrix, StateVectors
 from ...types.detection import TrueDetection
 from ...types.groundtruth import GroundTruthState
 from ...types.numeric import Probability
@@ -23,6 +23,13 @@ from ...types.state import State, StateVector
 from ...models.clutter.clutter import ClutterModel
 
 
+def _model_key(kwargs):
+    """Key of measurement model parameters, for comparison with arrays compared by value"""
+    return tuple(
+        (name, (value.shape, value.ravel().tolist()) if isinstance(value, np.ndarray) else value)
+        for name, value in kwargs.items())
+
+
 class RadarBearingRange(Sensor):
     """A simple radar sensor that generates measurements of targets, using a
     :class:`~.CartesianToBearingRange` model, relative to its position.
@@ -50,24 +57,65 @@ class RadarBearingRange(Sensor):
             ":class:`Clutter` ojects to the measurements at each time step. "
             "The clutter is simulated according to the provided distribution.")
 
-    def measure(self, ground_truths: Set[GroundTruthState], noise: Union[np.ndarray, bool] = True,
-                **kwargs) -> Set[TrueDetection]:
+    _measurement_model_class = CartesianToBearingRange
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._measurement_model_cache = None, None
 
-        measurement_model = CartesianToBearingRange(
+    def _measurement_model_kwargs(self):
+        return dict(
             ndim_state=self.ndim_state,
             mapping=self.position_mapping,
             noise_covar=self.noise_covar,
             translation_offset=self.position,
             rotation_offset=self.orientation)
 
-        detections = set()
-        for truth in ground_truths:
-            measurement_vector = measurement_model.function(truth, noise=noise, **kwargs)
-            detection = TrueDetection(measurement_vector,
-                                      measurement_model=measurement_model,
-                                      timestamp=truth.timestamp,
-                                      groundtruth_path=truth)
-            detections.add(detection)
+    @property
+    def measurement_model(self):
+        """Measurement model of the sensor at its current position and orientation
+
+        The model is cached, and only recreated when any of its parameters (e.g. the position or
+        orientation of the sensor, or its platform) change. As such, the model is shared between
+        detections, and shouldn't be modified.
+        """
+        kwargs = self._measurement_model_kwargs()
+        key = _model_key(kwargs)
+        cached_key, measurement_model = self._measurement_model_cache
+        if measurement_model is None or key != cached_key:
+            measurement_model = self._measurement_model_class(**kwargs)
+            self._measurement_model_cache = key, measurement_model
+        return measurement_model
+
+    @staticmethod
+    def _measurement_vectors(measurement_model, ground_truths, noise, **kwargs):
+        """Measurement vectors of all truths, from a single call to the model function"""
+        states = State(ground_truths[0].state_vector)
+        states.state_vector = StateVectors([truth.state_vector for truth in ground_truths])
+        if noise is True:
+            noise = measurement_model.rvs(num_samples=len(ground_truths))
+        return measurement_model.function(states, noise=noise, **kwargs)
+
+    @staticmethod
+    def _detections(measurement_model, ground_truths, measurement_vectors):
+        return {TrueDetection(measurement_vectors[:, index:index+1],
+                              measurement_model=measurement_model,
+                              timestamp=truth.timestamp,
+                              groundtruth_path=truth)
+                for index, truth in enumerate(ground_truths)}
+
+    def measure(self, ground_truths: Set[GroundTruthState], noise: Union[np.ndarray, bool] = True,
+                **kwargs) -> Set[TrueDetection]:
+
+        measurement_model = self.measurement_model
+
+        truths = list(ground_truths)
+        if truths:
+            measurement_vectors = self._measurement_vectors(
+                measurement_model, truths, noise, **kwargs)
+            detections = self._detections(measurement_model, truths, measurement_vectors)
+        else:
+            detections = set()
 
         # Generate clutter at this time step
         if self.clutter_model is not None:
@@ -113,56 +161,43 @@ class RadarRotatingBearingRange(RadarBearingRange):
             # No ground truths to get timestamp from
             return set()
 
-        # Rotate the radar antenna and compute new heading
+        # Rotate the radar antenna
         self.rotate(timestamp)
-        antenna_heading = self.orientation[2, 0] + self.dwell_center.state_vector[0, 0]
 
-        # Set rotation offset of underlying measurement model
+        measurement_model = self.measurement_model
+
+        # Transform states to measurement space
+        truths = list(ground_truths)
+        measurement_vectors = self._measurement_vectors(
+            measurement_model, truths, noise=False, **kwargs)
+
+        # Generate random noise
+        if noise is True:
+            noise = measurement_model.rvs(num_samples=len(truths))
+
+        # Check if states fall within sensor's FOV
+        fov_min = -self.fov_angle / 2
+        fov_max = +self.fov_angle / 2
+        bearings = measurement_vectors[0, :].astype(float)
+        ranges = measurement_vectors[1, :].astype(float)
+
+        # Only measure states in FOV, adding noise
+        measurement_vectors = measurement_vectors + noise
+        in_fov = np.flatnonzero(
+            (bearings <= fov_max) & (bearings >= fov_min) & (ranges <= self.max_range))
+        return self._detections(
+            measurement_model, [truths[index] for index in in_fov],
+            measurement_vectors[:, in_fov])
+
+    def _measurement_model_kwargs(self):
+        # Set rotation offset of underlying measurement model to antenna heading
+        antenna_heading = self.orientation[2, 0] + self.dwell_center.state_vector[0, 0]
         rot_offset = \
             StateVector(
                 [[self.orientation[0, 0]],
                  [self.orientation[1, 0]],
                  [antenna_heading]])
-
-        measurement_model = CartesianToBearingRange(
-            ndim_state=self.ndim_state,
-            mapping=self.position_mapping,
-            noise_covar=self.noise_covar,
-            translation_offset=self.position,
-            rotation_offset=rot_offset)
-
-        detections = set()
-        for truth in ground_truths:
-            # Transform state to measurement space and generate
-            # random noise
-            measurement_vector = measurement_model.function(truth, noise=False, **kwargs)
-
-            if noise is True:
-                measurement_noise = measurement_model.rvs()
-            else:
-                measurement_noise = noise
-
-            # Check if state falls within sensor's FOV
-            fov_min = -self.fov_angle / 2
-            fov_max = +self.fov_angle / 2
-            bearing_t = measurement_vector[0, 0]
-            range_t = measurement_vector[1, 0]
-
-            # Do not measure if state not in FOV
-            if (bearing_t > fov_max or bearing_t < fov_min
-                    or range_t > self.max_range):
-                continue
-
-            # Else add measurement
-            measurement_vector += measurement_noise  # Add noise
-
-            detection = TrueDetection(measurement_vector,
-                                      measurement_model=measurement_model,
-                                      timestamp=truth.timestamp,
-                                      groundtruth_path=truth)
-            detections.add(detection)
-
-        return detections
+        return {**super()._measurement_model_kwargs(), 'rotation_offset': rot_offset}
 
     def rotate(self, timestamp):
         """Rotate the sensor's antenna
@@ -207,32 +242,7 @@ class RadarElevationBearingRange(RadarBearingRange):
             "(and follow in format) the underlying "
             ":class:`~.CartesianToElevationBearingRange` model")
 
-    def measure(self, ground_truths: Set[GroundTruthState], noise: Union[np.ndarray, bool] = True,
-                **kwargs) -> Set[TrueDetection]:
-
-        measurement_model = CartesianToElevationBearingRange(
-            ndim_state=self.ndim_state,
-            mapping=self.position_mapping,
-            noise_covar=self.noise_covar,
-            translation_offset=self.position,
-            rotation_offset=self.orientation)
-
-        detections = set()
-        for truth in ground_truths:
-            measurement_vector = measurement_model.function(truth, noise=noise, **kwargs)
-            detection = TrueDetection(measurement_vector,
-                                      measurement_model=measurement_model,
-                                      timestamp=truth.timestamp,
-                                      groundtruth_path=truth)
-            detections.add(detection)
-
-        # Generate clutter at this time step
-        if self.clutter_model is not None:
-            self.clutter_model.measurement_model = measurement_model
-            clutter = self.clutter_model.function(ground_truths)
-            detections = set.union(detections, clutter)
-
-        return detections
+    _measurement_model_class = CartesianToElevationBearingRange
 
 
 class RadarBearingRangeRate(RadarBearingRange):
@@ -259,28 +269,24 @@ class RadarBearingRangeRate(RadarBearingRange):
             "(and follow in format) the underlying "
             ":class:`~.CartesianToBearingRangeRate` model")
 
+    _measurement_model_class = CartesianToBearingRangeRate
+
+    def _measurement_model_kwargs(self):
+        return {**super()._measurement_model_kwargs(),
+                'velocity_mapping': self.velocity_mapping,
+                'velocity': self.velocity}
+
     def measure(self, ground_truths: Set[GroundTruthState], noise: Union[np.ndarray, bool] = True,
                 **kwargs) -> Set[TrueDetection]:
 
-        measurement_model = CartesianToBearingRangeRate(
-            ndim_state=self.ndim_state,
-            mapping=self.position_mapping,
-            velocity_mapping=self.velocity_mapping,
-            noise_covar=self.noise_covar,
-            translation_offset=self.position,
-            velocity=self.velocity,
-            rotation_offset=self.orientation)
+        measurement_model = self.measurement_model
 
-        detections = set()
-        for truth in ground_truths:
-            measurement_vector = measurement_model.function(truth, noise=noise, **kwargs)
-            detection = TrueDetection(measurement_vector,
-                                      measurement_model=measurement_model,
-                                      timestamp=truth.timestamp,
-                                      groundtruth_path=truth)
-            detections.add(detection)
-
-        return detections
+        truths = list(ground_truths)
+        if not truths:
+            return set()
+        measurement_vectors = self._measurement_vectors(
+            measurement_model, truths, noise, **kwargs)
+        return self._detections(measurement_model, truths, measurement_vectors)
 
 
 class RadarElevationBearingRangeRate(RadarBearingRangeRate):
@@ -306,28 +312,7 @@ class RadarElevationBearingRangeRate(RadarBearingRangeRate):
             "(and follow in format) the underlying "
             ":class:`~.CartesianToElevationBearingRangeRate` model")
 
-    def measure(self, ground_truths: Set[GroundTruthState], noise: Union[np.ndarray, bool] = True,
-                **kwargs) -> Set[TrueDetection]:
-
-        measurement_model = CartesianToElevationBearingRangeRate(
-            ndim_state=self.ndim_state,
-            mapping=self.position_mapping,
-            velocity_mapping=self.velocity_mapping,
-            noise_covar=self.noise_covar,
-            translation_offset=self.position,
-            velocity=self.velocity,
-            rotation_offset=self.orientation)
-
-        detections = set()
-        for truth in ground_truths:
-            measurement_vector = measurement_model.function(truth, noise=noise, **kwargs)
-            detection = TrueDetection(measurement_vector,
-                                      measurement_model=measurement_model,
-                                      timestamp=truth.timestamp,
-                                      groundtruth_path=truth)
-            detections.add(detection)
-
-        return detections
+    _measurement_model_class = CartesianToElevationBearingRangeRate
 
 
 class RadarRasterScanBearingRange(RadarRotatingBearingRange):
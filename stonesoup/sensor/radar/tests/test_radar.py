@@ -260,6 +260,79 @@ def test_range_rate_radar(h, sensorclass, pos_mapping, vel_mapping, noise_covar,
         assert measurement.groundtruth_path in truth
 
 
+@pytest.mark.parametrize(
+    "sensorclass, ndim_state, kwargs",
+    [
+        (RadarBearingRange, 2,
+         {'position_mapping': (0, 1), 'noise_covar': np.diag([0.015, 0.1])}),
+        (RadarElevationBearingRange, 3,
+         {'position_mapping': (0, 1, 2), 'noise_covar': np.diag([0.015, 0.015, 0.1])}),
+        (RadarBearingRangeRate, 6,
+         {'position_mapping': (0, 2, 4), 'velocity_mapping': (1, 3, 5),
+          'noise_covar': np.diag([0.015, 0.1, 1])}),
+        (RadarElevationBearingRangeRate, 6,
+         {'position_mapping': (0, 2, 4), 'velocity_mapping': (1, 3, 5),
+          'noise_covar': np.diag([0.015, 0.015, 0.1, 1])}),
+    ],
+    ids=["RadarBearingRange", "RadarElevationBearingRange", "RadarBearingRangeRate",
+         "RadarElevationBearingRangeRate"]
+)
+def test_radar_measurement_model_cache(sensorclass, ndim_state, kwargs):
+    radar = sensorclass(ndim_state=ndim_state, position=StateVector([[1], [2], [3]]), **kwargs)
+
+    measurement_model = radar.measurement_model
+    assert radar.measurement_model is measurement_model
+    assert np.array_equal(measurement_model.translation_offset, radar.position)
+    assert np.array_equal(measurement_model.rotation_offset, radar.orientation)
+
+    timestamp = datetime.datetime.now()
+    truths = {GroundTruthPath([GroundTruthState(
+        np.arange(ndim_state).reshape(-1, 1) * 10 + index, timestamp=timestamp)])
+        for index in range(5)}
+    detections = radar.measure(truths)
+    assert len(detections) == 5
+    assert all(detection.measurement_model is measurement_model for detection in detections)
+
+    # Rebuilt on change in position, orientation or other properties
+    radar.position = StateVector([[2], [2], [3]])
+    assert radar.measurement_model is not measurement_model
+    assert np.array_equal(radar.measurement_model.translation_offset, radar.position)
+    measurement_model = radar.measurement_model
+
+    radar.orientation = StateVector([[0], [0], [np.pi / 4]])
+    assert radar.measurement_model is not measurement_model
+    assert np.array_equal(radar.measurement_model.rotation_offset, radar.orientation)
+    measurement_model = radar.measurement_model
+
+    radar.noise_covar = radar.noise_covar * 2
+    assert radar.measurement_model is not measurement_model
+    assert np.array_equal(radar.measurement_model.noise_covar, radar.noise_covar)
+    measurement_model = radar.measurement_model
+    assert radar.measurement_model is measurement_model
+
+    # Detections from earlier measurements keep their model
+    assert all(detection.measurement_model is not measurement_model
+               for detection in detections)
+
+    # Measurements of all truths together same as each individually
+    detections = radar.measure(truths, noise=False)
+    assert len(detections) == 5
+    for detection in detections:
+        assert detection.state_vector.shape == (measurement_model.ndim_meas, 1)
+        assert np.allclose(
+            detection.state_vector.astype(float),
+            measurement_model.function(detection.groundtruth_path, noise=False).astype(float))
+
+    # With noise drawn for each truth
+    detections = radar.measure(truths)
+    errors = {tuple(np.ravel((detection.state_vector - measurement_model.function(
+        detection.groundtruth_path, noise=False)).astype(float)))
+        for detection in detections}
+    assert len(errors) == 5
+
+    assert radar.measure(set()) == set()
+
+
 @pytest.mark.parametrize(
     "radar_position, radar_orientation, state, measurement_mapping, noise_covar,"
     " dwell_center, rpm, max_range, fov_angle, timestamp_flag",
@@ -32,6 +32,7 @@ For example:
 .. _YAML: http://yaml.org/
 .. _ruamel.yaml: https://yaml.readthedocs.io/
 """
+import base64
 import datetime
 import warnings
 from io import StringIO
@@ -44,11 +45,13 @@ import numpy as np
 import pkg_resources
 import ruamel.yaml
 from ruamel.yaml.constructor import ConstructorError
+from ruamel.yaml.nodes import MappingNode
 
-from .base import Base, Property
+from .base import Base, BaseMeta, Property
 from .types.angle import Angle
 from .types.array import Matrix, StateVector
 from .types.numeric import Probability
+from .types.particle import Particles
 from .sensor.sensor import Sensor
 
 __all__ = ['YAML']
@@ -77,6 +80,9 @@ def init_typ(yaml):
     yaml.representer.add_multi_representer(Path, path_to_yaml)
     yaml.constructor.add_constructor("!pathlib.Path", path_from_yaml)
 
+    # set subclasses (e.g. indexed sets), represented as set
+    yaml.representer.add_multi_representer(set, yaml.representer.yaml_representers[set])
+
     # deque
     yaml.representer.add_representer(deque, deque_to_yaml)
     yaml.constructor.add_constructor("!collections.deque", deque_from_yaml)
@@ -98,9 +104,18 @@ def init_typ(yaml):
 
 
 class YAML(ruamel.yaml.YAML):
-    """Class for YAML serialisation in Stone Soup."""
-
-    def __init__(self, **kwargs):
+    """Class for YAML serialisation in Stone Soup.
+
+    Parameters
+    ----------
+    compact_arrays : bool, optional
+        Whether to represent NumPy arrays (including Stone Soup array types) compactly, as dtype,
+        shape and base64 encoded data, rather than as (human readable) sequences of values.
+        Both representations are read regardless. Default `False`.
+    """
+
+    def __init__(self, compact_arrays=False, **kwargs):
+        self.compact_arrays = compact_arrays
         typ = kwargs.pop('typ', ['rt'])
         if isinstance(typ, str):
             typ = [typ]
@@ -137,6 +152,9 @@ def declarative_to_yaml(representer, node):
     if isinstance(node, Sensor) and node._has_internal_controller:
         node_properties['position'] = Property(StateVector)
         node_properties['orientation'] = Property(StateVector)
+    # Special case of particles, where weights are derived from log weights
+    if isinstance(node, Particles):
+        del node_properties['weight']
     return representer.represent_omap(
         yaml_tag(type(node)),
         OrderedDict((name, getattr(node, name))
@@ -164,22 +182,30 @@ def declarative_from_yaml(constructor, tag_suffix, node):
                                node.start_mark, str(e), node.start_mark)
 
 
-@lru_cache(None)
 def get_class(tag):
-    classes = [
-        subclass
-        for subclass in Base.subclasses
-        if yaml_tag(subclass) == tag]
+    """Return class for YAML tag
+
+    Classes are found from the registry of Stone Soup declarative classes (see
+    :meth:`~.BaseMeta.classes_by_name`), otherwise the module is imported. Where a class has been
+    redefined, the most recent definition is returned.
+    """
+    name = tag.lstrip('!')
+    classes = BaseMeta.classes_by_name(name)
     if len(classes) > 1:
         warnings.warn(
             f"Multiple possible classes found for YAML tag {tag!r}", UserWarning)
     elif not classes:
-        module_name, class_name = tag.lstrip('!').rsplit(".", 1)
-        module = import_module(module_name)
-        classes = [getattr(module, class_name, None)]
-    if classes[0] is None:
+        classes = [_import_class(name)]
+    if classes[-1] is None:
         raise ImportError(f"Unable to find {tag!r}")
-    return classes[0]
+    return classes[-1]
+
+
+@lru_cache(None)
+def _import_class(name):
+    module_name, class_name = name.rsplit(".", 1)
+    module = import_module(module_name)
+    return getattr(module, class_name, None)
 
 
 def probability_to_yaml(representer, node):
@@ -204,7 +230,20 @@ def angle_from_yaml(constructor, tag_suffix, node):
 
 
 def ndarray_to_yaml(representer, node):
-    """Convert numpy.ndarray to YAML."""
+    """Convert numpy.ndarray to YAML.
+
+    Represented as sequence of values, unless :attr:`YAML.compact_arrays` is enabled, where
+    represented as mapping of `dtype`, `shape` and base64 encoded `data` (except arrays of
+    objects)."""
+    if getattr(representer.dumper, 'compact_arrays', False) and not node.dtype.hasobject:
+        shape = list(node.shape)
+        if 'rt' in representer.dumper.typ:
+            shape = representer.dumper.seq(shape)
+            shape.fa.set_flow_style()
+        return representer.represent_mapping(yaml_tag(type(node)), OrderedDict((
+            ('dtype', node.dtype.str),
+            ('shape', shape),
+            ('data', base64.b64encode(np.ascontiguousarray(node).data).decode('ascii')))))
 
     # If using "round trip" type, change flow style to make more readable
     if node.ndim > 1 and 'rt' in representer.dumper.typ:
@@ -215,15 +254,28 @@ def ndarray_to_yaml(representer, node):
     return representer.represent_sequence(yaml_tag(type(node)), array)
 
 
+def _construct_array(constructor, node):
+    """Construct array from either sequence of values, or compact mapping representation."""
+    if isinstance(node, MappingNode):
+        mapping = {constructor.construct_scalar(key_node): value_node
+                   for key_node, value_node in node.value}
+        shape = [int(value) for value in constructor.construct_sequence(mapping['shape'])]
+        # Decoded to bytearray, such that array is writeable
+        return np.frombuffer(
+            bytearray(base64.b64decode(constructor.construct_scalar(mapping['data']))),
+            dtype=constructor.construct_scalar(mapping['dtype'])).reshape(shape)
+    return constructor.construct_sequence(node, deep=True)
+
+
 def ndarray_from_yaml(constructor, node):
     """Convert YAML to numpy.ndarray."""
-    return np.array(constructor.construct_sequence(node, deep=True))
+    return np.array(_construct_array(constructor, node))
 
 
 def array_from_yaml(constructor, tag_suffix, node):
     """Convert YAML to numpy.ndarray."""
     class_ = get_class(f'!stonesoup.types.array.{tag_suffix}')
-    return class_(constructor.construct_sequence(node, deep=True))
+    return class_(_construct_array(constructor, node))
 
 
 def timedelta_to_yaml(representer, node):
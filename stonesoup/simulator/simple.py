@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import copy
 from typing import Optional
 import datetime
 from typing import Sequence
@@ -10,6 +11,7 @@ from ..base import Property
 from ..models.measurement import MeasurementModel
 from ..models.transition import TransitionModel
 from ..reader import GroundTruthReader
+from ..types.array import StateVectors
 from ..types.detection import TrueDetection, Clutter
 from ..types.groundtruth import GroundTruthPath, GroundTruthState
 from ..types.numeric import Probability
@@ -177,6 +179,15 @@ class SimpleDetectionSimulator(DetectionSimulator):
     clutter_rate: float = Property(default=2.0)
     seed: Optional[int] = Property(default=None, doc="Seed for random number generation."
                                                      " Default None")
+    vectorised: bool = Property(
+        default=False,
+        doc="Whether to simulate all truths at each time step together: with one draw for "
+            "detection, noise for all detected truths drawn with one call to "
+            ":meth:`~.Model.rvs`, one call to :meth:`~.MeasurementModel.function` with the "
+            "stacked states of detected truths, and all clutter drawn as a single array. The "
+            "measurement model must support :class:`~.StateVectors`. As random numbers are "
+            "drawn in a different order, clutter differs from the default (sequential) "
+            "simulation for the same seed. Default `False`.")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -207,6 +218,11 @@ class SimpleDetectionSimulator(DetectionSimulator):
             self.real_detections.clear()
             self.clutter_detections.clear()
             random_state = random_state if random_state is not None else self.random_state
+            if self.vectorised:
+                self._simulate_vectorised(time, tracks, random_state)
+                yield time, self.real_detections | self.clutter_detections
+                continue
+
             for track in tracks:
                 self.index = track[-1].metadata.get("index")
                 if random_state.rand() < self.detection_probability:
@@ -230,6 +246,46 @@ class SimpleDetectionSimulator(DetectionSimulator):
 
             yield time, self.real_detections | self.clutter_detections
 
+    def _simulate_vectorised(self, time, tracks, random_state):
+        tracks = list(tracks)
+        # Probability evaluated per track, as may depend on current index (e.g. for
+        # SwitchDetectionSimulator)
+        probabilities = np.empty(len(tracks))
+        for index, track in enumerate(tracks):
+            self.index = track[-1].metadata.get("index")
+            probabilities[index] = self.detection_probability
+        detected_tracks = [
+            track for track, detected in zip(
+                tracks, random_state.rand(len(tracks)) < probabilities)
+            if detected]
+
+        if detected_tracks:
+            states = copy.copy(detected_tracks[0][-1])
+            states.state_vector = StateVectors(
+                [track[-1].state_vector for track in detected_tracks])
+            noise = self.measurement_model.rvs(num_samples=len(detected_tracks))
+            measurements = self.measurement_model.function(states, noise=noise)
+            for index, track in enumerate(detected_tracks):
+                detection = TrueDetection(
+                    measurements[:, index:index+1],
+                    timestamp=track[-1].timestamp,
+                    groundtruth_path=track,
+                    measurement_model=self.measurement_model)
+                detection.clutter = False
+                self.real_detections.add(detection)
+
+        # generate clutter
+        num_clutter = random_state.poisson(self.clutter_rate)
+        clutter = random_state.rand(self.measurement_model.ndim_meas, num_clutter) \
+            * np.diff(self.meas_range) + self.meas_range[:, :1]
+        in_range = np.all(
+            (self.meas_range[:, :1] <= clutter) & (clutter <= self.meas_range[:, -1:]), axis=0)
+        for state_vector in clutter[:, in_range].T:
+            self.clutter_detections.add(Clutter(
+                state_vector[:, np.newaxis],
+                timestamp=time,
+                measurement_model=self.measurement_model))
+
 
 class SwitchDetectionSimulator(SimpleDetectionSimulator):
 
@@ -4,9 +4,13 @@ import datetime
 import pytest
 import numpy as np
 
-from ...types.state import State
+from ...models.measurement.linear import LinearGaussian
+from ...models.transition.linear import (
+    CombinedLinearGaussianTransitionModel, ConstantVelocity)
+from ...types.state import GaussianState, State
 from ..simple import SimpleDetectionSimulator, SwitchDetectionSimulator,\
-    SingleTargetGroundTruthSimulator, SwitchOneTargetGroundTruthSimulator
+    SingleTargetGroundTruthSimulator, SwitchOneTargetGroundTruthSimulator, \
+    MultiTargetGroundTruthSimulator
 
 
 @pytest.fixture(params=[datetime.timedelta(seconds=1),
@@ -111,3 +115,73 @@ def test_switch_detection_simulator(
     # of detection at some point.
     assert len(total_detections - clutter_detections) \
         < len(test_detections - test_clutter_detections)
+
+
+def test_simple_detection_simulator_vectorised():
+    initial_state = GaussianState(
+        np.array([[0], [1], [0], [1]]), np.diag([1000, 1, 1000, 1]),
+        timestamp=datetime.datetime(2020, 1, 1))
+    transition_model = CombinedLinearGaussianTransitionModel(
+        [ConstantVelocity(0.05), ConstantVelocity(0.05)])
+    measurement_model = LinearGaussian(4, [0, 2], np.diag([1, 1]))
+    groundtruth = MultiTargetGroundTruthSimulator(
+        transition_model, initial_state, birth_rate=5, death_probability=0.01,
+        number_steps=20, seed=2)
+    meas_range = np.array([[-1, 1], [-1, 1]]) * 500
+
+    simulate_detections = SimpleDetectionSimulator(
+        groundtruth, measurement_model, meas_range, clutter_rate=3, seed=1, vectorised=True)
+
+    num_truths = num_true_detections = num_clutter = 0
+    for time, detections in simulate_detections:
+        num_truths += len(groundtruth.groundtruth_paths)
+        true_detections = simulate_detections.real_detections
+        clutter_detections = simulate_detections.clutter_detections
+        assert detections == true_detections | clutter_detections
+        num_true_detections += len(true_detections)
+        num_clutter += len(clutter_detections)
+
+        for detection in true_detections:
+            truth = detection.groundtruth_path[-1]
+            assert detection.timestamp == truth.timestamp == time
+            assert detection.state_vector.shape == (2, 1)
+            # Noise added to each detection independently
+            assert np.all(np.abs(
+                detection.state_vector - truth.state_vector[[0, 2], :]) < 10)
+
+        # Check clutter is generated within specified bounds
+        for clutter in clutter_detections:
+            assert clutter.timestamp == time
+            assert clutter.state_vector.shape == (2, 1)
+            assert (meas_range[:, 0] <= clutter.state_vector.ravel()).all()
+            assert (meas_range[:, 1] >= clutter.state_vector.ravel()).all()
+
+    assert 0 < num_true_detections < num_truths
+    assert num_clutter > 0
+    noise = [detection.state_vector - detection.groundtruth_path[-1].state_vector[[0, 2], :]
+             for detection in true_detections]
+    assert len({tuple(vector.ravel()) for vector in noise}) == len(noise)
+
+
+def test_switch_detection_simulator_vectorised(transition_model1, transition_model2):
+    initial_state = State(
+        np.array([[0], [0], [0], [0]]), timestamp=datetime.datetime.now())
+    groundtruth = SwitchOneTargetGroundTruthSimulator(
+        transition_models=[transition_model1, transition_model2],
+        model_probs=[[0.5, 0.5], [0.5, 0.5]],
+        initial_state=initial_state,
+        timestep=datetime.timedelta(seconds=1),
+        seed=3)
+    measurement_model = LinearGaussian(4, [0, 2], np.diag([1e-6, 1e-6]))
+    meas_range = np.array([[-1, 1], [-1, 1]]) * 5000
+
+    detector = SwitchDetectionSimulator(
+        groundtruth, measurement_model, meas_range, clutter_rate=0,
+        detection_probabilities=[0, 1], vectorised=True)
+
+    for time, detections in detector:
+        truth = next(iter(groundtruth.groundtruth_paths))[-1]
+        # Detection probability of current model of target used
+        assert len(detections) == truth.metadata['index']
+        for detection in detections:
+            assert np.allclose(detection.state_vector, truth.state_vector[[0, 2], :], atol=0.1)
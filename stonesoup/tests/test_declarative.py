@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import inspect
+import re
 from typing import List, Any
 
 import pytest
@@ -90,6 +92,35 @@ def test_init_new(base):
     assert not hasattr(_TestNew(1, "2", property_d="10"), 'property_d')
 
 
+def test_init_binding(base):
+    # Same errors as binding with signature
+    for args, kwargs in [
+            ((), {}),
+            ((1, ), {}),
+            ((1, "2", 3, 4), {}),
+            ((1, "2"), {'property_d': 4}),
+            ((1, "2"), {'property_a': 1})]:
+        with pytest.raises(TypeError) as signature_error:
+            inspect.signature(base).bind(*args, **kwargs)
+        with pytest.raises(TypeError, match=f"^{re.escape(str(signature_error.value))}$"):
+            base(*args, **kwargs)
+
+    test_obj = base(property_b="2", property_a=1)
+    assert (test_obj.property_a, test_obj.property_b, test_obj.property_c) == (1, "2", 123)
+    test_obj = base(1, "2", 3)
+    assert (test_obj.property_a, test_obj.property_b, test_obj.property_c) == (1, "2", 3)
+
+    # Keyword only argument defaults applied
+    class _TestNew(base):
+        def __init__(self, *args, property_d="default", **kwargs):
+            super().__init__(*args, **kwargs)
+    assert _TestNew(1, "2", property_d="10").property_d == "default"
+
+    # Signature changed after class creation
+    _TestNew.__init__.__signature__ = inspect.signature(base.__init__)
+    assert not hasattr(_TestNew(1, "2"), 'property_d')
+
+
 def test_non_base_property():
     with pytest.raises(RuntimeError):
         class _TestNonBase:
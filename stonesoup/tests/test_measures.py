@@ -248,3 +248,29 @@ def test_euclideanweighted_partial_mapping(mapping_type):
     measure = measures.EuclideanWeighted(weight, mapping=mapping, mapping2=mapping2)
     assert measure(state_u, state_v) == \
         distance.euclidean([10, 1], [11, 2], weight)
+
+
+@pytest.mark.parametrize(
+    'measure',
+    [measures.Euclidean(),
+     measures.Euclidean(mapping=[0, 2]),
+     measures.EuclideanWeighted(np.array([1, 2, 3, 1])),
+     measures.EuclideanWeighted(np.array([1, 2]), mapping=[0, 1], mapping2=[0, 3]),
+     measures.Mahalanobis(),
+     measures.Mahalanobis(mapping=[0, 1], mapping2=[0, 3]),
+     measures.SquaredGaussianHellinger(),
+     measures.GaussianHellinger(mapping=[0, 2])],
+    ids=['euclidean', 'euclidean_mapping', 'euclideanweighted', 'euclideanweighted_mapping',
+         'mahalanobis', 'mahalanobis_mapping', 'squaredhellinger', 'hellinger_mapping'])
+def test_pairwise(measure):
+    states1 = [state_u, state_v]
+    states2 = [state_v, state_u, GaussianState(u + 5, vi*2, timestamp=t)]
+
+    distances = measure.pairwise(states1, states2)
+    assert distances.shape == (2, 3)
+    for i, state1 in enumerate(states1):
+        for j, state2 in enumerate(states2):
+            assert np.isclose(distances[i, j], measure(state1, state2))
+
+    assert measure.pairwise(states1, []).shape == (2, 0)
+    assert measure.pairwise([], states2).shape == (0, 3)
@@ -4,9 +4,10 @@ import pytest
 from ruamel.yaml.constructor import ConstructorError
 
 from stonesoup.sensor.sensor import Sensor
-from ..serialise import YAML
-from ..base import Property
-from ..types.array import Matrix, StateVector, CovarianceMatrix
+from ..serialise import YAML, get_class
+from ..base import BaseMeta, Property
+from ..types.state import State
+from ..types.array import Matrix, StateVector, StateVectors, CovarianceMatrix
 from ..types.angle import Angle, Bearing, Elevation, Longitude, Latitude
 
 
@@ -133,6 +134,63 @@ def test_arrays(serialised_file, instance):
     assert np.allclose(instance, new_instance)
 
 
+@pytest.mark.parametrize(
+    'instance',
+    [Matrix([[1, 2, 4], [4, 5, 6]]),
+     StateVector([[1], [2], [3], [4]]),
+     CovarianceMatrix([[1, 0], [0, 2]]),
+     np.arange(12, dtype=np.int32).reshape(2, 3, 2),
+     np.array([[1.5, np.nan]]).T[::-1],  # Non-contiguous
+     np.array([True, False]),
+     np.empty((0, 2))],
+    ids=('Matrix', 'StateVector', 'CovarianceMatrix', 'ndarray', 'non_contiguous', 'bool',
+         'empty'))
+def test_compact_arrays(serialised_file, instance):
+    compact_file = YAML(typ=serialised_file.typ, compact_arrays=True)
+    serialised_str = compact_file.dumps(instance)
+    assert 'data:' in serialised_str
+
+    new_instance = serialised_file.load(serialised_str)
+    assert type(new_instance) is type(instance)
+    assert new_instance.dtype == instance.dtype  # Unlike sequence of values
+    assert new_instance.shape == instance.shape
+    assert new_instance.flags.writeable
+    assert np.array_equal(instance, new_instance, equal_nan=True)
+
+
+def test_compact_arrays_object_dtype(serialised_file):
+    instance = StateVector([Bearing(0.1), 2])
+    compact_file = YAML(typ=serialised_file.typ, compact_arrays=True)
+    serialised_str = compact_file.dumps(instance)
+    assert 'data:' not in serialised_str
+
+    new_instance = serialised_file.load(serialised_str)
+    assert isinstance(new_instance[0, 0], Bearing)
+    assert np.array_equal(instance, new_instance)
+
+
+def test_class_registry(base):
+    assert BaseMeta.classes_by_name('stonesoup.types.array.StateVector') == ()
+    assert BaseMeta.classes_by_name('stonesoup.types.state.State') == (State, )
+
+    class _TestRegistryBase(base):
+        pass
+
+    name = f'{_TestRegistryBase.__module__}.{_TestRegistryBase.__qualname__}'
+    assert BaseMeta.classes_by_name(name) == (_TestRegistryBase, )
+    assert get_class(f'!{name}') is _TestRegistryBase
+
+    # Class redefined after tag lookup, so now ambiguous
+    first_class = _TestRegistryBase
+
+    class _TestRegistryBase(base):  # noqa:F801
+        pass
+
+    assert BaseMeta.classes_by_name(name) == (first_class, _TestRegistryBase)
+    with pytest.warns(UserWarning, match="Multiple possible classes"):
+        assert get_class(f'!{name}') is _TestRegistryBase
+
+
 @pytest.mark.parametrize(
     'values',
     [[np.int_(10), np.int16(20), np.int64(-30)],
@@ -278,6 +336,26 @@ def test_sensor_serialisation(serialised_file):
     assert np.allclose(sensor.orientation, orientation)
 
 
+def test_particle_state_serialisation(serialised_file):
+    import datetime
+    from ..types.particle import Particles
+    from ..types.state import ParticleState
+
+    particles = Particles(StateVectors([[0, 1, 2], [3, 4, 5]]),
+                          log_weight=[-2000, np.log(0.5), -np.inf])
+    state = ParticleState(particles, timestamp=datetime.datetime(2020, 1, 1))
+
+    serialised_str = serialised_file.dumps(state)
+    assert 'log_weight' in serialised_str
+    assert 'weight:' not in serialised_str.replace('log_weight:', '')
+
+    new_state = serialised_file.load(serialised_str)
+    assert isinstance(new_state, ParticleState)
+    assert new_state.timestamp == state.timestamp
+    assert np.array_equal(new_state.particles.state_vector, particles.state_vector)
+    assert np.array_equal(new_state.particles.log_weight, particles.log_weight)
+
+
 def test_dump(tmpdir, serialised_file):
     data = [1, 2, 3]
     with open(tmpdir.join('dump_file.yml'), 'w') as yaml_file:
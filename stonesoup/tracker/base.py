@@ -2,6 +2,8 @@
 from abc import abstractmethod
 
 from ..base import Base
+from ..predictor import Predictor
+from ..types.base import Type
 
 
 class Tracker(Base):
@@ -26,3 +28,27 @@ class Tracker(Base):
             Tracks existing in the time step
         """
         raise NotImplementedError
+
+    def clear_prediction_caches(self):
+        """Clear prediction caches of all predictors used by the tracker
+
+        Components of the tracker are searched (recursively) for :class:`~.Predictor` instances,
+        and their :attr:`~.Predictor.prediction_cache` cleared. This is called by trackers at the
+        start of each time step, as predictions from previous time steps are rarely reused.
+        """
+        visited = set()
+        components = [self]
+        while components:
+            component = components.pop()
+            if id(component) in visited:
+                continue
+            visited.add(id(component))
+            if isinstance(component, Predictor):
+                cache = component.prediction_cache
+                if cache is not None:
+                    cache.clear()
+            for name in type(component)._properties:
+                value = getattr(component, name, None)
+                # Data types (e.g. states) don't hold predictors
+                if isinstance(value, Base) and not isinstance(value, Type):
+                    components.append(value)
@@ -79,6 +79,7 @@ class PointProcessMultiTargetTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
+        self.clear_prediction_caches()
         # Add birth component
         self.birth_component.timestamp = time
         self.gaussian_mixture.append(self.birth_component)
@@ -56,6 +56,7 @@ class SingleTargetTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
+        self.clear_prediction_caches()
         if self._track is not None:
             associations = self.data_associator.associate(
                 self.tracks, detections, time)
@@ -111,18 +112,25 @@ class MultiTargetTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
+        self.clear_prediction_caches()
 
         associations = self.data_associator.associate(
             self.tracks, detections, time)
         associated_detections = set()
+        updated_tracks = []
+        hypotheses = []
         for track, hypothesis in associations.items():
             if hypothesis:
-                state_post = self.updater.update(hypothesis)
-                track.append(state_post)
+                updated_tracks.append(track)
+                hypotheses.append(hypothesis)
                 associated_detections.add(hypothesis.measurement)
             else:
                 track.append(hypothesis.prediction)
 
+        # Update all associated tracks together, so updater can batch
+        for track, state_post in zip(updated_tracks, self.updater.update_many(hypotheses)):
+            track.append(state_post)
+
         self._tracks -= self.deleter.delete_tracks(self.tracks)
         self._tracks |= self.initiator.initiate(
             detections - associated_detections, time)
@@ -167,6 +175,7 @@ class MultiTargetMixtureTracker(Tracker):
 
     def __next__(self):
         time, detections = next(self.detector_iter)
+        self.clear_prediction_caches()
 
         associations = self.data_associator.associate(
             self.tracks, detections, time)
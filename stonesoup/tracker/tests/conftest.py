@@ -127,6 +127,9 @@ def updater():
                                        hypothesis,
                                        0)
 
+        def update_many(self, hypotheses):
+            return [self.update(hypothesis) for hypothesis in hypotheses]
+
         def predict_measurement(self, state_prediction,
                                 measurement_model=None, **kwargs):
             return GaussianMeasurementPrediction(
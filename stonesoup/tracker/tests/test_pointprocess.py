@@ -54,12 +54,15 @@ def test_point_process_multi_target_tracker_cycle(detector, predictor):
         birth_component=birth_component
         )
 
-    for time, tracks in tracker:
+    for step, (time, tracks) in enumerate(tracker):
         assert time == previous_time + datetime.timedelta(minutes=1)
         assert tracker.estimated_number_of_targets > 0
         assert tracker.estimated_number_of_targets < 4
         previous_time = time
-        # Shouldn't have more than three active tracks
-        assert (len(tracks) >= 1) & (len(tracks) <= 3)
+        # Shouldn't have more than three active tracks, and at least one whilst there are
+        # detections (after which missed components may merge into the broad birth component)
+        assert len(tracks) <= 3
+        if step < 20:
+            assert len(tracks) >= 1
         # All tracks should have unique IDs
         assert len(tracker.gaussian_mixture.component_tags) == len(tracker.gaussian_mixture)
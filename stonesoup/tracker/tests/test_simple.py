@@ -1,7 +1,16 @@
 # -*- coding: utf-8 -*-
 import datetime
+
+import numpy as np
+
 from ..simple import SingleTargetTracker, MultiTargetTracker, \
     MultiTargetMixtureTracker
+from ...dataassociator.neighbour import NearestNeighbour
+from ...hypothesiser.distance import DistanceHypothesiser
+from ...measures import Euclidean
+from ...models.transition.linear import ConstantVelocity
+from ...predictor.kalman import KalmanPredictor
+from ...types.state import GaussianState
 
 
 def test_single_target_tracker(
@@ -75,3 +84,26 @@ def test_multi_target_mixture_tracker(
 
     assert max_tracks >= 3  # Should of had at least 3 tracks in single step
     assert len(total_tracks) >= 6  # Should of had at least 6 over all steps
+
+
+def test_tracker_clear_prediction_caches(
+        initiator, deleter, detector, data_associator, updater):
+    predictor = KalmanPredictor(ConstantVelocity(noise_diff_coeff=0.1))
+    state = GaussianState([[0.], [1.]], np.diag([1., 1.]), datetime.datetime(2018, 1, 1, 14))
+    predictor.predict(state, state.timestamp)
+    assert len(predictor.prediction_cache) == 1
+
+    # Predictor nested within tracker components
+    tracker = MultiTargetTracker(
+        initiator, deleter, detector,
+        NearestNeighbour(DistanceHypothesiser(predictor, updater, Euclidean())), updater)
+    tracker.clear_prediction_caches()
+    assert len(predictor.prediction_cache) == 0
+
+    # Called each time step
+    tracker = MultiTargetTracker(initiator, deleter, detector, data_associator, updater)
+    calls = []
+    tracker.clear_prediction_caches = lambda: calls.append(True)
+    for _ in tracker:
+        pass
+    assert len(calls) == 23
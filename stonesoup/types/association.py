@@ -53,12 +53,167 @@ class TimeRangeAssociation(Association):
         default=None, doc="Range of times that association exists over. Default is None")
 
 
+class _IntervalTree:
+    """Static centred interval tree, for finding intervals containing a point.
+
+    Parameters
+    ----------
+    intervals : sequence of (start, end, item) tuples
+        Intervals (inclusive) and the item associated with each
+    """
+    __slots__ = ('centre', 'by_start', 'by_end', 'left', 'right')
+
+    def __init__(self, intervals):
+        self.left = self.right = None
+        starts = sorted(interval[0] for interval in intervals)
+        self.centre = starts[len(starts) // 2]
+        left, right, centre = [], [], []
+        for interval in intervals:
+            if interval[1] < self.centre:
+                left.append(interval)
+            elif interval[0] > self.centre:
+                right.append(interval)
+            else:
+                centre.append(interval)
+        self.by_start = sorted(centre, key=lambda interval: interval[0])
+        self.by_end = sorted(centre, key=lambda interval: interval[1], reverse=True)
+        if left:
+            self.left = _IntervalTree(left)
+        if right:
+            self.right = _IntervalTree(right)
+
+    def query(self, point):
+        """Yield items of intervals containing point"""
+        node = self
+        while node is not None:
+            if point < node.centre:
+                for start, _, item in node.by_start:
+                    if start > point:
+                        break
+                    yield item
+                node = node.left
+            elif point > node.centre:
+                for _, end, item in node.by_end:
+                    if end < point:
+                        break
+                    yield item
+                node = node.right
+            else:
+                for _, _, item in node.by_start:
+                    yield item
+                break
+
+
+class _IndexedAssociations(set):
+    """Set of associations, maintaining indexes by time and object.
+
+    Adding associations updates the indexes incrementally, whereas other modifications cause
+    indexes to be rebuilt when next required. Associations should not be modified once added.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._valid = False
+        self._timestamps = {}  # Timestamp to single time associations
+        self._time_ranges = []  # (start, end, association) of time range associations
+        self._pending_time_ranges = []  # Added since tree built
+        self._time_range_tree = None
+        self._untimed = []  # Other associations, where time will be checked on query
+        self._objects = {}  # Object to associations
+
+    def _index(self, association):
+        if hasattr(association, "timestamp"):
+            self._timestamps.setdefault(association.timestamp, set()).add(association)
+        elif getattr(association, "time_range", None) is not None:
+            time_range = association.time_range
+            self._pending_time_ranges.append(
+                (time_range.start_timestamp, time_range.end_timestamp, association))
+        else:
+            self._untimed.append(association)
+        for object_ in association.objects:
+            self._objects.setdefault(object_, set()).add(association)
+
+    def _ensure_index(self):
+        if not self._valid:
+            for association in self:
+                self._index(association)
+            self._valid = True
+        # Rebuild tree once a notable number of time ranges added since last built
+        if len(self._pending_time_ranges) > max(16, len(self._time_ranges) // 8):
+            self._time_ranges.extend(self._pending_time_ranges)
+            self._pending_time_ranges = []
+            self._time_range_tree = _IntervalTree(self._time_ranges)
+
+    def at_timestamp(self, timestamp):
+        self._ensure_index()
+        associations = set(self._timestamps.get(timestamp, ()))
+        if self._time_range_tree is not None:
+            associations.update(self._time_range_tree.query(timestamp))
+        associations.update(
+            association for start, end, association in self._pending_time_ranges
+            if start <= timestamp <= end)
+        associations.update(
+            association for association in self._untimed
+            if timestamp in association.time_range)
+        return associations
+
+    def including_objects(self, objects):
+        self._ensure_index()
+        associations = set()
+        for object_ in objects:
+            associations.update(self._objects.get(object_, ()))
+        return associations
+
+    def add(self, association):
+        if association not in self:
+            super().add(association)
+            if self._valid:
+                self._index(association)
+
+    def update(self, *others):
+        for other in others:
+            for association in other:
+                self.add(association)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # Indexes rebuilt on init, rather than copied/pickled
+        return type(self), (list(self), )
+
+
+def _invalidating(method_name):
+    method = getattr(set, method_name)
+
+    def invalidating_method(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._invalidate()
+        return self if result is NotImplemented or result is self else result
+    invalidating_method.__name__ = method_name
+    return invalidating_method
+
+
+for _method_name in ('remove', 'discard', 'pop', 'clear', 'difference_update', '__isub__',
+                     'intersection_update', '__iand__', 'symmetric_difference_update',
+                     '__ixor__'):
+    setattr(_IndexedAssociations, _method_name, _invalidating(_method_name))
+
+
 class AssociationSet(Type):
     """AssociationSet type
 
     A set of :class:`~.Association` type objects representing multiple
     independent associations. Contains functions for indexing into the
     associations
+
+    The associations are indexed by time (an interval tree for time range associations) and by
+    object, which is kept up to date as associations are added to :attr:`associations`.
+    Associations shouldn't be modified once added.
     """
 
     associations: Set[Association] = Property(default=None, doc="Set of independent associations")
@@ -67,6 +222,15 @@ class AssociationSet(Type):
         super().__init__(associations, *args, **kwargs)
         if self.associations is None:
             self.associations = set()
+        if not isinstance(self.associations, _IndexedAssociations):
+            self.associations = _IndexedAssociations(self.associations)
+
+    @property
+    def _indexed_associations(self):
+        # Ensure associations is indexed, e.g. if replaced with plain set
+        if not isinstance(self.associations, _IndexedAssociations):
+            self.associations = _IndexedAssociations(self.associations)
+        return self.associations
 
     def associations_at_timestamp(self, timestamp):
         """Return the associations that exist at a given timestamp
@@ -84,16 +248,7 @@ class AssociationSet(Type):
         : set of :class:`~.Association`
             Associations which occur at specified timestamp
         """
-        ret_associations = set()
-        for association in self.associations:
-            # If the association is at a single time
-            if hasattr(association, "timestamp"):
-                if association.timestamp == timestamp:
-                    ret_associations.add(association)
-            else:
-                if timestamp in association.time_range:
-                    ret_associations.add(association)
-        return ret_associations
+        return self._indexed_associations.at_timestamp(timestamp)
 
     def associations_including_objects(self, objects):
         """Return associations that include all the given objects
@@ -115,10 +270,7 @@ class AssociationSet(Type):
         if not isinstance(objects, list) and not isinstance(objects, set):
             objects = {objects}
 
-        return {association
-                for association in self.associations
-                for object_ in objects
-                if object_ in association.objects}
+        return self._indexed_associations.including_objects(objects)
 
     def __contains__(self, item):
         return item in self.associations
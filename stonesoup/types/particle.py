@@ -3,6 +3,7 @@
 from typing import MutableSequence
 
 import numpy as np
+from scipy.special import logsumexp
 
 from ..base import Property
 from .array import StateVector, StateVectors
@@ -37,22 +38,38 @@ class Particles(Type):
     Particle type
 
     A collection of particles. Contains a state and weight for each particle
+
+    Weights are stored as an array of (natural) log weights, :attr:`log_weight`, such that
+    operations on them can be vectorised. :attr:`weight` returns an array of
+    :class:`~.Probability`, which is created on each access, so should be avoided where
+    performance is a concern. Either :attr:`weight` or :attr:`log_weight` should be provided;
+    if both are, they must be consistent. Only :attr:`log_weight` is serialised.
     """
     state_vector: StateVectors = Property(default=None, doc="State vectors of particles")
     weight: MutableSequence[Probability] = Property(default=None, doc='Weights of particles')
     parent: 'Particles' = Property(default=None, doc='Parent particles')
     particle_list: MutableSequence[Particle] = Property(default=None,
                                                         doc='List of Particle objects')
+    log_weight: np.ndarray = Property(default=None, doc='Log weights of particles')
 
     def __init__(self, state_vector=None, weight=None, parent=None, particle_list=None,
-                 *args, **kwargs):
-        if (particle_list is not None) and (state_vector is not None or weight is not None):
+                 log_weight=None, *args, **kwargs):
+        if (particle_list is not None) and (state_vector is not None or weight is not None
+                                            or log_weight is not None):
             raise ValueError("Use either a list of Particle objects or StateVectors and weights,"
                              " but not both.")
+        if weight is not None and log_weight is not None:
+            # Consistent pairs accepted, e.g. from files serialised with both
+            log_weight = np.asarray(log_weight, dtype=np.float64).ravel()
+            weight_log_weight = self._log_weight(weight)
+            if weight_log_weight.shape != log_weight.shape \
+                    or not np.allclose(weight_log_weight, log_weight):
+                raise ValueError("Use either weights or log weights, but not both.")
+            weight = None
 
         if particle_list and isinstance(particle_list, list):
             state_vector = StateVectors([particle.state_vector for particle in particle_list])
-            weight = np.array([Probability(particle.weight) for particle in particle_list])
+            weight = [particle.weight for particle in particle_list]
             parent_list = [particle.parent for particle in particle_list]
 
             if parent_list.count(None) == 0:
@@ -66,10 +83,84 @@ class Particles(Type):
 
         if state_vector is not None and not isinstance(state_vector, StateVectors):
             state_vector = StateVectors(state_vector)
-        if weight is not None and isinstance(weight, np.ndarray):
-            weight = np.array(weight)
 
-        super().__init__(state_vector, weight, parent, particle_list, *args, **kwargs)
+        super().__init__(state_vector, None, parent, particle_list, None, *args, **kwargs)
+        if log_weight is not None:
+            self.log_weight = log_weight
+        else:
+            self.weight = weight
+
+    @staticmethod
+    def _log_weight(weight):
+        weight = np.asarray(weight)
+        if weight.dtype == object:
+            # Probability values (or mixed), so log taken of each to avoid underflow
+            return np.array([Probability._log(value) for value in weight.ravel()],
+                            dtype=np.float64)
+        with np.errstate(divide='ignore'):
+            return np.log(weight.astype(np.float64).ravel())
+
+    @weight.getter
+    def weight(self):
+        """Weights of particles, as an array of :class:`~.Probability`.
+
+        This is a new array on each access, so modifying it in place (e.g.
+        ``particles.weight[i] = x``) has no effect. Instead assign a new array of weights, or
+        modify :attr:`log_weight` directly.
+        """
+        if self.log_weight is None:
+            return None
+        return np.array([Probability(value, log_value=True) for value in self.log_weight])
+
+    @weight.setter
+    def weight(self, value):
+        if value is None:
+            self.log_weight = None
+        else:
+            self.log_weight = self._log_weight(value)
+
+    @log_weight.setter
+    def log_weight(self, value):
+        self._property_log_weight = \
+            None if value is None else np.asarray(value, dtype=np.float64).ravel()
+
+    def normalise(self):
+        """Normalise :attr:`log_weight` in place, such that the weights sum to one, using a
+        vectorised log-sum-exp.
+
+        Returns
+        -------
+        : float
+            The log of the sum of the weights prior to normalisation
+        """
+        log_weight_sum = logsumexp(self.log_weight)
+        self.log_weight = self.log_weight - log_weight_sum
+        return log_weight_sum
+
+    @classmethod
+    def concatenate(cls, particles_sequence):
+        """Concatenate a number of :class:`Particles` into a single block of particles, such that
+        they can be processed together. The particles of each are contiguous, in order, so can be
+        split again with the offsets from the cumulative sum of their lengths.
+
+        Parameters
+        ----------
+        particles_sequence : sequence of :class:`Particles`
+            Particles to concatenate
+
+        Returns
+        -------
+        : :class:`Particles`
+            Concatenated particles, with log weights if all have them, and without parents
+        """
+        state_vector = StateVectors(np.hstack(
+            [particles.state_vector for particles in particles_sequence]))
+        if any(particles.log_weight is None for particles in particles_sequence):
+            log_weight = None
+        else:
+            log_weight = np.concatenate(
+                [particles.log_weight for particles in particles_sequence])
+        return cls(state_vector=state_vector, log_weight=log_weight)
 
     def __getitem__(self, item):
         if self.parent:
@@ -77,8 +168,13 @@ class Particles(Type):
         else:
             p = None
 
+        if self.log_weight is not None:
+            weight = Probability(self.log_weight[item], log_value=True)
+        else:
+            weight = None
+
         particle = Particle(state_vector=self.state_vector[:, item],
-                            weight=self.weight[item],
+                            weight=weight,
                             parent=p)
         return particle
 
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+import bisect
 import datetime
+import operator
 import uuid
 from collections import abc
 from typing import MutableSequence, Any, Optional, Sequence
@@ -165,6 +167,24 @@ class CreatableFromState:
         return State.from_state(state, *args, **kwargs, target_type=target_type)
 
 
+class _ProxyStateAttribute:
+    """Descriptor proxying commonly used attribute to the latest state of a
+    :class:`~.StateMutableSequence`, avoiding the slower fallback through
+    :meth:`~.StateMutableSequence.__getattr__`."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance.state, self.name)
+        except AttributeError:
+            raise AttributeError(
+                f"{type(instance).__name__!r} object has no attribute {self.name!r}") from None
+
+
 class StateMutableSequence(Type, abc.MutableSequence):
     """A mutable sequence for :class:`~.State` instances
 
@@ -190,6 +210,11 @@ class StateMutableSequence(Type, abc.MutableSequence):
         default=None,
         doc="The initial list of states. Default `None` which initialises with empty list.")
 
+    # Common state attributes, proxied without falling back to __getattr__
+    state_vector = _ProxyStateAttribute()
+    covar = _ProxyStateAttribute()
+    timestamp = _ProxyStateAttribute()
+
     def __init__(self, states=None, *args, **kwargs):
         if states is None:
             states = []
@@ -202,66 +227,148 @@ class StateMutableSequence(Type, abc.MutableSequence):
         return self.states.__len__()
 
     def __setitem__(self, index, value):
+        self._timestamp_index = None
         return self.states.__setitem__(index, value)
 
     def __delitem__(self, index):
+        self._timestamp_index = None
         return self.states.__delitem__(index)
 
     def __getitem__(self, index):
         if isinstance(index, slice) and (
                 isinstance(index.start, datetime.datetime)
                 or isinstance(index.stop, datetime.datetime)):
-            items = []
-            for state in self.states:
+            return StateMutableSequence(
+                list(self.time_window(index.start, index.stop))[::index.step])
+        elif isinstance(index, datetime.datetime):
+            for rebuild in (False, True):
+                timestamp_index, rebuilt = self._get_timestamp_index(rebuild)
+                if timestamp_index.timestamps is None:
+                    for state in reversed(self.states):
+                        if state.timestamp == index:
+                            return state
+                    raise IndexError('timestamp not found in states')
+                try:
+                    position = bisect.bisect_right(timestamp_index.timestamps, index) - 1
+                except TypeError:
+                    # e.g. comparing timezone aware and naive timestamps
+                    position = -1
+                if position >= 0 and timestamp_index.timestamps[position] == index:
+                    state = self.states[timestamp_index.position(position)]
+                    # Verified, as states may have been replaced directly in `states`
+                    if state.timestamp == index:
+                        return state
+                if rebuilt:
+                    break
+            raise IndexError('timestamp not found in states')
+        elif isinstance(index, slice):
+            return StateMutableSequence(self.states.__getitem__(index))
+        else:
+            return self.states.__getitem__(index)
+
+    def time_window(self, start=None, stop=None):
+        """States within a time window, as a view
+
+        Returns a read-only view of the states with timestamps from `start` (inclusive) up to
+        `stop` (exclusive), in sequence order, without creating a new sequence. Unlike slicing
+        with :class:`datetime.datetime` instances, no new :class:`~.StateMutableSequence` is
+        created, and for states in time order no list of states is created either. The view
+        should not be used after the sequence is modified.
+
+        Parameters
+        ----------
+        start : datetime.datetime, optional
+            Start of time window. Default `None`, where window is unbounded.
+        stop : datetime.datetime, optional
+            End of time window (exclusive). Default `None`, where window is unbounded.
+
+        Returns
+        -------
+        : :class:`~.StateSequenceView`
+            View of states within the time window
+        """
+        timestamp_index, rebuilt = self._get_timestamp_index()
+        if timestamp_index.timestamps is None:
+            positions = []
+            for position, state in enumerate(self.states):
                 try:
-                    if index.start and state.timestamp < index.start:
+                    if start and state.timestamp < start:
                         continue
-                    if index.stop and state.timestamp >= index.stop:
+                    if stop and state.timestamp >= stop:
                         continue
                 except TypeError as exc:
                     raise TypeError(
                         'both indices must be `datetime.datetime` objects for'
                         'time slice') from exc
-                items.append(state)
-            return StateMutableSequence(items[::index.step])
-        elif isinstance(index, datetime.datetime):
-            for state in reversed(self.states):
-                if state.timestamp == index:
-                    return state
-            else:
-                raise IndexError('timestamp not found in states')
-        elif isinstance(index, slice):
-            return StateMutableSequence(self.states.__getitem__(index))
-        else:
-            return self.states.__getitem__(index)
+                positions.append(position)
+            return StateSequenceView(self.states, positions)
 
-    def __getattribute__(self, name):
-        # This method is called if we try to access an attribute of self. First we try to get the
-        # attribute directly, but if that fails, we want to try getting the same attribute from
-        # self.state instead. If that, in turn,  fails we want to return the error message that
-        # would have originally been raised, rather than an error message that the State has no
-        # such attribute.
+        try:
+            lower = bisect.bisect_left(timestamp_index.timestamps, start) if start else 0
+            upper = bisect.bisect_left(timestamp_index.timestamps, stop) if stop \
+                else len(timestamp_index.timestamps)
+        except TypeError as exc:
+            raise TypeError(
+                'both indices must be `datetime.datetime` objects for'
+                'time slice') from exc
+        upper = max(lower, upper)
+        # Verified, as states may have been replaced directly in `states`, which could move
+        # states into or out of the window
+        if not rebuilt and not timestamp_index.unchanged(self.states):
+            self._timestamp_index = None
+            return self.time_window(start, stop)
+        if timestamp_index.positions is None:
+            return StateSequenceView(self.states, range(lower, upper))
+        return StateSequenceView(self.states, sorted(timestamp_index.positions[lower:upper]))
+
+    def _get_timestamp_index(self, rebuild=False):
+        """Get index of timestamps sorted, updating or rebuilding it as required
+
+        The index is validated against the length and first and last states of :attr:`states`,
+        such that states appended directly to :attr:`states` are also handled. States replaced
+        directly in :attr:`states` can't be detected here, so results from the index should be
+        verified against the states, rebuilding the index (with `rebuild`) on mismatch.
+
+        Returns
+        -------
+        : :class:`_TimestampIndex`
+            The index
+        : bool
+            Whether the index was (re)built, and so needn't be rebuilt on mismatch
+        """
+        states = self.states
+        timestamp_index = self.__dict__.get('_timestamp_index')
+        if rebuild or timestamp_index is None or not timestamp_index.extend(states):
+            timestamp_index = _TimestampIndex(states)
+            self._timestamp_index = timestamp_index
+            return timestamp_index, True
+        return timestamp_index, False
+
+    def __getattr__(self, name):
+        # This method is only called if normal attribute lookup on self fails, in which case we
+        # want to try getting the same attribute from self.state instead. If that, in turn, fails
+        # we want to raise the error that would have originally been raised, rather than an
+        # error message that the State has no such attribute.
         #
-        # An alternative mechanism using __getattr__ seems simpler (as it skips the first few lines
-        # of code, but __getattr__ has no mechanism to capture the originally raised error.
+        # Using __getattr__ (rather than __getattribute__) means normal attribute access isn't
+        # slowed down, and proxied attributes avoid a Python level exception being raised and
+        # caught. As __getattr__ has no mechanism to capture the originally raised error, the
+        # normal lookup is repeated to raise it.
+        if name.startswith("_") or name in ('state', 'states'):
+            # Don't proxy special/private attributes to `state`, just raise the original error
+            return Type.__getattribute__(self, name)
         try:
-            # This tries first to get the attribute from self.
+            my_state = Type.__getattribute__(self, 'state')
+            return getattr(my_state, name)
+        except AttributeError:
+            # If we get the error about 'State' not having the attribute, then we want to
+            # raise the original error instead
             return Type.__getattribute__(self, name)
-        except AttributeError as original_error:
-            if name.startswith("_"):
-                # Don't proxy special/private attributes to `state`, just raise the original error
-                raise original_error
-            else:
-                # For non _ attributes, try to get the attribute from self.state instead of self.
-                try:
-                    my_state = Type.__getattribute__(self, 'state')
-                    return getattr(my_state, name)
-                except AttributeError:
-                    # If we get the error about 'State' not having the attribute, then we want to
-                    # raise the original error instead
-                    raise original_error
 
     def insert(self, index, value):
+        if index < len(self.states):
+            # Appending handled by index validation
+            self._timestamp_index = None
         return self.states.insert(index, value)
 
     @property
@@ -291,6 +398,121 @@ class StateMutableSequence(Type, abc.MutableSequence):
         yield current_state
 
 
+class _TimestampIndex:
+    """Index of timestamps of a sequence of states, sorted for bisection
+
+    Where states are in time order (typically the case), :attr:`positions` is `None` as sorted
+    timestamps match the order of states. If timestamps can't be sorted (e.g. some are `None`),
+    :attr:`timestamps` is `None`.
+
+    To detect states replaced directly in the sequence, sequences which count their
+    modifications other than appends (with a `_version` attribute, e.g.
+    :class:`~.ColumnarStates`) have the count recorded, otherwise a snapshot of the states is
+    kept to compare by identity."""
+    __slots__ = ('states_id', 'length', 'first', 'last', 'timestamps', 'positions', 'version',
+                 'snapshot')
+
+    def __init__(self, states):
+        self.states_id = id(states)
+        self.length = len(states)
+        self.first = states[0] if states else None
+        self.last = states[-1] if states else None
+        self.version = getattr(states, '_version', None)
+        self.snapshot = list(states) if self.version is None else None
+        timestamps = [state.timestamp for state in states]
+        self.positions = None
+        try:
+            if any(earlier > later for earlier, later in zip(timestamps, timestamps[1:])):
+                self.positions = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+                timestamps = [timestamps[position] for position in self.positions]
+        except TypeError:
+            timestamps = None
+        self.timestamps = timestamps
+
+    def position(self, index):
+        """Position in states of index in sorted timestamps"""
+        if self.positions is None:
+            return index
+        return self.positions[index]
+
+    def unchanged(self, states):
+        """Check states are those the index was built from (or extended with), such that
+        states replaced directly in the sequence are detected"""
+        if self.version is not None:
+            return getattr(states, '_version', None) == self.version
+        return len(states) == len(self.snapshot) \
+            and all(map(operator.is_, states, self.snapshot))
+
+    def extend(self, states):
+        """Check index is valid for states, extending it with any appended states
+
+        Returns
+        -------
+        bool
+            `False` if index is invalid, and needs rebuilding
+        """
+        length = len(states)
+        if id(states) != self.states_id or length < self.length \
+                or getattr(states, '_version', None) != self.version \
+                or (length and states[0] is not self.first):
+            return False
+        if length == self.length:
+            return length == 0 or states[-1] is self.last
+        if self.length and states[self.length - 1] is not self.last:
+            return False
+        if self.timestamps is None or self.positions is not None:
+            return False  # Simpler to rebuild
+        new_states = [states[position] for position in range(self.length, length)]
+        try:
+            previous = self.timestamps[-1] if self.timestamps else None
+            for state in new_states:
+                if previous is not None and previous > state.timestamp:
+                    return False
+                previous = state.timestamp
+        except TypeError:
+            return False
+        self.timestamps.extend(state.timestamp for state in new_states)
+        if self.snapshot is not None:
+            self.snapshot.extend(new_states)
+        self.length = length
+        self.first = states[0]
+        self.last = states[-1]
+        return True
+
+
+class StateSequenceView(abc.Sequence):
+    """Read-only view of a selection of states within a sequence
+
+    Parameters
+    ----------
+    states : sequence of :class:`~.State`
+        Sequence of states being viewed
+    positions : sequence of int
+        Positions in `states` included in view
+    """
+
+    def __init__(self, states, positions):
+        self._states = states
+        self._positions = positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return StateSequenceView(self._states, self._positions[index])
+        return self._states[self._positions[index]]
+
+    def __iter__(self):
+        states = self._states
+        if isinstance(self._positions, range) and isinstance(states, list):
+            return iter(states[self._positions.start:self._positions.stop])
+        return (states[position] for position in self._positions)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
+
+
 class GaussianState(State):
     """Gaussian State type
 
@@ -448,12 +670,21 @@ class ParticleState(Type):
     def ndim(self):
         return self.particles.ndim
 
+    @property
+    def _relative_weights(self):
+        """Particle weights as floats, scaled relative to the largest log weight to avoid
+        underflow. `None` if particles have no weights."""
+        log_weight = self.particles.log_weight
+        if log_weight is None:
+            return None
+        return np.exp(log_weight - np.max(log_weight))
+
     @property
     def mean(self):
         """The state mean, equivalent to state vector"""
         result = np.average(self.particles.state_vector,
                             axis=1,
-                            weights=self.particles.weight)
+                            weights=self._relative_weights)
         # Convert type as may have type of weights
         return result
 
@@ -466,7 +697,7 @@ class ParticleState(Type):
     def covar(self):
         if self.fixed_covar is not None:
             return self.fixed_covar
-        cov = np.cov(self.particles.state_vector, ddof=0, aweights=np.array(self.particles.weight))
+        cov = np.cov(self.particles.state_vector, ddof=0, aweights=self._relative_weights)
         # Fix one dimensional covariances being returned with zero dimension
         return cov
 
@@ -130,3 +130,58 @@ def test_associationset():
     # Timestamp not present in either
     timestamp3 = datetime.datetime(2018, 3, 1, 6, 8, 35)
     assert not assoc_set.associations_at_timestamp(timestamp3)
+
+
+def test_associationset_index():
+    rng = np.random.RandomState(1)
+    start = datetime.datetime(2020, 1, 1)
+    objects = list(range(50))
+
+    def brute_force_at_timestamp(associations, timestamp):
+        return {association for association in associations
+                if (association.timestamp == timestamp if hasattr(association, 'timestamp')
+                    else timestamp in association.time_range)}
+
+    def random_association():
+        if rng.rand() < 0.5:
+            return SingleTimeAssociation(
+                set(rng.choice(objects, 2, replace=False)),
+                start + datetime.timedelta(seconds=int(rng.randint(100))))
+        begin, end = sorted(rng.randint(100, size=2))
+        return TimeRangeAssociation(
+            set(rng.choice(objects, 2, replace=False)),
+            TimeRange(start + datetime.timedelta(seconds=int(begin)),
+                      start + datetime.timedelta(seconds=int(end))))
+
+    associations = {random_association() for _ in range(200)}
+    association_set = AssociationSet(associations)
+
+    def check():
+        for seconds in range(-1, 101):
+            timestamp = start + datetime.timedelta(seconds=seconds)
+            assert association_set.associations_at_timestamp(timestamp) \
+                == brute_force_at_timestamp(association_set.associations, timestamp)
+        for object_ in objects[:10]:
+            assert association_set.associations_including_objects(object_) == {
+                association for association in association_set.associations
+                if object_ in association.objects}
+        assert association_set.associations_including_objects(objects[:2]) == {
+            association for association in association_set.associations
+            if association.objects & set(objects[:2])}
+
+    check()
+
+    # Index kept up to date with additions
+    for _ in range(100):
+        association_set.associations.add(random_association())
+    association_set.associations |= {random_association() for _ in range(10)}
+    check()
+
+    # and other modifications
+    association_set.associations.pop()
+    association_set.associations -= set(list(association_set.associations)[:20])
+    check()
+
+    # or replacement
+    association_set.associations = {random_association() for _ in range(20)}
+    check()
@@ -2,6 +2,7 @@
 import pytest
 import numpy as np
 
+from ..numeric import Probability
 from ..particle import Particle, Particles
 
 
@@ -62,3 +63,33 @@ def test_particles():
 
         # Cannot set Particles object with both a particle list and a state vector/weight
         Particles(np.array([[0, 0, 0]]), weight=[0.1, 0.1, 0.1], particle_list=particle_list)
+
+
+def test_particles_log_weight():
+    particles = Particles(np.array([[0, 1, 2]]), log_weight=np.log([0.2, 0.3, 0.5]))
+    assert particles.log_weight.dtype == np.float64
+    assert np.allclose(np.array(particles.weight, dtype=np.float64), [0.2, 0.3, 0.5])
+    assert particles[1].weight == Probability(np.log(0.3), log_value=True)
+
+    # Weights are stored as log weights
+    particles.weight = [Probability(1e-400), Probability(3e-400)]
+    assert np.allclose(particles.log_weight, [Probability(1e-400).log_value,
+                                              Probability(3e-400).log_value])
+    particles.weight = np.array([0., 1.])
+    assert np.array_equal(particles.log_weight, [-np.inf, 0])
+
+    # Normalise in log space, so weights too small for floats are handled
+    particles = Particles(np.array([[0, 1, 2, 3]]), log_weight=[-2000, -2000, -2000, -np.inf])
+    log_weight_sum = particles.normalise()
+    assert np.isclose(log_weight_sum, -2000 + np.log(3))
+    assert np.allclose(particles.log_weight[:3], -np.log(3))
+    assert particles.log_weight[3] == -np.inf
+
+    with pytest.raises(ValueError, match="weights or log weights"):
+        Particles(np.array([[0, 0]]), weight=[0.5, 0.5], log_weight=np.log([0.2, 0.8]))
+    particles = Particles(np.array([[0, 0]]), weight=[0.5, 0.5], log_weight=np.log([0.5, 0.5]))
+    assert np.allclose(particles.log_weight, np.log([0.5, 0.5]))
+
+    # Weights are a new array on each access
+    particles.weight[0] = Probability(1)
+    assert np.allclose(particles.log_weight, np.log([0.5, 0.5]))
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import datetime
+import gc
 
 import numpy as np
 import pytest
@@ -12,7 +13,8 @@ from ..array import StateVector, CovarianceMatrix
 from ..numeric import Probability
 from ..particle import Particle
 from ..state import State, GaussianState, ParticleState, \
-    StateMutableSequence, WeightedGaussianState, SqrtGaussianState, CategoricalState
+    StateMutableSequence, StateSequenceView, WeightedGaussianState, SqrtGaussianState, \
+    CategoricalState
 from ...base import Property
 
 
@@ -276,6 +278,72 @@ def test_state_mutable_sequence_slice():
         sequence[timestamp-delta]
 
 
+def test_state_mutable_sequence_time_index():
+    state_vector = StateVector([[0]])
+    timestamp = datetime.datetime(2018, 1, 1, 14)
+    delta = datetime.timedelta(minutes=1)
+    states = [State(state_vector, timestamp=timestamp+delta*n) for n in range(10)]
+    sequence = StateMutableSequence(list(states))
+
+    window = sequence.time_window(timestamp+delta*2, timestamp+delta*5)
+    assert isinstance(window, StateSequenceView)
+    assert list(window) == states[2:5]
+    assert window[0] is states[2]
+    assert list(window[1:]) == states[3:5]
+    assert list(sequence.time_window()) == states
+    assert list(sequence.time_window(stop=timestamp+delta*2)) == states[:2]
+    assert not sequence.time_window(timestamp+delta*5, timestamp+delta*2)
+
+    # Appending directly to states and via sequence
+    state = State(state_vector, timestamp=timestamp+delta*10)
+    sequence.states.append(state)
+    assert sequence[timestamp+delta*10] is state
+    state = State(state_vector, timestamp=timestamp+delta*11)
+    sequence.append(state)
+    assert sequence[timestamp+delta*11] is state
+
+    # Insert, set and delete out of time order
+    state = State(state_vector, timestamp=timestamp+delta*2)
+    sequence.insert(0, state)
+    assert sequence[timestamp+delta*2] is states[2]  # Last in sequence returned
+    assert list(sequence.time_window(timestamp+delta*2, timestamp+delta*3)) == [state, states[2]]
+    del sequence[3]
+    assert sequence[timestamp+delta*2] is state
+    state = State(state_vector, timestamp=timestamp+delta*20)
+    sequence[0] = state
+    assert sequence[timestamp+delta*20] is state
+    with pytest.raises(IndexError):
+        sequence[timestamp+delta*2]
+    assert list(sequence[timestamp+delta*9:]) == [state, states[9], sequence[-2], sequence[-1]]
+
+    # Replacing states
+    sequence.states = states[:3]
+    assert sequence[timestamp+delta*2] is states[2]
+    with pytest.raises(IndexError):
+        sequence[timestamp+delta*3]
+
+    # Replacing a state directly in states
+    sequence = StateMutableSequence(
+        [State(state_vector, timestamp=timestamp+delta*n) for n in range(5)])
+    assert sequence[timestamp+delta*2] is sequence.states[2]
+    state = State(state_vector, timestamp=timestamp+delta*10)
+    sequence.states[2] = state
+    with pytest.raises(IndexError):
+        sequence[timestamp+delta*2]
+    assert sequence[timestamp+delta*10] is state
+    sequence.states[2] = State(state_vector, timestamp=timestamp+delta*2)
+    assert list(sequence.time_window(timestamp+delta*2, timestamp+delta*4)) == sequence.states[2:4]
+    sequence.states[3] = state
+    assert list(sequence[timestamp+delta*2:timestamp+delta*4]) == [sequence.states[2]]
+    assert list(sequence.time_window(timestamp+delta*10)) == [state]
+
+    # Fallback where timestamps can't be compared
+    sequence = StateMutableSequence([State(state_vector), State(state_vector, timestamp)])
+    assert sequence[timestamp] is sequence.states[1]
+    with pytest.raises(TypeError):
+        sequence[timestamp:]
+
+
 def test_state_mutable_sequence_sequence_init():
     """Test initialising with an existing sequence"""
     state_vector = StateVector([[0]])
@@ -431,6 +499,9 @@ def test_creatable_from_state_multi_base_error():
                        match='A CreatableFromState subclass must have exactly two superclasses'):
         class SubSubclassCfs(State, StateMutableSequence, SubclassCfs):
             pass
+    # Partially created class lacks its own ABC registry, so would otherwise be treated as a
+    # subclass of StateMutableSequence for State's virtual subclasses until garbage collected
+    gc.collect()
 
 
 def test_categorical_state():
@@ -1,15 +1,16 @@
 # -*- coding: utf-8 -*-
+import copy
 import datetime
 
 import numpy as np
 import pytest
 from stonesoup.types.detection import Detection
 from stonesoup.types.hypothesis import SingleHypothesis
-from stonesoup.types.update import Update
+from stonesoup.types.update import Update, GaussianStateUpdate
 
 from ..particle import Particle
 from ..state import State, GaussianState, ParticleState
-from ..track import Track
+from ..track import Track, ColumnarTrack, ColumnarStates
 
 
 def test_track_empty():
@@ -24,9 +25,10 @@ def test_track_empty():
     ParticleState([Particle(np.array([[0]]), 1)], datetime.datetime.now()),
     ],
     ids=['State', 'GaussianState', 'ParticleState'])
-def test_track_state(state):
+@pytest.mark.parametrize('track_class', [Track, ColumnarTrack])
+def test_track_state(state, track_class):
     # Track initialisation with initial state
-    track = Track([state])
+    track = track_class([state])
     assert len(track) == 1
     assert track.state is state
 
@@ -62,12 +64,13 @@ def test_track_id():
     assert isinstance(track.id, str)
 
 
-def test_track_metadata():
-    track = Track()
+@pytest.mark.parametrize('track_class', [Track, ColumnarTrack])
+def test_track_metadata(track_class):
+    track = track_class()
     assert track.metadata == {}
     assert not track.metadatas
 
-    track = Track(init_metadata={'colour': 'blue'})
+    track = track_class(init_metadata={'colour': 'blue'})
 
     assert track.metadata == {'colour': 'blue'}
     assert not track.metadatas
@@ -178,3 +181,106 @@ def test_track_metadata():
            {'colour': 'white', 'side': 'enemy', 'speed': 'fast', 'size': 'small'}
     assert track.metadatas[6] == \
            {'colour': 'green', 'side': 'enemy', 'speed': 'fast', 'size': 'small'}
+
+
+def test_columnar_track():
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    states = [
+        GaussianStateUpdate([[i], [1]], np.diag([i + 1, 1]), SingleHypothesis(None, None),
+                            start + datetime.timedelta(seconds=i))
+        for i in range(20)]
+    track = ColumnarTrack(states[:10])
+    for state in states[10:]:
+        track.append(state)
+    assert isinstance(track.states, ColumnarStates)
+    assert len(track) == 20
+
+    # Raw arrays
+    assert track.timestamps.dtype == np.dtype('datetime64[us]')
+    assert np.all(np.diff(track.timestamps) == np.timedelta64(1, 's'))
+    assert track.state_vectors.shape == (2, 20)
+    assert np.array_equal(track.state_vectors[0], np.arange(20))
+    assert track.covars.shape == (20, 2, 2)
+    assert np.array_equal(track.covars[:, 0, 0], np.arange(1, 21))
+
+    # States still referenced returned as is
+    assert track.state is states[-1]
+    assert track[0] is states[0]
+
+    # States recreated from arrays once no longer referenced
+    hypothesis = states[5].hypothesis
+    del states
+    state = track[5]
+    assert type(state) is GaussianStateUpdate
+    assert state.hypothesis is hypothesis
+    assert state.timestamp == start + datetime.timedelta(seconds=5)
+    assert state.timestamp.tzinfo is datetime.timezone.utc
+    assert np.array_equal(state.state_vector, [[5], [1]])
+    assert np.array_equal(state.covar, np.diag([6, 1]))
+    assert track[5] is state
+    assert track[start + datetime.timedelta(seconds=5)] is state
+    assert [state.timestamp for state in track[-2:]] \
+        == [start + datetime.timedelta(seconds=i) for i in (18, 19)]
+
+    # Insertion, replacement and deletion
+    state = GaussianState([[100], [0]], np.eye(2), start)
+    track.insert(1, state)
+    assert len(track) == 21
+    assert track[1] is state
+    assert np.array_equal(track.state_vectors[0, :3], [0, 100, 1])
+    del track[1]
+    assert len(track) == 20
+    assert np.array_equal(track.state_vectors[0, :3], [0, 1, 2])
+    track[0] = state
+    assert track[0] is state
+    assert track.state_vectors[0, 0] == 100
+    del track[-5:]
+    assert len(track) == 15
+    assert track.state.timestamp == start + datetime.timedelta(seconds=14)
+
+    # Non-columnar states kept as is
+    state = State([[1], [2], [3]], start + datetime.timedelta(seconds=15))
+    track.append(state)
+    state_id = id(state)
+    del state
+    assert id(track.state) == state_id
+    assert np.all(np.isnan(track.state_vectors[:, -1]))
+
+    # Pickling and copying
+    track_copy = copy.deepcopy(track)
+    assert len(track_copy) == len(track)
+    assert np.array_equal(track_copy.state_vectors[:, :-1], track.state_vectors[:, :-1])
+    assert track_copy[3].timestamp == track[3].timestamp
+
+
+def test_columnar_track_held_states():
+    start = datetime.datetime(2020, 1, 1)
+    track = ColumnarTrack([
+        GaussianState([[i], [0]], np.eye(2) * (i + 1), start + datetime.timedelta(seconds=i))
+        for i in range(4)])
+    # Materialised from arrays, and held across insertion and deletion
+    held_state = track[2]
+    assert np.array_equal(held_state.state_vector, [[2], [0]])
+
+    track.insert(0, GaussianState([[-1], [0]], np.eye(2), start - datetime.timedelta(seconds=1)))
+    assert np.array_equal(held_state.state_vector, [[2], [0]])
+    assert np.array_equal(held_state.covar, np.eye(2) * 3)
+    assert track[3] is held_state
+    assert np.array_equal(track[2].state_vector, [[1], [0]])
+
+    del track[1]
+    assert np.array_equal(held_state.state_vector, [[2], [0]])
+    assert np.array_equal(held_state.covar, np.eye(2) * 3)
+    assert track[2] is held_state
+    assert np.array_equal(track[1].state_vector, [[1], [0]])
+    assert np.array_equal(track.state_vectors[0], [-1, 1, 2, 3])
+
+    # Replaced directly in states, so timestamp index rebuilt
+    assert track[start + datetime.timedelta(seconds=1)] is track.states[1]
+    assert list(track.time_window(start + datetime.timedelta(seconds=5))) == []
+    state = GaussianState([[10], [0]], np.eye(2), start + datetime.timedelta(seconds=10))
+    track.states[1] = state
+    assert track[start + datetime.timedelta(seconds=10)] is state
+    assert list(track.time_window(start + datetime.timedelta(seconds=5))) == [state]
+    with pytest.raises(IndexError):
+        track[start + datetime.timedelta(seconds=1)]
@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
+import datetime
 import uuid
+import weakref
+from collections import abc
 from typing import MutableSequence, MutableMapping
 
+import numpy as np
+
+from .array import StateVector, StateVectors, CovarianceMatrix
 from .multihypothesis import MultipleHypothesis
 from .state import State, StateMutableSequence
 from .update import Update
@@ -132,3 +138,289 @@ class Track(StateMutableSequence):
                 hypothesis = state.hypothesis
                 if hypothesis and hypothesis.measurement.metadata is not None:
                     self.metadata.update(hypothesis.measurement.metadata)
+
+
+class ColumnarStates(abc.MutableSequence):
+    """Mutable sequence of states stored in columnar arrays
+
+    Rather than holding a list of :class:`~.State` objects, the timestamps, state vectors and
+    covariances (where present) of each state are held in preallocated NumPy arrays, which grow
+    as required. State objects are created from these arrays when accessed, and are cached
+    (weakly) such that repeated access while a state is still referenced returns the same
+    object. Other properties of each state (e.g. :attr:`~.Update.hypothesis`) are kept as is.
+
+    States which can't be stored in columns, such as those without a :attr:`~.State.state_vector`
+    and :attr:`~.GaussianState.covar` property (e.g. :class:`~.SqrtGaussianState`) or with a
+    different number of dimensions to the first state, are kept as objects. Their timestamp, and
+    state vector and covariance where compatible, are still recorded in the arrays.
+
+    States should be considered immutable once added to the sequence, as state vectors and
+    covariances of states are copied into the underlying arrays.
+
+    Parameters
+    ----------
+    states : sequence of :class:`~.State`, optional
+        Initial states
+    capacity : int, optional
+        Initial number of states to allocate arrays for. Default 16.
+    """
+
+    _array_properties = ('timestamp', 'state_vector', 'covar')
+
+    def __init__(self, states=None, capacity=16):
+        self._size = 0
+        self._capacity = max(capacity, 1)
+        self._ndim = None
+        self._tzinfo = None
+        self._timestamps = np.full(self._capacity, np.datetime64('NaT'), dtype='datetime64[us]')
+        self._state_vectors = None
+        self._covars = None
+        self._row_ids = np.empty(self._capacity, dtype=np.int64)
+        self._next_row_id = 0
+        self._rows = []  # State class, (class, extra properties) or state object per row
+        self._version = 0  # Count of modifications other than appends, for timestamp index
+        self._cache = weakref.WeakValueDictionary()
+        if states is not None:
+            for state in states:
+                self.append(state)
+
+    def _allocate(self, state):
+        """Allocate state vector and covariance arrays, based on first state"""
+        self._ndim = state.state_vector.shape[0]
+        if state.timestamp is not None:
+            self._tzinfo = state.timestamp.tzinfo
+        dtype = np.result_type(state.state_vector.dtype, np.float64)
+        self._state_vectors = np.full((self._capacity, self._ndim), np.nan, dtype=dtype)
+        if 'covar' in type(state).properties:
+            self._covars = np.full(
+                (self._capacity, self._ndim, self._ndim), np.nan, dtype=np.float64)
+
+    def _grow(self):
+        self._capacity *= 2
+
+        def grow(array, fill):
+            new_array = np.full((self._capacity, *array.shape[1:]), fill, dtype=array.dtype)
+            new_array[:self._size] = array[:self._size]
+            return new_array
+
+        self._timestamps = grow(self._timestamps, np.datetime64('NaT'))
+        self._row_ids = grow(self._row_ids, 0)
+        if self._state_vectors is not None:
+            self._state_vectors = grow(self._state_vectors, np.nan)
+        if self._covars is not None:
+            self._covars = grow(self._covars, np.nan)
+
+    @staticmethod
+    def _to_datetime64(timestamp):
+        if timestamp is None:
+            return np.datetime64('NaT')
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return np.datetime64(timestamp, 'us')
+
+    def _is_columnar(self, state):
+        properties = type(state).properties
+        if self._ndim is None \
+                or not isinstance(state, State) \
+                or 'state_vector' not in properties \
+                or state.state_vector.shape != (self._ndim, 1) \
+                or not np.can_cast(
+                    state.state_vector.dtype, self._state_vectors.dtype, 'same_kind') \
+                or (self._covars is None) == ('covar' in properties) \
+                or (state.timestamp is not None and state.timestamp.tzinfo is not self._tzinfo):
+            return False
+        return True
+
+    def _set_row(self, index, state):
+        """Set arrays and row entry for state at index"""
+        self._timestamps[index] = self._to_datetime64(getattr(state, 'timestamp', None))
+        self._row_ids[index] = self._next_row_id
+        self._cache[self._next_row_id] = state
+        self._next_row_id += 1
+
+        if self._state_vectors is not None:
+            if getattr(state, 'state_vector', None) is not None \
+                    and state.state_vector.shape == (self._ndim, 1):
+                self._state_vectors[index] = state.state_vector[:, 0]
+            else:
+                self._state_vectors[index] = np.nan
+        if self._covars is not None:
+            covar = getattr(state, 'covar', None)
+            if covar is not None and covar.shape == (self._ndim, self._ndim):
+                self._covars[index] = covar
+            else:
+                self._covars[index] = np.nan
+
+        if not self._is_columnar(state):
+            return state
+        extras = {name: getattr(state, name)
+                  for name in type(state).properties if name not in self._array_properties}
+        if extras:
+            return type(state), extras
+        return type(state)
+
+    def _materialise(self, index):
+        row_id = self._row_ids[index]
+        try:
+            return self._cache[row_id]
+        except KeyError:
+            pass
+        row = self._rows[index]
+        if isinstance(row, State):
+            state = row
+        else:
+            if isinstance(row, tuple):
+                state_class, extras = row
+            else:
+                state_class, extras = row, {}
+            timestamp = self._timestamps[index]
+            if np.isnat(timestamp):
+                timestamp = None
+            else:
+                timestamp = timestamp.astype(datetime.datetime)
+                if self._tzinfo is not None:
+                    timestamp = timestamp.replace(
+                        tzinfo=datetime.timezone.utc).astimezone(self._tzinfo)
+            kwargs = dict(extras, timestamp=timestamp)
+            # Copied, as rows are shifted in place on insertion and deletion
+            kwargs['state_vector'] = \
+                self._state_vectors[index, :, np.newaxis].copy().view(StateVector)
+            if self._covars is not None:
+                kwargs['covar'] = self._covars[index].copy().view(CovarianceMatrix)
+            state = state_class(**kwargs)
+        self._cache[row_id] = state
+        return state
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialise(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('index out of range')
+        return self._materialise(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._size))
+            values = list(value)
+            if len(indices) != len(values) or index.step not in (None, 1):
+                raise ValueError('slice assignment must not change length of sequence')
+            for i, state in zip(indices, values):
+                self[i] = state
+            return
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('index out of range')
+        self._cache.pop(self._row_ids[index], None)
+        self._rows[index] = self._set_row(index, value)
+        self._version += 1
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(self._size)), reverse=True):
+                del self[i]
+            return
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('index out of range')
+        self._cache.pop(self._row_ids[index], None)
+        for array in self._arrays():
+            array[index:self._size-1] = array[index+1:self._size]
+        del self._rows[index]
+        self._size -= 1
+        self._version += 1
+
+    def insert(self, index, value):
+        if self._size == self._capacity:
+            self._grow()
+        if self._ndim is None and getattr(value, 'state_vector', None) is not None:
+            self._allocate(value)
+        if index < 0:
+            index = max(index + self._size, 0)
+        index = min(index, self._size)
+        if index < self._size:
+            self._version += 1
+        for array in self._arrays():
+            array[index+1:self._size+1] = array[index:self._size]
+        self._rows.insert(index, self._set_row(index, value))
+        self._size += 1
+
+    def append(self, value):
+        self.insert(self._size, value)
+
+    def _arrays(self):
+        arrays = [self._timestamps, self._row_ids]
+        if self._state_vectors is not None:
+            arrays.append(self._state_vectors)
+        if self._covars is not None:
+            arrays.append(self._covars)
+        return arrays
+
+    @property
+    def timestamps(self):
+        """Timestamps of states, as a :class:`numpy.datetime64` array (in UTC where states are
+        timezone aware)"""
+        return self._timestamps[:self._size]
+
+    @property
+    def state_vectors(self):
+        """State vectors of states, as :class:`~.StateVectors` view of shape (ndim, n)"""
+        if self._state_vectors is None:
+            return None
+        return self._state_vectors[:self._size].T.view(StateVectors)
+
+    @property
+    def covars(self):
+        """Covariances of states, as a view of shape (n, ndim, ndim), or `None` if states
+        have no covariance"""
+        if self._covars is None:
+            return None
+        return self._covars[:self._size]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_cache']  # Cache can't be pickled, and states can be recreated
+        state['_rows'] = list(self._rows)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache = weakref.WeakValueDictionary()
+
+
+class ColumnarTrack(Track):
+    """Columnar Track type
+
+    A :class:`~.Track` where states are stored in :class:`~.ColumnarStates`, which keeps
+    timestamps, state vectors and covariances in preallocated arrays rather than as individual
+    objects. This reduces memory use and garbage collection overhead for long tracks, whilst
+    remaining compatible with code expecting a :class:`~.Track`. The raw arrays are available via
+    :attr:`timestamps`, :attr:`state_vectors` and :attr:`covars`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not isinstance(self.states, ColumnarStates):
+            self.states = ColumnarStates(self.states)
+
+    @property
+    def timestamps(self):
+        """Timestamps of states as :class:`numpy.datetime64` array.
+        See :attr:`ColumnarStates.timestamps`"""
+        return self.states.timestamps
+
+    @property
+    def state_vectors(self):
+        """State vectors of states. See :attr:`ColumnarStates.state_vectors`"""
+        return self.states.state_vectors
+
+    @property
+    def covars(self):
+        """Covariances of states. See :attr:`ColumnarStates.covars`"""
+        return self.states.covars
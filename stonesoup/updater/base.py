@@ -85,3 +85,22 @@ class Updater(Base):
             The state posterior
         """
         raise NotImplementedError
+
+    def update_many(self, hypotheses, **kwargs):
+        """Update a number of states using their predictions and measurements.
+
+        The default implementation simply calls :meth:`update` for each hypothesis in turn.
+        Updaters which can make use of stacked arrays should override this.
+
+        Parameters
+        ----------
+        hypotheses : sequence of :class:`~.Hypothesis`
+            Hypotheses with predicted state and associated detection used for
+            updating.
+
+        Returns
+        -------
+        : list of :class:`~.State`
+            The state posteriors, in the same order as `hypotheses`
+        """
+        return [self.update(hypothesis, **kwargs) for hypothesis in hypotheses]
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
+import copy
 import warnings
+from collections import defaultdict
+from functools import lru_cache
+
 import numpy as np
 import scipy.linalg as la
-from functools import lru_cache
 
 from ..base import Property
 from .base import Updater
-from ..types.array import CovarianceMatrix
+from ..types.array import CovarianceMatrix, StateVectors
 from ..types.prediction import MeasurementPrediction
 from ..types.update import Update
 from ..models.base import LinearModel
@@ -257,6 +260,139 @@ class KalmanUpdater(Updater):
             posterior_mean, posterior_covariance,
             timestamp=hypothesis.measurement.timestamp, hypothesis=hypothesis)
 
+    def _predict_measurements_stacked(self, hypotheses, **kwargs):
+        """Private function to calculate and attach measurement predictions to a number of
+        hypotheses at once.
+
+        Hypotheses are grouped by measurement model, and for each group the measurement function
+        is evaluated once on the stacked predicted state vectors, with the cross and innovation
+        covariances calculated with stacked matrix operations. Subclasses which modify
+        :meth:`predict_measurement` calculate each measurement prediction in turn.
+
+        Parameters
+        ----------
+        hypotheses : list of :class:`~.SingleHypothesis`
+            Hypotheses without a measurement prediction
+        **kwargs : various
+            These are passed to :meth:`~.MeasurementModel.function` and
+            :meth:`~.MeasurementModel.matrix`
+        """
+        groups = defaultdict(list)
+        for hypothesis in hypotheses:
+            measurement_model = self._check_measurement_model(
+                hypothesis.measurement.measurement_model)
+            groups[measurement_model, hypothesis.prediction.ndim].append(hypothesis)
+
+        for (measurement_model, _), group in groups.items():
+            if type(self).predict_measurement is not KalmanUpdater.predict_measurement:
+                for hypothesis in group:
+                    hypothesis.measurement_prediction = self.predict_measurement(
+                        hypothesis.prediction, measurement_model=measurement_model, **kwargs)
+                continue
+
+            predicted_states = [hypothesis.prediction for hypothesis in group]
+
+            batch_state = copy.copy(predicted_states[0])
+            batch_state.state_vector = StateVectors(
+                [state.state_vector for state in predicted_states])
+            pred_meas = measurement_model.function(batch_state, **kwargs)
+
+            if isinstance(measurement_model, LinearModel):
+                hh = np.asarray(self._measurement_matrix(
+                    predicted_state=predicted_states[0], measurement_model=measurement_model,
+                    **kwargs))
+            else:
+                hh = np.array([
+                    self._measurement_matrix(predicted_state=state,
+                                             measurement_model=measurement_model, **kwargs)
+                    for state in predicted_states], dtype=np.float_)
+
+            # The measurement cross covariances and innovation covariances
+            covars = np.array([state.covar for state in predicted_states], dtype=np.float_)
+            meas_cross_covs = covars @ np.swapaxes(hh, -1, -2)
+            innov_covs = hh @ meas_cross_covs + np.asarray(measurement_model.covar())
+
+            for n, (hypothesis, meas_cross_cov, innov_cov) in enumerate(
+                    zip(group, meas_cross_covs, innov_covs)):
+                hypothesis.measurement_prediction = MeasurementPrediction.from_state(
+                    hypothesis.prediction, pred_meas[:, n:n+1], innov_cov,
+                    cross_covar=meas_cross_cov.view(CovarianceMatrix))
+
+    def update_many(self, hypotheses, **kwargs):
+        r"""Batched version of :meth:`update`
+
+        Measurement predictions missing from hypotheses are calculated in batches, and the Kalman
+        gains and posteriors of hypotheses with matching dimensions are then calculated with
+        stacked matrix operations. Subclasses which modify :meth:`update` or
+        :meth:`_posterior_covariance` fall back to updating each hypothesis in turn.
+
+        Parameters
+        ----------
+        hypotheses : sequence of :class:`~.SingleHypothesis`
+            the prediction-measurement association hypotheses. These hypotheses
+            may carry a predicted measurement, or a predicted state. In the
+            latter case a predicted measurement will be calculated.
+        **kwargs : various
+            These are passed to :meth:`predict_measurement`
+
+        Returns
+        -------
+        : list of :class:`~.GaussianStateUpdate`
+            The posterior state Gaussians, in the same order as `hypotheses`
+
+        """
+        if type(self).update is not KalmanUpdater.update \
+                or type(self)._posterior_covariance is not KalmanUpdater._posterior_covariance:
+            return super().update_many(hypotheses, **kwargs)
+
+        self._predict_measurements_stacked(
+            [hypothesis for hypothesis in hypotheses
+             if hypothesis.measurement_prediction is None],
+            **kwargs)
+
+        groups = defaultdict(list)
+        for index, hypothesis in enumerate(hypotheses):
+            groups[hypothesis.prediction.ndim,
+                   hypothesis.measurement_prediction.ndim].append(index)
+
+        updates = [None] * len(hypotheses)
+        for indices in groups.values():
+            group = [hypotheses[index] for index in indices]
+
+            # Kalman gains and posterior covariances
+            innov_covs = np.array(
+                [hypothesis.measurement_prediction.covar for hypothesis in group],
+                dtype=np.float_)
+            cross_covs = np.array(
+                [hypothesis.measurement_prediction.cross_covar for hypothesis in group],
+                dtype=np.float_)
+            kalman_gains = cross_covs @ np.linalg.inv(innov_covs)
+            posterior_covariances = np.array(
+                [hypothesis.prediction.covar for hypothesis in group], dtype=np.float_) \
+                - kalman_gains @ innov_covs @ np.swapaxes(kalman_gains, 1, 2)
+            if self.force_symmetric_covariance:
+                posterior_covariances = \
+                    (posterior_covariances + np.swapaxes(posterior_covariances, 1, 2))/2
+
+            # Posterior means (innovations calculated on vectors to keep any custom types)
+            innovations = \
+                StateVectors([hypothesis.measurement.state_vector for hypothesis in group]) \
+                - StateVectors([hypothesis.measurement_prediction.state_vector
+                                for hypothesis in group])
+            innovations = np.asarray(innovations, dtype=np.float_).T[:, :, np.newaxis]
+            posterior_means = \
+                StateVectors([hypothesis.prediction.state_vector for hypothesis in group]) \
+                + (kalman_gains @ innovations)[:, :, 0].T
+
+            for n, (index, hypothesis, posterior_covariance) in enumerate(
+                    zip(indices, group, posterior_covariances)):
+                updates[index] = Update.from_state(
+                    hypothesis.prediction,
+                    posterior_means[:, n:n+1], posterior_covariance.view(CovarianceMatrix),
+                    timestamp=hypothesis.measurement.timestamp, hypothesis=hypothesis)
+
+        return updates
+
 
 class ExtendedKalmanUpdater(KalmanUpdater):
     r"""The Extended Kalman Filter version of the Kalman Updater. Inherits most
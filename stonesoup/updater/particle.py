@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import copy
+from collections import defaultdict
 from functools import lru_cache
 
 import numpy as np
@@ -8,10 +9,11 @@ from scipy.linalg import inv
 from .base import Updater
 from .kalman import KalmanUpdater, ExtendedKalmanUpdater
 from ..base import Property
-from ..functions import cholesky_eps, sde_euler_maruyama_integration
+from ..functions import cholesky_eps, sde_euler_maruyama_integration, segment_logsumexp
+from ..models.base import GaussianModel
 from ..resampler import Resampler
-from ..types.numeric import Probability
-from ..types.particle import Particle
+from ..types.array import StateVectors
+from ..types.particle import Particles
 from ..types.prediction import (
     Prediction, ParticleMeasurementPrediction, GaussianStatePrediction, MeasurementPrediction)
 from ..types.update import ParticleStateUpdate, Update
@@ -51,13 +53,12 @@ class ParticleUpdater(Updater):
         else:
             measurement_model = hypothesis.measurement.measurement_model
 
-        particles.weight = particles.weight * measurement_model.pdf(
+        particles.log_weight = particles.log_weight + measurement_model.logpdf(
             hypothesis.measurement, particles, num_samples=len(particles),
             **kwargs)
 
         # Normalise the weights
-        sum_w = np.array(Probability.sum(particles.weight))
-        particles.weight = particles.weight / sum_w
+        particles.normalise()
 
         # Resample
         if self.resampler is not None:
@@ -68,6 +69,84 @@ class ParticleUpdater(Updater):
             particles=particles, hypothesis=hypothesis,
             timestamp=hypothesis.measurement.timestamp)
 
+    def update_many(self, hypotheses, **kwargs):
+        """Batched version of :meth:`update`
+
+        Hypotheses are grouped by measurement model, and the predicted particles of every
+        hypothesis in a group concatenated (see :meth:`~.Particles.concatenate`), such that the
+        measurement function and log likelihood are evaluated in a single call, and the weights
+        normalised for each hypothesis with a segmented log-sum-exp. The particles are then split
+        back into an update for each hypothesis, and resampled if a :attr:`resampler` is set.
+        Subclasses which modify :meth:`update` fall back to updating each hypothesis in turn.
+
+        Parameters
+        ----------
+        hypotheses : sequence of :class:`~.Hypothesis`
+            Hypotheses with predicted state and associated detection used for
+            updating.
+
+        Returns
+        -------
+        : list of :class:`~.ParticleState`
+            The state posteriors, in the same order as `hypotheses`
+        """
+        if type(self).update is not ParticleUpdater.update:
+            return super().update_many(hypotheses, **kwargs)
+
+        groups = defaultdict(list)
+        updates = [None] * len(hypotheses)
+        for index, hypothesis in enumerate(hypotheses):
+            if len(hypothesis.prediction.particles):
+                measurement_model = self._check_measurement_model(
+                    hypothesis.measurement.measurement_model)
+                groups[measurement_model].append(index)
+            else:
+                updates[index] = self.update(hypothesis, **kwargs)
+
+        for measurement_model, indices in groups.items():
+            group = [hypotheses[index] for index in indices]
+            particles = Particles.concatenate(
+                [hypothesis.prediction.particles for hypothesis in group])
+            counts = [len(hypothesis.prediction.particles) for hypothesis in group]
+            offsets = np.cumsum([0] + counts)
+
+            if isinstance(measurement_model, GaussianModel) \
+                    and type(measurement_model).pdf is GaussianModel.pdf \
+                    and type(measurement_model).logpdf is GaussianModel.logpdf:
+                # Measurement of each hypothesis repeated for each of its particles, such that
+                # log likelihood evaluated in single call
+                measurements = copy.copy(group[0].measurement)
+                measurements.state_vector = StateVectors(np.repeat(
+                    StateVectors([hypothesis.measurement.state_vector for hypothesis in group]),
+                    counts, axis=1))
+                log_likelihood = measurement_model.logpdf(
+                    measurements, particles, num_samples=len(particles), **kwargs)
+            else:
+                log_likelihood = np.concatenate([
+                    np.atleast_1d(measurement_model.logpdf(
+                        hypothesis.measurement, hypothesis.prediction.particles,
+                        num_samples=len(hypothesis.prediction.particles), **kwargs))
+                    for hypothesis in group])
+
+            # Normalise the weights of each hypothesis' particles
+            log_weight = particles.log_weight + log_likelihood
+            log_weight -= np.repeat(segment_logsumexp(log_weight, offsets), counts)
+
+            for index, hypothesis, start, end in zip(indices, group, offsets[:-1], offsets[1:]):
+                new_particles = copy.copy(hypothesis.prediction.particles)
+                new_particles.log_weight = log_weight[start:end]
+
+                # Resample
+                if self.resampler is not None:
+                    new_particles = self.resampler.resample(new_particles)
+
+                updates[index] = Update.from_state(
+                    hypothesis.prediction,
+                    particles=new_particles, hypothesis=hypothesis,
+                    timestamp=hypothesis.measurement.timestamp)
+
+        return updates
+
     @lru_cache()
     def predict_measurement(self, state_prediction, measurement_model=None,
                             **kwargs):
@@ -75,13 +154,11 @@ class ParticleUpdater(Updater):
         if measurement_model is None:
             measurement_model = self.measurement_model
 
-        new_particles = []
-        for particle in state_prediction.particles:
-            new_state_vector = measurement_model.function(particle, **kwargs)
-            new_particles.append(
-                Particle(new_state_vector,
-                         weight=particle.weight,
-                         parent=particle.parent))
+        particles = state_prediction.particles
+        new_particles = Particles(
+            state_vector=measurement_model.function(particles, **kwargs),
+            log_weight=particles.log_weight,
+            parent=particles.parent)
 
         return MeasurementPrediction.from_state(
             state_prediction, particles=new_particles, timestamp=state_prediction.timestamp)
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 from abc import abstractmethod
 
+import numpy as np
 from scipy.stats import multivariate_normal
 
 from ..base import Base, Property
 from .kalman import KalmanUpdater
+from ..types.array import CovarianceMatrix, StateVectors
 from ..types.update import GaussianMixtureUpdate
 from ..types.state import TaggedWeightedGaussianState
 from ..types.numeric import Probability
@@ -55,39 +57,18 @@ class PointProcessUpdater(Base):
         """
         updated_components = list()
         weight_sum_list = list()
+        if self._batched_update_supported():
+            measurements_components = self._update_components_batched(hypotheses[:-1])
+        else:
+            measurements_components = [
+                self._update_components(multi_hypothesis)
+                for multi_hypothesis in hypotheses[:-1]]
         # Loop over all measurements
-        for multi_hypothesis in hypotheses[:-1]:
-            updated_measurement_components = list()
+        for updated_measurement_components in measurements_components:
             # Initialise weight sum for measurement to clutter intensity
             weight_sum = 0
-            # For every valid single hypothesis, update that component with
-            # measurements and calculate new weight
-            for hypothesis in multi_hypothesis:
-                measurement_prediction = \
-                    self.updater.predict_measurement(
-                            hypothesis.prediction, hypothesis.measurement.measurement_model)
-                measurement = hypothesis.measurement
-                prediction = hypothesis.prediction
-                # Calculate new weight and add to weight sum
-                q = multivariate_normal.pdf(
-                    measurement.state_vector.flatten(),
-                    mean=measurement_prediction.mean.flatten(),
-                    cov=measurement_prediction.covar
-                )
-                new_weight = self.prob_detection\
-                    * prediction.weight * q * self.prob_survival
-                weight_sum += new_weight
-                # Perform single target Kalman Update
-                temp_updated_component = self.updater.update(hypothesis)
-                updated_component = TaggedWeightedGaussianState(
-                    tag=prediction.tag if prediction.tag != "birth" else None,
-                    weight=new_weight,
-                    state_vector=temp_updated_component.mean,
-                    covar=temp_updated_component.covar,
-                    timestamp=temp_updated_component.timestamp
-                )
-                # Add updated component to mixture
-                updated_measurement_components.append(updated_component)
+            for component in updated_measurement_components:
+                weight_sum += component.weight
             weight_sum_list.append(weight_sum)
             for component in updated_measurement_components:
                 if self.normalisation:
@@ -114,6 +95,110 @@ class PointProcessUpdater(Base):
         return GaussianMixtureUpdate(hypothesis=hypotheses,
                                      components=updated_components)
 
+    def _update_components(self, multi_hypothesis):
+        """Update components with a single measurement, with a Kalman update of each in turn
+
+        Returns
+        -------
+        list of :class:`~.TaggedWeightedGaussianState`
+            Updated components, with unnormalised weights
+        """
+        updated_measurement_components = list()
+        # For every valid single hypothesis, update that component with
+        # measurements and calculate new weight
+        for hypothesis in multi_hypothesis:
+            measurement_prediction = \
+                self.updater.predict_measurement(
+                        hypothesis.prediction, hypothesis.measurement.measurement_model)
+            measurement = hypothesis.measurement
+            prediction = hypothesis.prediction
+            # Calculate new weight
+            q = multivariate_normal.pdf(
+                measurement.state_vector.flatten(),
+                mean=measurement_prediction.mean.flatten(),
+                cov=measurement_prediction.covar
+            )
+            new_weight = self.prob_detection\
+                * prediction.weight * q * self.prob_survival
+            # Perform single target Kalman Update
+            temp_updated_component = self.updater.update(hypothesis)
+            updated_component = TaggedWeightedGaussianState(
+                tag=prediction.tag if prediction.tag != "birth" else None,
+                weight=new_weight,
+                state_vector=temp_updated_component.mean,
+                covar=temp_updated_component.covar,
+                timestamp=temp_updated_component.timestamp
+            )
+            # Add updated component to mixture
+            updated_measurement_components.append(updated_component)
+        return updated_measurement_components
+
+    def _batched_update_supported(self):
+        # Batched update replicates the standard Kalman update
+        updater_type = type(self.updater)
+        return isinstance(self.updater, KalmanUpdater) \
+            and updater_type.update is KalmanUpdater.update \
+            and updater_type._posterior_covariance is KalmanUpdater._posterior_covariance
+
+    def _update_components_batched(self, detection_hypotheses):
+        """Update components with all measurements, with the measurement prediction, Kalman gain
+        and posterior covariance calculated once per component, and the likelihoods and posterior
+        means calculated for all measurements of that component together.
+
+        Returns
+        -------
+        list of list of :class:`~.TaggedWeightedGaussianState`
+            Updated components, with unnormalised weights, for each measurement
+        """
+        # Group hypotheses of the same component prediction (on identity, as shared between
+        # detections by GaussianMixtureHypothesiser) and measurement model. Hypotheses are held
+        # by the caller, so prediction ids aren't reused.
+        groups = dict()
+        for measurement_index, multi_hypothesis in enumerate(detection_hypotheses):
+            for component_index, hypothesis in enumerate(multi_hypothesis):
+                key = (id(hypothesis.prediction), hypothesis.measurement.measurement_model)
+                groups.setdefault(key, []).append(
+                    (measurement_index, component_index, hypothesis))
+
+        measurements_components = [
+            [None] * len(multi_hypothesis) for multi_hypothesis in detection_hypotheses]
+        for group in groups.values():
+            prediction = group[0][2].prediction
+            measurement_prediction = self.updater.predict_measurement(
+                prediction, group[0][2].measurement.measurement_model)
+            innovation_covar = measurement_prediction.covar
+
+            # Kalman gain and posterior covariance, shared by all measurements
+            kalman_gain = measurement_prediction.cross_covar @ np.linalg.inv(innovation_covar)
+            posterior_covar = prediction.covar - kalman_gain @ innovation_covar @ kalman_gain.T
+            if self.updater.force_symmetric_covariance:
+                posterior_covar = (posterior_covar + posterior_covar.T)/2
+            posterior_covar = posterior_covar.view(CovarianceMatrix)
+
+            measurements = StateVectors(
+                [hypothesis.measurement.state_vector for _, _, hypothesis in group])
+            likelihoods = np.atleast_1d(multivariate_normal.pdf(
+                np.asarray(measurements, dtype=np.float_).T,
+                mean=np.asarray(measurement_prediction.mean, dtype=np.float_).ravel(),
+                cov=innovation_covar))
+            # Innovations calculated on vectors to keep any custom types
+            innovations = np.asarray(
+                measurements - measurement_prediction.state_vector, dtype=np.float_)
+            posterior_means = StateVectors(prediction.state_vector + kalman_gain @ innovations)
+
+            for n, ((measurement_index, component_index, hypothesis), likelihood) \
+                    in enumerate(zip(group, likelihoods)):
+                tag = hypothesis.prediction.tag
+                measurements_components[measurement_index][component_index] = \
+                    TaggedWeightedGaussianState(
+                        tag=tag if tag != "birth" else None,
+                        weight=self.prob_detection
+                        * hypothesis.prediction.weight * likelihood * self.prob_survival,
+                        state_vector=posterior_means[:, n:n+1],
+                        covar=posterior_covar.copy(),
+                        timestamp=hypothesis.measurement.timestamp)
+        return measurements_components
+
     @abstractmethod
     def _calculate_update_terms(self, updated_sum_list, hypotheses):
         raise NotImplementedError
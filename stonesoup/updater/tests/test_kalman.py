@@ -4,6 +4,7 @@ import pytest
 import numpy as np
 
 from stonesoup.models.measurement.linear import LinearGaussian
+from stonesoup.models.measurement.nonlinear import CartesianToBearingRange
 from stonesoup.types.detection import Detection
 from stonesoup.types.hypothesis import SingleHypothesis
 from stonesoup.types.prediction import (
@@ -123,6 +124,56 @@ def test_kalman(UpdaterClass, measurement_model, prediction, measurement):
     assert(posterior.timestamp == prediction.timestamp)
 
 
+@pytest.mark.parametrize(
+    "UpdaterClass, measurement_model",
+    [
+        (KalmanUpdater, LinearGaussian(
+            ndim_state=4, mapping=[0, 2], noise_covar=np.diag([0.04, 0.09]))),
+        (ExtendedKalmanUpdater, CartesianToBearingRange(
+            ndim_state=4, mapping=[0, 2], noise_covar=np.diag([np.radians(1), 0.5]))),
+        (UnscentedKalmanUpdater, CartesianToBearingRange(
+            ndim_state=4, mapping=[0, 2], noise_covar=np.diag([np.radians(1), 0.5]))),
+        (IteratedKalmanUpdater, CartesianToBearingRange(
+            ndim_state=4, mapping=[0, 2], noise_covar=np.diag([np.radians(1), 0.5]))),
+    ],
+    ids=["standard", "extended", "unscented", "iterated"]
+)
+def test_update_many(UpdaterClass, measurement_model):
+    updater = UpdaterClass(measurement_model=measurement_model)
+
+    hypotheses = []
+    eval_hypotheses = []
+    for n in range(1, 6):
+        prediction = GaussianStatePrediction(
+            np.array([[n], [1.], [-n], [0.5]]), np.diag([1., 0.1, 1.2, 0.2]) * n)
+        measurement = Detection(
+            measurement_model.function(prediction, noise=True),
+            measurement_model=measurement_model)
+        hypotheses.append(SingleHypothesis(prediction, measurement))
+        eval_hypotheses.append(SingleHypothesis(prediction, measurement))
+    # Hypothesis with existing measurement prediction
+    hypotheses[0].measurement_prediction = updater.predict_measurement(
+        hypotheses[0].prediction, measurement_model)
+
+    posteriors = updater.update_many(hypotheses)
+
+    assert len(posteriors) == len(hypotheses)
+    for hypothesis, posterior, eval_hypothesis in zip(
+            hypotheses, posteriors, eval_hypotheses):
+        eval_posterior = updater.update(eval_hypothesis)
+        assert posterior.hypothesis is hypothesis
+        assert np.allclose(hypothesis.measurement_prediction.state_vector,
+                           eval_hypothesis.measurement_prediction.state_vector)
+        assert np.allclose(hypothesis.measurement_prediction.covar,
+                           eval_hypothesis.measurement_prediction.covar)
+        assert np.allclose(posterior.state_vector, eval_posterior.state_vector)
+        # Iterated updaters converge to a tolerance, so allow for small differences
+        assert np.allclose(posterior.covar, eval_posterior.covar, atol=1e-6)
+        assert posterior.timestamp == eval_posterior.timestamp
+
+    assert updater.update_many([]) == []
+
+
 def test_sqrt_kalman():
     measurement_model = LinearGaussian(ndim_state=2, mapping=[0],
                                        noise_covar=np.array([[0.04]]))
@@ -7,10 +7,13 @@ import numpy as np
 import pytest
 
 from ...models.measurement.linear import LinearGaussian
+from ...models.measurement.nonlinear import CartesianToBearingRange
 from ...resampler.particle import SystematicResampler
+from ...types.array import StateVector
 from ...types.detection import Detection
 from ...types.hypothesis import SingleHypothesis
-from ...types.particle import Particle
+from ...types.particle import Particle, Particles
+from ...types.state import State
 from ...types.prediction import (
     ParticleStatePrediction, ParticleMeasurementPrediction)
 from ...updater.particle import (
@@ -74,3 +77,59 @@ def test_particle(updater):
     assert updated_state.hypothesis.measurement == measurement
     assert np.allclose(updated_state.state_vector, np.array([[20.0], [20.0]]),
                        rtol=2e-2)
+
+
+def test_particle_log_weight():
+    # Likelihoods too small to represent as floats, so must be handled in log space
+    timestamp = datetime.datetime.now()
+    measurement_model = LinearGaussian(
+        ndim_state=2, mapping=[0], noise_covar=np.array([[0.04]]))
+    updater = ParticleUpdater(measurement_model)
+    prediction = ParticleStatePrediction(
+        Particles(np.array([[100, 101, 102], [0, 0, 0]]), log_weight=np.full(3, -np.log(3))),
+        timestamp=timestamp)
+    measurement = Detection([[0.0]], timestamp=timestamp)
+
+    updated_state = updater.update(SingleHypothesis(prediction, measurement))
+
+    log_weight = updated_state.particles.log_weight
+    assert np.all(np.isfinite(log_weight))
+    assert np.isclose(np.logaddexp.reduce(log_weight), 0)
+    assert log_weight[0] > log_weight[1] > log_weight[2]
+    assert np.allclose(updated_state.state_vector, [[100], [0]])
+
+
+@pytest.mark.parametrize('measurement_model', [
+    LinearGaussian(ndim_state=2, mapping=[0], noise_covar=np.array([[0.04]])),
+    CartesianToBearingRange(ndim_state=2, mapping=[0, 1], noise_covar=np.diag([0.01, 0.5]))],
+    ids=['linear', 'bearing_range'])
+def test_particle_update_many(measurement_model):
+    timestamp = datetime.datetime.now()
+    random_state = np.random.RandomState(1)
+    updater = ParticleUpdater(LinearGaussian(
+        ndim_state=2, mapping=[0], noise_covar=np.array([[0.1]])))
+    hypotheses = []
+    for num_particles in (10, 25, 1, 40):
+        prediction = ParticleStatePrediction(
+            Particles(random_state.uniform(1, 10, (2, num_particles)),
+                      log_weight=np.full(num_particles, -np.log(num_particles))),
+            timestamp=timestamp)
+        # One detection using updater's measurement model
+        detection_model = measurement_model if num_particles != 1 else None
+        detection = Detection(
+            detection_model.function(State([[5], [5]])) if detection_model
+            else StateVector([[5]]),
+            timestamp=timestamp, measurement_model=detection_model)
+        hypotheses.append(SingleHypothesis(prediction, detection))
+
+    updates = updater.update_many(hypotheses)
+
+    assert len(updates) == len(hypotheses)
+    for hypothesis, update in zip(hypotheses, updates):
+        expected_update = updater.update(hypothesis)
+        assert update.hypothesis is hypothesis
+        assert update.timestamp == timestamp
+        assert np.array_equal(update.particles.state_vector,
+                              expected_update.particles.state_vector)
+        assert np.allclose(update.particles.log_weight, expected_update.particles.log_weight)
+        assert np.isclose(np.logaddexp.reduce(update.particles.log_weight), 0)
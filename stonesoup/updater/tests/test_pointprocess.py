@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 """Test for updater.gaussianmixture module"""
+import copy
+import datetime
+
 import pytest
 import numpy as np
 from scipy.stats import multivariate_normal
 
 
+from stonesoup.models.measurement.linear import LinearGaussian
+from stonesoup.types.angle import Bearing
+from stonesoup.types.array import StateVector
+from stonesoup.types.detection import Detection
 from stonesoup.types.hypothesis import SingleHypothesis
 from stonesoup.types.multihypothesis import MultipleHypothesis
-from stonesoup.types.prediction import GaussianMeasurementPrediction
-from stonesoup.types.state import GaussianState
+from stonesoup.types.prediction import (
+    GaussianMeasurementPrediction, TaggedWeightedGaussianStatePrediction)
+from stonesoup.types.state import GaussianState, TaggedWeightedGaussianState
 from stonesoup.updater.kalman import (
     KalmanUpdater, ExtendedKalmanUpdater, UnscentedKalmanUpdater)
 from stonesoup.updater.pointprocess import PHDUpdater, LCCUpdater
@@ -175,3 +183,131 @@ def test_lcc_single_component_update(UpdaterClass, measurement_model,
     l1 = 1
     assert(miss_detected_component.weight ==
            prediction.weight*(1-prob_detection)*l1)
+
+
+class _SequentialKalmanUpdater(KalmanUpdater):
+    """Overrides update, such that each component is updated in turn"""
+    def update(self, hypothesis, **kwargs):
+        return super().update(hypothesis, **kwargs)
+
+
+@pytest.mark.parametrize("PointProcessUpdaterClass", [PHDUpdater, LCCUpdater])
+def test_batched_update(PointProcessUpdaterClass, measurement_model):
+    timestamp = datetime.datetime.now()
+    components = [
+        TaggedWeightedGaussianStatePrediction(
+            np.array([[mean], [1]]), np.diag([1.5, 0.5]) * (i + 1), weight=0.1*(i + 1),
+            tag=i, timestamp=timestamp)
+        for i, mean in enumerate([-5, 0, 0.5, 10])]
+    components.append(TaggedWeightedGaussianStatePrediction(
+        np.array([[2], [1]]), np.eye(2), weight=0.2, tag="birth", timestamp=timestamp))
+    measurements = [Detection(np.array([[value]]), timestamp, measurement_model=measurement_model)
+                    for value in [-4.5, 0.2, 1, 9]]
+
+    def hypotheses():
+        # New prediction for each component, shared between detections, as by
+        # GaussianMixtureHypothesiser
+        predictions = [copy.copy(component) for component in components]
+        return [MultipleHypothesis([
+                    SingleHypothesis(prediction=prediction, measurement=measurement)
+                    for prediction in predictions])
+                for measurement in measurements] \
+            + [MultipleHypothesis([SingleHypothesis(prediction=component, measurement=None)
+                                   for component in components])]
+
+    updater = PointProcessUpdaterClass(
+        updater=KalmanUpdater(measurement_model), prob_detection=0.9)
+    sequential_updater = PointProcessUpdaterClass(
+        updater=_SequentialKalmanUpdater(measurement_model), prob_detection=0.9)
+    assert updater._batched_update_supported()
+    assert not sequential_updater._batched_update_supported()
+
+    updated_mixture = updater.update(hypotheses())
+    expected_mixture = sequential_updater.update(hypotheses())
+    # Updated components don't share covariances
+    assert len({id(component.covar) for component in updated_mixture}) == len(updated_mixture)
+
+    assert len(updated_mixture) == len(expected_mixture) == 4*5 + 4
+    for component, expected_component in zip(updated_mixture, expected_mixture):
+        assert isinstance(component, TaggedWeightedGaussianState)
+        if isinstance(expected_component.tag, int):  # Birth components get new tags
+            assert component.tag == expected_component.tag
+        assert component.timestamp == expected_component.timestamp
+        assert np.isclose(float(component.weight), float(expected_component.weight))
+        assert np.allclose(component.state_vector, expected_component.state_vector)
+        assert np.allclose(component.covar, expected_component.covar)
+    if PointProcessUpdaterClass is LCCUpdater:
+        assert np.isclose(float(updater.second_order_cumulant),
+                          float(sequential_updater.second_order_cumulant))
+
+
+def test_batched_update_equal_components(measurement_model):
+    timestamp = datetime.datetime.now()
+    # Distinct components with equal moments, e.g. coincident before merging
+    components = [
+        TaggedWeightedGaussianStatePrediction(
+            np.array([[0], [1]]), np.diag([1.5, 0.5]), weight=0.5, tag=tag, timestamp=timestamp)
+        for tag in ("a", "b")]
+    measurement = Detection(np.array([[0.5]]), timestamp, measurement_model=measurement_model)
+    hypotheses = [
+        MultipleHypothesis([
+            SingleHypothesis(prediction=component, measurement=measurement)
+            for component in components]),
+        MultipleHypothesis([
+            SingleHypothesis(prediction=component, measurement=None)
+            for component in components])]
+
+    updater = PHDUpdater(updater=KalmanUpdater(measurement_model), prob_detection=0.9)
+    assert updater._batched_update_supported()
+    updated_mixture = updater.update(hypotheses)
+
+    assert len(updated_mixture) == 4
+    assert [component.tag for component in updated_mixture] == ["a", "b", "a", "b"]
+    assert np.allclose(updated_mixture[0].state_vector, updated_mixture[1].state_vector)
+
+
+class _CountingKalmanUpdater(KalmanUpdater):
+    """Counts measurement predictions"""
+    count = 0
+
+    def predict_measurement(self, *args, **kwargs):
+        self.count += 1
+        return super().predict_measurement(*args, **kwargs)
+
+
+def test_batched_update_object_dtype():
+    timestamp = datetime.datetime.now()
+    measurement_model = LinearGaussian(ndim_state=2, mapping=[0], noise_covar=np.array([[0.1]]))
+    # State vectors with custom (object dtype) elements, shared between detections
+    predictions = [
+        TaggedWeightedGaussianStatePrediction(
+            StateVector([Bearing(0.1 * i), 1.]), np.diag([0.2, 0.5]), weight=0.5, tag=i,
+            timestamp=timestamp)
+        for i in range(2)]
+    measurements = [Detection(np.array([[value]]), timestamp, measurement_model=measurement_model)
+                    for value in [0.05, 0.1, 0.15]]
+    hypotheses = [
+        MultipleHypothesis([
+            SingleHypothesis(prediction=prediction, measurement=measurement)
+            for prediction in predictions])
+        for measurement in measurements] \
+        + [MultipleHypothesis([SingleHypothesis(prediction=prediction, measurement=None)
+                               for prediction in predictions])]
+
+    kalman_updater = _CountingKalmanUpdater(measurement_model)
+    updater = PHDUpdater(updater=kalman_updater, prob_detection=0.9)
+    assert updater._batched_update_supported()
+    updated_mixture = updater.update(hypotheses)
+    expected_mixture = PHDUpdater(
+        updater=_SequentialKalmanUpdater(measurement_model), prob_detection=0.9
+    ).update(hypotheses)
+
+    # One measurement prediction per component, with all detections updated together
+    assert kalman_updater.count == len(predictions)
+    assert len(updated_mixture) == len(expected_mixture) == 3*2 + 2
+    for component, expected_component in zip(updated_mixture, expected_mixture):
+        assert component.tag == expected_component.tag
+        assert np.isclose(float(component.weight), float(expected_component.weight))
+        assert np.allclose(np.asarray(component.state_vector, dtype=np.float64),
+                           np.asarray(expected_component.state_vector, dtype=np.float64))
+        assert np.allclose(component.covar, expected_component.covar)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import json
+from pathlib import Path
+
+import numpy as np
+
+from ..base import Property
+from ..reader import DetectionReader, GroundTruthReader
+from ..reader.binary import (
+    BINARY_FORMAT_VERSION, META_FILENAME, INDEX_DTYPE, record_dtype)
+from ..tracker import Tracker
+from .base import Writer
+
+
+class BinaryWriter(Writer):
+    """Binary Writer
+
+    Writes tracks, detections and/or ground truth paths to a compact, append only, binary
+    recording, which can be read with :class:`~.BinaryReader` and its subclasses (see
+    :mod:`stonesoup.reader.binary` for details of the format). Unlike :class:`~.YAMLWriter`,
+    only states which are new since the previous time step are written for each track and
+    ground truth path, which are referenced by ID.
+
+    Only state vectors, covariances (where all states of the first time step with data have
+    one), timestamps and metadata (as JSON, with other types converted to strings) are recorded.
+    All states of each kind must have the same number of dimensions. As the recording is append
+    only, states removed from or replaced in a track after being written are not reflected.
+    """
+    path: Path = Property(doc="Directory to save data to, which is created if it doesn't exist. "
+                              "Str will be converted to Path")
+    groundtruth_source: GroundTruthReader = Property(default=None)
+    detections_source: DetectionReader = Property(default=None)
+    tracks_source: Tracker = Property(default=None)
+
+    def __init__(self, path, *args, **kwargs):
+        if not isinstance(path, Path):
+            path = Path(path)  # Ensure Path
+        super().__init__(path, *args, **kwargs)
+        if not any((self.groundtruth_source, self.detections_source, self.tracks_source)):
+            raise ValueError("At least one source required")
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        if (self.path / META_FILENAME).exists():
+            raise ValueError(f"Recording already exists at {self.path}")
+        self._meta = {'version': BINARY_FORMAT_VERSION, 'kinds': {}}
+        self._write_meta()
+
+        self._files = {}
+        self._dtypes = {}
+        self._num_records = {}
+        self._ids = {}
+        self._num_written = {}
+        for kind, source in (('tracks', self.tracks_source),
+                             ('detections', self.detections_source),
+                             ('groundtruth_paths', self.groundtruth_source)):
+            if source is None:
+                continue
+            self._files[kind] = {
+                extension: (self.path / f'{kind}.{extension}').open('ab')
+                for extension in ('records', 'index', 'ids', 'metadata')}
+            self._num_records[kind] = 0
+            self._ids[kind] = {}
+            self._num_written[kind] = {}
+
+    def _write_meta(self):
+        with (self.path / META_FILENAME).open('w') as meta_file:
+            json.dump(self._meta, meta_file)
+
+    def _dtype(self, kind, states):
+        if kind not in self._dtypes:
+            ndim = len(states[0].state_vector)
+            covar = all(getattr(state, 'covar', None) is not None for state in states)
+            self._dtypes[kind] = record_dtype(ndim, covar)
+            self._meta['kinds'][kind] = {'ndim': ndim, 'covar': covar}
+            self._write_meta()
+        return self._dtypes[kind]
+
+    def _id_index(self, kind, id_):
+        ids = self._ids[kind]
+        if id_ not in ids:
+            ids[id_] = len(ids)
+            self._files[kind]['ids'].write(f"{json.dumps(id_, default=str)}\n".encode())
+        return ids[id_]
+
+    def _write_states(self, kind, time, states, id_indexes):
+        if states:
+            dtype = self._dtype(kind, states)
+            ndim = dtype['state_vector'].shape[0]
+            records = np.zeros(len(states), dtype=dtype)
+            try:
+                records['state_vector'] = np.hstack(
+                    [state.state_vector for state in states]).astype(np.float64).T
+            except ValueError as error:
+                raise ValueError(
+                    f"All {kind} states must have {ndim} dimensions") from error
+            if 'covar' in dtype.names:
+                records['covar'] = np.nan
+                for index, state in enumerate(states):
+                    if getattr(state, 'covar', None) is not None:
+                        records['covar'][index] = state.covar
+            records['time'] = [state.timestamp for state in states]
+            records['id'] = id_indexes
+
+            metadata_file = self._files[kind]['metadata']
+            offset = metadata_file.tell()
+            for index, state in enumerate(states):
+                metadata = getattr(state, 'metadata', None)
+                if metadata:
+                    data = json.dumps(metadata, default=str).encode()
+                    metadata_file.write(data)
+                    records['metadata_offset'][index] = offset
+                    records['metadata_length'][index] = len(data)
+                    offset += len(data)
+            self._files[kind]['records'].write(records.tobytes())
+
+        start = self._num_records[kind]
+        self._num_records[kind] += len(states)
+        self._files[kind]['index'].write(
+            np.array((time, start, self._num_records[kind]), dtype=INDEX_DTYPE).tobytes())
+
+    def _write_paths(self, kind, time, paths):
+        num_written = self._num_written[kind]
+        states, id_indexes = [], []
+        for path in paths:
+            id_index = self._id_index(kind, path.id)
+            new_states = path.states[num_written.get(path.id, 0):]
+            num_written[path.id] = len(path.states)
+            states.extend(new_states)
+            id_indexes.extend([id_index] * len(new_states))
+        self._write_states(kind, time, states, id_indexes)
+
+    def write(self):
+        if self.tracks_source:
+            gen = self.tracks_source
+        elif self.detections_source:
+            gen = self.detections_source
+        elif self.groundtruth_source:
+            gen = self.groundtruth_source
+        else:  # pragma: no cover
+            raise RuntimeError("At least one source required")
+
+        for time, _ in gen:
+            if self.tracks_source:
+                self._write_paths('tracks', time, self.tracks_source.tracks)
+            if self.detections_source:
+                detections = list(self.detections_source.detections)
+                self._write_states('detections', time, detections, [-1] * len(detections))
+            if self.groundtruth_source:
+                self._write_paths(
+                    'groundtruth_paths', time, self.groundtruth_source.groundtruth_paths)
+            self.flush()
+
+    def flush(self):
+        """Flush data written to files"""
+        for files in self._files.values():
+            # Index last, such that records are available for all time steps in index
+            for extension in ('ids', 'metadata', 'records', 'index'):
+                files[extension].flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        for files in getattr(self, '_files', {}).values():
+            for file in files.values():
+                file.close()
+        self._files = {}
+
+    def __del__(self):
+        self.__exit__()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import numpy as np
+import pytest
+
+from ..binary import BinaryWriter
+from ...buffered_generator import BufferedGenerator
+from ...reader import DetectionReader
+from ...reader.binary import (
+    BinaryReader, BinaryDetectionReader, BinaryGroundTruthReader, BinaryTrackReader)
+from ...tracker import Tracker
+from ...types.detection import GaussianDetection
+from ...types.state import GaussianState
+from ...types.track import Track
+
+
+def test_binary_detections(detection_reader, tmpdir):
+    path = tmpdir.join("detections")
+    with BinaryWriter(path.strpath, detections_source=detection_reader) as writer:
+        writer.write()
+
+    expected = [(time, sorted(detection.state_vector[0, 0] for detection in detections))
+                for time, detections in detection_reader.detections_gen()]
+    reader = BinaryDetectionReader(path.strpath)
+    detections = [(time, sorted(detection.state_vector[0, 0] for detection in detections))
+                  for time, detections in reader]
+    assert detections == expected
+
+    for _, detections in reader:
+        for detection in detections:
+            assert detection.timestamp == reader.current[0]
+            assert detection.metadata == {}
+
+    with pytest.raises(ValueError, match="Recording already exists"):
+        BinaryWriter(path.strpath, detections_source=detection_reader)
+
+
+def test_binary_groundtruth(groundtruth_reader, tmpdir):
+    path = tmpdir.join("groundtruth")
+    with BinaryWriter(path.strpath, groundtruth_source=groundtruth_reader) as writer:
+        writer.write()
+
+    reader = BinaryGroundTruthReader(path.strpath)
+    for (time, paths), (expected_time, expected_paths) in zip(
+            reader, groundtruth_reader.groundtruth_paths_gen()):
+        assert time == expected_time
+        assert {path.id for path in paths} == {path.id for path in expected_paths}
+        expected_paths = {path.id: path for path in expected_paths}
+        for path in paths:
+            expected_path = expected_paths[path.id]
+            assert len(path) == len(expected_path)
+            for state, expected_state in zip(path, expected_path):
+                assert np.array_equal(state.state_vector, expected_state.state_vector)
+                assert state.timestamp == expected_state.timestamp
+
+
+def test_binary_tracks(tracker, tmpdir):
+    path = tmpdir.join("tracks")
+    with BinaryWriter(path.strpath, tracks_source=tracker) as writer:
+        writer.write()
+
+    reader = BinaryTrackReader(path.strpath)
+    times = []
+    for time, tracks in reader:
+        times.append(time)
+        assert tracks == reader.tracks
+    assert times == [datetime.datetime(2018, 1, 1, 14), datetime.datetime(2018, 1, 1, 14, 1)]
+    track, = reader.tracks
+    assert track.id == '0'
+    assert len(track) == 1
+    assert np.array_equal(track.state_vector, [[1]])
+
+
+def test_binary_append_only(tmpdir):
+    """Only new states written, with random access by time range"""
+    start = datetime.datetime(2020, 1, 1)
+    times = [start + datetime.timedelta(seconds=i) for i in range(10)]
+
+    class TestTracker(Tracker):
+        @property
+        def tracks(self):
+            return self._tracks
+
+        def __iter__(self):
+            self._tracks = {Track(id='a'), Track(id='b')}
+            self._iter = iter(times)
+            return self
+
+        def __next__(self):
+            time = next(self._iter)
+            for n, track in enumerate(sorted(self._tracks, key=lambda track: track.id)):
+                if n == 1 and time < times[5]:
+                    continue  # Track 'b' starts half way
+                track.append(GaussianState(
+                    [[n], [time.second]], np.eye(2) * time.second, timestamp=time))
+            return time, self._tracks
+
+    path = tmpdir.join("tracks")
+    with BinaryWriter(path.strpath, tracks_source=TestTracker()) as writer:
+        writer.write()
+
+    recording = BinaryReader(path.strpath)
+    assert recording.kinds() == ['tracks']
+    assert sorted(recording.ids('tracks')) == ['a', 'b']
+    records = recording.records('tracks')
+    assert len(records) == 15  # Each state written once
+    assert len(recording.index('tracks')) == 10
+
+    records = recording.records('tracks', times[4], times[6])
+    assert len(records) == 1 + 2 + 2
+    assert np.array_equal(np.unique(records['time']), np.array(times[4:7], dtype='M8[us]'))
+    states = recording.states('tracks', records)
+    assert all(isinstance(state, GaussianState) for state in states)
+    for state in states:
+        assert np.array_equal(state.covar, np.eye(2) * state.timestamp.second)
+
+    # Replay from time range
+    reader = BinaryTrackReader(path.strpath, start_time=times[7])
+    steps = list(reader)
+    assert [time for time, _ in steps] == times[7:]
+    assert {track.id: len(track) for track in reader.tracks} == {'a': 3, 'b': 3}
+
+
+def test_binary_metadata_and_dimensions(tmpdir):
+    time = datetime.datetime(2020, 1, 1)
+
+    class TestDetectionReader(DetectionReader):
+        @BufferedGenerator.generator_method
+        def detections_gen(self):
+            for n, ndim in enumerate((2, 2, 3)):
+                yield time + datetime.timedelta(seconds=n), {GaussianDetection(
+                    np.arange(ndim)[:, np.newaxis] + n, np.eye(ndim),
+                    timestamp=time + datetime.timedelta(seconds=n),
+                    metadata={'n': n, 'time': time})}
+
+    path = tmpdir.join("detections")
+    with BinaryWriter(path.strpath, detections_source=TestDetectionReader()) as writer:
+        with pytest.raises(ValueError, match="must have 2 dimensions"):
+            writer.write()
+
+    detections = [detection for _, detections in BinaryDetectionReader(path.strpath)
+                  for detection in detections]
+    assert len(detections) == 2
+    for n, detection in enumerate(detections):
+        assert isinstance(detection, GaussianDetection)
+        assert np.array_equal(detection.state_vector, [[n], [n + 1]])
+        assert detection.metadata == {'n': n, 'time': str(time)}
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
+import datetime
+from itertools import zip_longest
 from textwrap import dedent
 
 import pytest
 
 from ..yaml import YAMLWriter
+from ...reader.yaml import YAMLTrackReader
+from ...tracker import Tracker
+from ...types.state import State
+from ...types.track import Track
 
 
 def test_detections_yaml(detection_reader, tmpdir):
@@ -120,3 +126,82 @@ def test_yaml_bad_init(tmpdir):
     filename = tmpdir.join("bad_init.yaml")
     with pytest.raises(ValueError, match="At least one source required"):
         YAMLWriter(filename.strpath)
+
+
+def test_tracks_yaml_delta(tracker, tmpdir):
+    filename = tmpdir.join("tracks.yaml")
+
+    with YAMLWriter(filename.strpath, tracks_source=tracker, delta=True) as writer:
+        writer.write()
+
+    with filename.open('r') as yaml_file:
+        generated_yaml = yaml_file.read()
+
+    expected_yaml = dedent("""\
+        ---
+        time: 2018-01-01 14:00:00
+        tracks: !!set {}
+        deleted_tracks: []
+        ...
+        ---
+        time: &id001 2018-01-01 14:01:00
+        tracks: !!set
+          ? !stonesoup.types.track.Track
+          - states:
+            - !stonesoup.types.state.State
+              - state_vector: !stonesoup.types.array.StateVector
+                - [1]
+              - timestamp: *id001
+          - id: '0'
+          :
+        deleted_tracks: []
+        ...
+        """)
+
+    assert generated_yaml == expected_yaml
+
+
+def test_yaml_delta_round_trip(tmpdir):
+    start = datetime.datetime(2020, 1, 1)
+
+    class TestTracker(Tracker):
+        @property
+        def tracks(self):
+            return self._tracks
+
+        def __iter__(self):
+            self._tracks = set()
+            self._time = start
+            self._all_tracks = [Track(id=str(n)) for n in range(4)]
+            return self
+
+        def __next__(self):
+            n = int((self._time - start).total_seconds())
+            if n >= 8:
+                raise StopIteration
+            for m, track in enumerate(self._all_tracks):
+                if m <= n < m + 4:  # Each track exists for 4 time steps
+                    self._tracks.add(track)
+                    if n != m + 2:  # Missing update
+                        track.append(State([[n], [m]], timestamp=self._time))
+                else:
+                    self._tracks.discard(track)
+            self._time += datetime.timedelta(seconds=1)
+            return self._time, set(self._tracks)
+
+    full_filename = tmpdir.join("full.yaml")
+    delta_filename = tmpdir.join("delta.yaml")
+    with YAMLWriter(full_filename.strpath, tracks_source=TestTracker()) as writer:
+        writer.write()
+    with YAMLWriter(delta_filename.strpath, tracks_source=TestTracker(), delta=True) as writer:
+        writer.write()
+
+    assert delta_filename.size() < full_filename.size()
+    for (time, tracks), (delta_time, delta_tracks) in zip_longest(
+            YAMLTrackReader(full_filename.strpath),
+            YAMLTrackReader(delta_filename.strpath, delta=True)):
+        assert time == delta_time
+        assert {track.id: [state.state_vector.tolist() for state in track]
+                for track in tracks} \
+            == {track.id: [state.state_vector.tolist() for state in track]
+                for track in delta_tracks}
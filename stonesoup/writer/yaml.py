@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import copy
 from pathlib import Path
 
 from ..base import Property
@@ -9,12 +10,29 @@ from .base import Writer
 
 
 class YAMLWriter(Writer):
-    """YAML Writer"""
+    """YAML Writer
+
+    By default, all current tracks and ground truth paths are written, with their full history of
+    states, at every time step. In :attr:`delta` mode, only tracks and paths which are new or have
+    had states appended are written, with only the new states, along with the IDs of any tracks
+    and paths removed since the previous time step (as `deleted_tracks` and
+    `deleted_groundtruth_paths`). Such files can be read with :class:`~.YAMLTrackReader` and
+    :class:`~.YAMLGroundTruthReader` in delta mode.
+    """
     path: Path = Property(doc="File to save data to. Str will be converted to Path")
     groundtruth_source: GroundTruthReader = Property(default=None)
     sensor_data_source: SensorDataReader = Property(default=None)
     detections_source: DetectionReader = Property(default=None)
     tracks_source: Tracker = Property(default=None)
+    delta: bool = Property(
+        default=False,
+        doc="Whether to only write new states of tracks and ground truth paths at each time "
+            "step. As such, states removed from or replaced in a track or path after being "
+            "written are not reflected. Default `False`.")
+    compact_arrays: bool = Property(
+        default=False,
+        doc="Whether to write arrays compactly, as base64 encoded data, rather than sequences of "
+            "values. See :class:`~.serialise.YAML`. Default `False`.")
 
     def __init__(self, path, *args, **kwargs):
         if not isinstance(path, Path):
@@ -26,11 +44,12 @@ class YAMLWriter(Writer):
 
         self._file = self.path.open('w')
 
-        yaml = YAML()
+        yaml = YAML(compact_arrays=self.compact_arrays)
         # Required as will be writing multiple documents to file
         yaml.explicit_start = True
         yaml.explicit_end = True
         self._yaml = yaml
+        self._num_written = {'tracks': {}, 'groundtruth_paths': {}}
 
     def write(self):
         if self.tracks_source:
@@ -47,16 +66,38 @@ class YAMLWriter(Writer):
         for time, _ in gen:
             data = {'time': time}
             if self.tracks_source:
-                data['tracks'] = self.tracks_source.tracks
+                self._add_paths(data, 'tracks', self.tracks_source.tracks)
             if self.detections_source:
                 data['detections'] = self.detections_source.detections
             if self.sensor_data_source:
                 data['sensor_data'] = self.sensor_data_source.sensor_data
             if self.groundtruth_source:
-                data['groundtruth_paths'] = \
-                    self.groundtruth_source.groundtruth_paths
+                self._add_paths(
+                    data, 'groundtruth_paths', self.groundtruth_source.groundtruth_paths)
             self._yaml.dump(data, self._file)
 
+    def _add_paths(self, data, key, paths):
+        if not self.delta:
+            data[key] = paths
+            return
+
+        num_written = self._num_written[key]
+        delta_paths = set()
+        for path in paths:
+            if path.id not in num_written or num_written[path.id] < len(path):
+                delta_path = copy.copy(path)
+                delta_path.states = path.states[num_written.get(path.id, 0):]
+                delta_paths.add(delta_path)
+            num_written[path.id] = len(path)
+
+        ids = {path.id for path in paths}
+        deleted_ids = [id_ for id_ in num_written if id_ not in ids]
+        for id_ in deleted_ids:
+            del num_written[id_]
+
+        data[key] = delta_paths
+        data[f'deleted_{key}'] = deleted_ids
+
     def __enter__(self):
         return self
 